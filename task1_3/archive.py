@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Content-addressed archive of scraped article versions.
+
+Each run snapshots the tracked markdown files: article bodies are stored once
+as zstd-compressed blobs named by their SHA-256, and a small compressed
+manifest per run maps every article to its blob. Unchanged articles cost only
+a manifest line, so the archive grows with the amount of change rather than
+with the number of runs.
+
+Usage:
+    python archive.py list
+    python archive.py diff [RUN_A] [RUN_B] [--content]
+    python archive.py restore RUN TARGET_DIR
+    python archive.py prune --keep 30
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import zstandard
+from config import ScraperUtils
+
+# Separator between the metadata header and the body of a saved article
+HEADER_END = "\n---\n\n"
+
+
+def split_article_file(text: str) -> tuple[dict, str]:
+    """
+    Split a saved markdown file into its header fields and body.
+    Files without the scraper's header are returned as body only.
+    """
+    header_end = text.find(HEADER_END)
+    if not text.startswith("---\n") or header_end == -1:
+        return {}, text
+    fields = {}
+    for line in text[len("---\n") : header_end].splitlines():
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    return fields, text[header_end + len(HEADER_END) :]
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+class SnapshotArchive:
+    """
+    Deduplicated history of the markdown output.
+
+    Layout:
+        blobs/ab/abcdef...zst   article body, named by SHA-256 of its text
+        manifests/<run>.json.zst  article key -> file name, url, date, blob
+        index.json              file path -> (mtime, size, blob, header) of the
+                                last snapshot, so unchanged files are not re-read
+    """
+
+    def __init__(self, root: Path, level: int = 19):
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.manifest_dir = self.root / "manifests"
+        self.index_file = self.root / "index.json"
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    # Blobs
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.zst"
+
+    def _put_blob(self, body: str) -> tuple[str, int]:
+        """
+        Store a body unless an identical one is archived already.
+
+        Returns:
+            tuple: (digest, compressed bytes added; 0 for a deduplicated body)
+        """
+        data = body.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if path.exists():
+            return digest, 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = self._compressor.compress(data)
+        _atomic_write_bytes(path, compressed)
+        return digest, len(compressed)
+
+    def read_blob(self, digest: str) -> str:
+        return (
+            self._decompressor.decompress(self._blob_path(digest).read_bytes())
+        ).decode("utf-8")
+
+    # Manifests
+
+    def runs(self) -> list[str]:
+        """
+        Archived run ids, oldest first.
+        """
+        if not self.manifest_dir.exists():
+            return []
+        return sorted(
+            path.name.removesuffix(".json.zst")
+            for path in self.manifest_dir.glob("*.json.zst")
+        )
+
+    def resolve(self, run: str) -> str:
+        """
+        Map "latest", "previous" or a unique run id prefix to a run id.
+        """
+        runs = self.runs()
+        if run == "latest" and runs:
+            return runs[-1]
+        if run == "previous" and len(runs) > 1:
+            return runs[-2]
+        if run in runs:
+            return run
+        matches = [r for r in runs if r.startswith(run)]
+        if len(matches) != 1:
+            raise ValueError(f"No unique archived run matches {run!r}")
+        return matches[0]
+
+    def load_manifest(self, run: str) -> dict:
+        path = self.manifest_dir / f"{self.resolve(run)}.json.zst"
+        return json.loads(self._decompressor.decompress(path.read_bytes()))
+
+    def _load_index(self) -> dict:
+        if not self.index_file.exists():
+            return {}
+        with open(self.index_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    # Operations
+
+    def snapshot(self, entries, base_url: str = None) -> dict:
+        """
+        Archive the current version of every tracked article file.
+
+        Args:
+            entries: Tracker entries (with "file_path"), keyed by article key
+            base_url: Site the run scraped, recorded in the manifest
+
+        Returns:
+            dict: Run id, article count, new blobs and compressed bytes added
+        """
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        index = self._load_index()
+        new_index = {}
+        articles = {}
+        new_blobs = 0
+        bytes_added = 0
+
+        for key, entry in entries.items():
+            file_path = entry.get("file_path")
+            if not file_path:
+                continue
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+
+            # Files untouched since the last snapshot keep their blob
+            cached = index.get(file_path)
+            if cached and cached[:2] == [stat.st_mtime_ns, stat.st_size]:
+                digest, header = cached[2], cached[3]
+            else:
+                text = Path(file_path).read_text(encoding="utf-8")
+                header, body = split_article_file(text)
+                digest, added = self._put_blob(body)
+                if added:
+                    new_blobs += 1
+                    bytes_added += added
+            new_index[file_path] = [stat.st_mtime_ns, stat.st_size, digest, header]
+            articles[key] = {
+                "file": Path(file_path).name,
+                "url": header.get("url", entry.get("url")),
+                "date_scraped": header.get("date_scraped"),
+                "blob": digest,
+            }
+
+        # Run ids sort chronologically; a second snapshot within the same
+        # second gets a numeric suffix
+        run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        existing = set(self.runs())
+        suffix = 1
+        while (run_id if suffix == 1 else f"{run_id}_{suffix}") in existing:
+            suffix += 1
+        if suffix > 1:
+            run_id = f"{run_id}_{suffix}"
+
+        # Blobs are in place before the manifest referencing them appears
+        manifest = {
+            "run_id": run_id,
+            "created_at": time.time(),
+            "base_url": base_url,
+            "articles": articles,
+        }
+        _atomic_write_bytes(
+            self.manifest_dir / f"{run_id}.json.zst",
+            self._compressor.compress(json.dumps(manifest).encode("utf-8")),
+        )
+        _atomic_write_bytes(self.index_file, json.dumps(new_index).encode("utf-8"))
+
+        return {
+            "run_id": run_id,
+            "articles": len(articles),
+            "new_blobs": new_blobs,
+            "bytes_added": bytes_added,
+        }
+
+    def diff(self, run_a: str, run_b: str) -> dict:
+        """
+        Compare two runs by manifest alone, without reading any blob.
+
+        Returns:
+            dict: Article keys "added", "removed", "changed" (new body) and
+                "renamed" (same body, new file name) from run_a to run_b
+        """
+        old = self.load_manifest(run_a)["articles"]
+        new = self.load_manifest(run_b)["articles"]
+        return {
+            "added": sorted(set(new) - set(old)),
+            "removed": sorted(set(old) - set(new)),
+            "changed": sorted(
+                key
+                for key in new.keys() & old.keys()
+                if new[key]["blob"] != old[key]["blob"]
+            ),
+            "renamed": sorted(
+                key
+                for key in new.keys() & old.keys()
+                if new[key]["blob"] == old[key]["blob"]
+                and new[key]["file"] != old[key]["file"]
+            ),
+        }
+
+    def content_diff(self, run_a: str, run_b: str, key: str) -> str:
+        """
+        Unified diff of one article's body between two runs.
+        """
+        old = self.load_manifest(run_a)["articles"].get(key)
+        new = self.load_manifest(run_b)["articles"].get(key)
+        old_text = self.read_blob(old["blob"]) if old else ""
+        new_text = self.read_blob(new["blob"]) if new else ""
+        return "".join(
+            difflib.unified_diff(
+                old_text.splitlines(keepends=True),
+                new_text.splitlines(keepends=True),
+                fromfile=f"{run_a}/{old['file'] if old else key}",
+                tofile=f"{run_b}/{new['file'] if new else key}",
+            )
+        )
+
+    def restore(self, run: str, target_dir: Path) -> int:
+        """
+        Recreate the markdown files of a run, headers included, in target_dir.
+
+        Returns:
+            int: Number of files restored
+        """
+        manifest = self.load_manifest(run)
+        target_dir = Path(target_dir)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for article in manifest["articles"].values():
+            body = self.read_blob(article["blob"])
+            if article["url"] and article["date_scraped"]:
+                body = (
+                    f"---\nurl: {article['url']}\ndate_scraped: {article['date_scraped']}"
+                    f"{HEADER_END}{body}"
+                )
+            _atomic_write_bytes(target_dir / article["file"], body.encode("utf-8"))
+        return len(manifest["articles"])
+
+    def prune(self, keep: int) -> dict:
+        """
+        Drop all but the newest ``keep`` runs and the blobs only they used.
+        """
+        runs = self.runs()
+        removed_runs = runs[:-keep] if keep > 0 else runs
+        for run in removed_runs:
+            (self.manifest_dir / f"{run}.json.zst").unlink()
+
+        referenced = set()
+        for run in self.runs():
+            referenced.update(
+                article["blob"]
+                for article in self.load_manifest(run)["articles"].values()
+            )
+        removed_blobs = 0
+        for path in self.blob_dir.glob("*/*.zst") if self.blob_dir.exists() else []:
+            if path.name.removesuffix(".zst") not in referenced:
+                path.unlink()
+                removed_blobs += 1
+        # The index may point at blobs that are gone now
+        self.index_file.unlink(missing_ok=True)
+        return {"removed_runs": len(removed_runs), "removed_blobs": removed_blobs}
+
+    def stats(self) -> dict:
+        blobs = list(self.blob_dir.glob("*/*.zst")) if self.blob_dir.exists() else []
+        return {
+            "runs": len(self.runs()),
+            "blobs": len(blobs),
+            "blob_bytes": sum(path.stat().st_size for path in blobs),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Browse the scraped article archive.")
+    parser.add_argument(
+        "--archive-dir",
+        type=Path,
+        default=Path(os.getenv("OUTPUT_DIR", "scrape_output"))
+        / os.getenv("ARCHIVE_DIR", "archive"),
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List archived runs.")
+    diff_parser = commands.add_parser("diff", help="Compare two runs.")
+    diff_parser.add_argument("run_a", nargs="?", default="previous")
+    diff_parser.add_argument("run_b", nargs="?", default="latest")
+    diff_parser.add_argument(
+        "--content", action="store_true", help="Show the changed text as well."
+    )
+    restore_parser = commands.add_parser("restore", help="Restore a run's files.")
+    restore_parser.add_argument("run")
+    restore_parser.add_argument("target_dir", type=Path)
+    prune_parser = commands.add_parser("prune", help="Drop old runs.")
+    prune_parser.add_argument("--keep", type=int, required=True)
+    args = parser.parse_args()
+
+    archive = SnapshotArchive(args.archive_dir)
+    try:
+        if args.command == "list":
+            for run in archive.runs():
+                print(f"{run}  {len(archive.load_manifest(run)['articles'])} articles")
+            print(json.dumps(archive.stats()))
+        elif args.command == "diff":
+            run_a, run_b = archive.resolve(args.run_a), archive.resolve(args.run_b)
+            changes = archive.diff(run_a, run_b)
+            print(f"{run_a} -> {run_b}")
+            for kind, keys in changes.items():
+                print(f"  {kind}: {len(keys)}")
+                for key in keys:
+                    print(f"    {key}")
+            if args.content:
+                for key in changes["added"] + changes["changed"] + changes["removed"]:
+                    print(archive.content_diff(run_a, run_b, key))
+        elif args.command == "restore":
+            restored = archive.restore(args.run, args.target_dir)
+            print(
+                f"{ScraperUtils.format_datetime()} Restored {restored} files of run {archive.resolve(args.run)} to {args.target_dir}"
+            )
+        elif args.command == "prune":
+            print(json.dumps(archive.prune(args.keep)))
+    except (ValueError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Reproducible scraper benchmark against the local fixture help center.
+Runs OptiSignsScraper end-to-end for every combination of article count and
+concurrency and writes a JSON report that can be compared with an earlier one.
+
+Usage:
+    python benchmark.py --articles 50 200 --concurrency 1 4 8
+    python benchmark.py --latency 0.05 --article-size 6000 --rerun
+    python benchmark.py --compare artifacts/benchmark_baseline.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from config import ScraperConfig
+from fixture_site import FixtureSite
+from scraper import OptiSignsScraper
+
+
+async def run_scraper(config: ScraperConfig, quiet: bool) -> dict:
+    """
+    Run one full crawl and return its wall time, throughput and results.
+    """
+    output = io.StringIO() if quiet else sys.stdout
+    with contextlib.redirect_stdout(output):
+        scraper = OptiSignsScraper(config)
+        started = time.perf_counter()
+        await scraper.run()
+        seconds = time.perf_counter() - started
+
+    tracker = scraper.article_tracker
+    metrics = scraper.metrics.summary()
+    return {
+        "seconds": round(seconds, 3),
+        "articles_per_second": round(config.pages_to_crawl / seconds, 2),
+        "new": len(tracker.new_articles),
+        "updated": len(tracker.updated_articles),
+        "failed": len(tracker.failed_this_run),
+        "pages_fetched": metrics["pages_fetched"],
+        "bytes_fetched": metrics["bytes_fetched"],
+        "file_writes": scraper.writer.stats(),
+        "phases": metrics["phases"],
+    }
+
+
+async def run_case(args: argparse.Namespace, articles: int, concurrency: int) -> dict:
+    """
+    Benchmark one article count and concurrency level on a fresh fixture site
+    and output directory. Each repetition starts from an empty tracker; with
+    --rerun an incremental pass over the unchanged site is measured as well.
+    """
+    site = FixtureSite(
+        articles=articles,
+        serve_feed=args.discovery_mode == "feed",
+        latency=args.latency,
+        article_size=args.article_size,
+    ).start()
+    runs = []
+    try:
+        for _ in range(args.repeat):
+            with tempfile.TemporaryDirectory(prefix="scraper-benchmark-") as output_dir:
+                config = ScraperConfig(
+                    base_url=site.base_url,
+                    output_dir=output_dir,
+                    pages_to_crawl=articles,
+                    discovery_mode=args.discovery_mode,
+                    fetch_engine=args.fetch_engine,
+                    parser_backend=args.parser_backend,
+                    conversion_workers=args.conversion_workers,
+                    concurrency=concurrency,
+                    per_host_limit=concurrency,
+                    rate_limit=args.rate_limit,
+                    # Keep the run history of fixture articles out of any archive
+                    archive=False,
+                )
+                served = site.requests_served
+                cold = await run_scraper(config, not args.verbose)
+                cold["requests_served"] = site.requests_served - served
+                run = {"cold": cold}
+                if args.rerun:
+                    served = site.requests_served
+                    warm = await run_scraper(config, not args.verbose)
+                    warm["requests_served"] = site.requests_served - served
+                    run["warm"] = warm
+                runs.append(run)
+    finally:
+        site.stop()
+
+    # Report the median repetition of each pass
+    case = {"articles": articles, "concurrency": concurrency}
+    for phase in runs[0]:
+        ordered = sorted(runs, key=lambda run: run[phase]["seconds"])
+        case[phase] = ordered[len(ordered) // 2][phase]
+        case[phase]["all_seconds"] = [run[phase]["seconds"] for run in runs]
+    return case
+
+
+def compare(report: dict, baseline: dict, max_regression: float) -> list[str]:
+    """
+    Compare throughput per case with a baseline report.
+
+    Returns:
+        list[str]: Cases whose throughput dropped by more than max_regression
+    """
+    previous = {
+        (case["articles"], case["concurrency"]): case for case in baseline["results"]
+    }
+    regressions = []
+    for case in report["results"]:
+        old = previous.get((case["articles"], case["concurrency"]))
+        if old is None:
+            continue
+        for phase in ("cold", "warm"):
+            if phase not in case or phase not in old:
+                continue
+            before = old[phase]["articles_per_second"]
+            after = case[phase]["articles_per_second"]
+            change = (after - before) / before if before else 0.0
+            case[phase]["change_vs_baseline"] = round(change, 3)
+            if change < -max_regression:
+                regressions.append(
+                    f"{case['articles']} articles x {case['concurrency']} workers ({phase}): "
+                    f"{before} -> {after} articles/s ({change:+.0%})"
+                )
+    return regressions
+
+
+def print_table(report: dict):
+    print(f"{'articles':>8} {'workers':>7} {'pass':>5} {'seconds':>8} {'art/s':>7}")
+    for case in report["results"]:
+        for phase in ("cold", "warm"):
+            if phase in case:
+                result = case[phase]
+                change = result.get("change_vs_baseline")
+                print(
+                    f"{case['articles']:>8} {case['concurrency']:>7} {phase:>5} "
+                    f"{result['seconds']:>8.2f} {result['articles_per_second']:>7.2f}"
+                    + (f"  ({change:+.0%} vs baseline)" if change is not None else "")
+                )
+
+
+async def run_benchmark(args: argparse.Namespace) -> dict:
+    results = []
+    for articles in args.articles:
+        for concurrency in args.concurrency:
+            print(
+                f"Benchmarking {articles} articles with {concurrency} worker(s)...",
+                flush=True,
+            )
+            results.append(await run_case(args, articles, concurrency))
+
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "settings": {
+            "latency": args.latency,
+            "article_size": args.article_size,
+            "repeat": args.repeat,
+            "rerun": args.rerun,
+            "discovery_mode": args.discovery_mode,
+            "fetch_engine": args.fetch_engine,
+            "parser_backend": args.parser_backend,
+            "conversion_workers": args.conversion_workers,
+            "rate_limit": args.rate_limit,
+        },
+        "environment": {
+            "python_version": sys.version,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the scraper against a local fixture help center."
+    )
+    parser.add_argument("--articles", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.02,
+        help="Seconds the fixture site delays every response.",
+    )
+    parser.add_argument(
+        "--article-size",
+        type=int,
+        default=6000,
+        help="Approximate article body size in bytes.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Repetitions per case; the median is reported.",
+    )
+    parser.add_argument(
+        "--rerun",
+        action="store_true",
+        help="Also measure an incremental run over the unchanged site.",
+    )
+    parser.add_argument(
+        "--discovery-mode", default="feed", choices=["feed", "crawl", "sidebar"]
+    )
+    parser.add_argument(
+        "--fetch-engine", default="http", choices=["auto", "http", "playwright"]
+    )
+    parser.add_argument(
+        "--parser-backend",
+        default="beautifulsoup",
+        choices=["beautifulsoup", "selectolax"],
+    )
+    parser.add_argument("--conversion-workers", type=int, default=None)
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Keep adaptive rate limiting on (off by default to measure raw throughput).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="Report path (default: artifacts/benchmark_<timestamp>.json).",
+    )
+    parser.add_argument(
+        "--compare", type=Path, default=None, help="Baseline report to compare with."
+    )
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="Throughput drop versus the baseline that fails the benchmark.",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the scraper's own output."
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run_benchmark(args))
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.max_regression)
+        report["baseline"] = str(args.compare)
+        report["regressions"] = regressions
+
+    output = args.output or Path("artifacts") / (
+        f'benchmark_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print_table(report)
+    print(f"Benchmark report saved: {output}")
+    for regression in regressions:
+        print(f"Throughput regression: {regression}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
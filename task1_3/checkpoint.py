@@ -0,0 +1,130 @@
+import json
+import os
+import time
+
+from config import ScraperConfig, ScraperUtils
+
+
+class RunCheckpoint:
+    """
+    Append-only journal of the current run: a header line with the planned
+    article list, then one line per finished article with its tracker entry.
+    Each line is flushed and fsynced, so a run killed midway (browser crash,
+    OOM) can be resumed without rediscovering or refetching completed articles.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.path = config.checkpoint_file
+        self._file = None
+
+    def start(self, articles: list[str], updated_at: dict[str, str]):
+        """
+        Begin a new journal for the planned articles, replacing any previous one.
+        """
+        self.close()
+        header = {
+            "type": "plan",
+            "created_at": time.time(),
+            "base_url": self.config.base_url,
+            "articles": articles,
+            "updated_at": {
+                url: updated_at[url] for url in articles if url in updated_at
+            },
+        }
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._append(header)
+
+    def load(self) -> dict | None:
+        """
+        Read the journal left by an interrupted run.
+
+        Returns:
+            dict: The plan header plus "completed" (URL -> tracker entry),
+                "failed", "new" and "updated" URL sets, or None when there is
+                no usable, fresh checkpoint for this site
+        """
+        if not self.path.exists():
+            return None
+
+        plan = None
+        completed = {}
+        failed = set()
+        changes = {"new": set(), "updated": set()}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write is ignored
+                    continue
+                if record.get("type") == "plan":
+                    plan = record
+                elif record.get("status") == "done":
+                    completed[record["url"]] = record.get("entry")
+                    failed.discard(record["url"])
+                    if record.get("change") in changes:
+                        changes[record["change"]].add(record["url"])
+                elif record.get("status") == "failed":
+                    failed.add(record["url"])
+
+        if plan is None or plan.get("base_url") != self.config.base_url:
+            return None
+
+        age_hours = (time.time() - plan["created_at"]) / 3600
+        if age_hours > self.config.checkpoint_max_age_hours:
+            print(
+                f"{ScraperUtils.format_datetime()} Checkpoint is {age_hours:.1f} hours old, ignoring it"
+            )
+            return None
+
+        return {**plan, "completed": completed, "failed": failed, **changes}
+
+    def resume(self):
+        """
+        Reopen the existing journal so further progress is appended to it.
+        """
+        self.close()
+        torn = False
+        with open(self.path, "rb") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                torn = f.read(1) != b"\n"
+        self._file = open(self.path, "a", encoding="utf-8")
+        # Terminate a torn final line so new records start on their own line
+        if torn:
+            self._file.write("\n")
+
+    def mark(
+        self, article_url: str, success: bool, entry: dict = None, change: str = None
+    ):
+        """
+        Record that an article finished, with its tracker entry (so it survives
+        even if the tracker itself is never saved) and whether it was "new" or
+        "updated" in this run.
+        """
+        if self._file is None:
+            return
+        record = {"url": article_url, "status": "done" if success else "failed"}
+        if success and entry:
+            record["entry"] = entry
+        if success and change:
+            record["change"] = change
+        self._append(record)
+
+    def _append(self, record: dict):
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def clear(self):
+        """
+        Remove the journal after a run that finished every planned article.
+        """
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,11 +1,30 @@
 import datetime
 import hashlib
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import html2text
+from storage import SQLiteArticleStore
+
+# Numeric article id in help center article paths ("/articles/<id>-<slug>")
+ARTICLE_ID_PATTERN = re.compile(r"/articles/(\d+)(?:[-/]|$)")
+
+# Selectors removed from article content before markdown conversion
+DEFAULT_UNWANTED_SELECTORS = [
+    ".article-votes",
+    ".article-meta",
+    ".comments",
+    ".share-buttons",
+    "nav",
+    "footer",
+    "aside",
+    ".related-articles",
+    ".breadcrumbs",
+]
 
 
 @dataclass
@@ -20,31 +39,158 @@ class ScraperConfig:
         "alphabetical"  # "alphabetical", "reverse", or "discovery_order"
     )
 
+    # Article discovery settings
+    discovery_mode: str = (
+        "feed"  # "feed" (JSON article listing), "crawl" (site crawl) or "sidebar"
+    )
+    help_center_locale: str = "en-us"  # Locale segment of help center URLs
+    feed_page_size: int = 100  # Articles per page requested from the feed
+    crawl_max_depth: int = (
+        3  # Link depth from the help center home (pagination excluded)
+    )
+    crawl_page_budget: int = 500  # Maximum listing pages fetched by the site crawl
+
     # Incremental update settings for processing only changed content
     enable_incremental_updates: bool = True  # Only process new/updated articles
     processed_articles_log: str = (
         "processed_articles.json"  # Log file to track processed articles
     )
+    tracker_backend: str = "json"  # "json" (rewritten at end of run) or "sqlite"
+    tracker_db: str = "processed_articles.db"  # SQLite database for the tracker
+    tracker_commit_batch: int = 10  # SQLite tracker updates per commit
+    failed_articles_log: str = (
+        "failed_articles.json"  # Articles that failed, retried first next run
+    )
     force_update_all: bool = False  # Force update all articles regardless of changes
+    skip_unchanged_writes: bool = True  # Leave files whose body is unchanged untouched
+    writer_batch_size: int = 32  # Files written per batch by the writer thread
+    checkpoint_file: str = "run_checkpoint.jsonl"  # Journal used by --resume
+    checkpoint_max_age_hours: float = 24  # Older checkpoints are ignored on resume
+    raw_cache: bool = True  # Keep compressed raw article HTML for offline replay
+    raw_cache_db: str = "raw_cache.db"  # SQLite database of raw responses
+    raw_cache_keep: int = 3  # Responses kept per article URL
+    archive: bool = True  # Snapshot every run into the deduplicated archive
+    archive_dir: str = "archive"  # History of article versions, in output_dir
+    enable_conditional_requests: bool = (
+        True  # Send ETag/Last-Modified validators and skip on 304 Not Modified
+    )
 
     # Browser and request configuration
     http_headers: dict = None  # Optional HTTP headers for requests
     timeout: int = 60000  # Default timeout for page loading in milliseconds
+    fetch_engine: str = (
+        "auto"  # "auto" (HTTP first, browser fallback), "http", or "playwright"
+    )
+    content_markers: list[str] = None  # Substrings showing an HTTP response is rendered
 
-    # Content filtering settings
+    # Readiness detection after browser navigation
+    readiness_strategy: str = (
+        "selector"  # "selector", "mutation", "networkidle", or "fixed" (1500 ms)
+    )
+    content_selector: str = ".article-body"  # Element signalling the article is ready
+    readiness_timeout: int = 5000  # Upper bound in milliseconds for readiness waits
+    mutation_quiet_ms: int = 300  # DOM quiet period for the "mutation" strategy
+
+    # Resource filtering applied to browser navigation
+    block_resources: bool = True  # Abort requests the markdown conversion never uses
+    blocked_resource_types: list[str] = None  # Playwright resource types to block
+    blocked_url_patterns: list[str] = None  # Regexes of URLs to block (analytics, chat)
+    allowed_url_patterns: list[str] = None  # Regexes of URLs that are never blocked
+
+    # Concurrency settings for fetching articles in parallel
+    concurrency: int = 4  # Number of browser pages processing articles at once
+    per_host_limit: int = 4  # Maximum in-flight page loads against a single host
+
+    # Adaptive per-host rate control (token bucket tuned by AIMD)
+    rate_limit: bool = True  # Pace requests per host and back off when throttled
+    rate_initial: float = 2.0  # Starting requests per second per host
+    rate_min: float = 0.2  # Floor the rate never drops below
+    rate_max: float = 20.0  # Ceiling the rate never grows beyond
+    rate_increase: float = 0.5  # Requests/second added after each healthy response
+    rate_burst: float = 2.0  # Requests that may be sent back to back
+    rate_latency_target: float = 3.0  # Seconds above which a response counts as slow
+    max_retry_after: float = 300.0  # Cap in seconds on honoured Retry-After waits
+    throttle_retries: int = 3  # Retries of a request answered with 429/503
+
+    # Retries of failed fetches and the circuit breaker guarding the site
+    fetch_retries: int = 2  # Extra attempts after a transient fetch failure
+    retry_backoff_base: float = 1.0  # Seconds; doubles with every attempt
+    retry_backoff_max: float = 30.0  # Upper bound on a single backoff wait
+    breaker_window: int = 20  # Recent requests considered by the circuit breaker
+    breaker_min_requests: int = 10  # Requests needed before the breaker can open
+    breaker_failure_threshold: float = 0.5  # Failure rate that opens the breaker
+    breaker_cooldown: float = 30.0  # Seconds the breaker fails fast before probing
+
+    # Content parsing and filtering settings
+    parser_backend: str = "beautifulsoup"  # "beautifulsoup" or "selectolax" (faster)
     unwanted_selectors: list[str] = None  # Selectors to remove from article content
+    conversion_workers: int = (
+        None  # Processes converting HTML to markdown; None = one per CPU, 0 = inline
+    )
 
     def __post_init__(self):
         # Convert output directory to Path object and create if needed
         self.output_dir = Path(self.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.processed_articles_log = self.output_dir / self.processed_articles_log
+        self.tracker_db = self.output_dir / self.tracker_db
+        self.failed_articles_log = self.output_dir / self.failed_articles_log
+        self.checkpoint_file = self.output_dir / self.checkpoint_file
+        self.raw_cache_db = self.output_dir / self.raw_cache_db
+        self.archive_dir = self.output_dir / self.archive_dir
 
         # Validate and clean base URL
         self.base_url = self.base_url.rstrip("/")
         if not self.base_url.startswith("http"):
             raise ValueError("Base URL must start with 'http' or 'https'")
 
+        # Validate fetch engine selection
+        if self.fetch_engine not in ("auto", "http", "playwright"):
+            raise ValueError(
+                "fetch_engine must be one of 'auto', 'http' or 'playwright'"
+            )
+
+        # Validate tracker backend selection
+        if self.tracker_backend not in ("json", "sqlite"):
+            raise ValueError("tracker_backend must be either 'json' or 'sqlite'")
+
+        # Validate discovery mode selection
+        if self.discovery_mode not in ("feed", "crawl", "sidebar"):
+            raise ValueError(
+                "discovery_mode must be one of 'feed', 'crawl' or 'sidebar'"
+            )
+
+        # Validate parser backend selection
+        if self.parser_backend not in ("beautifulsoup", "selectolax"):
+            raise ValueError(
+                "parser_backend must be either 'beautifulsoup' or 'selectolax'"
+            )
+
+        # Validate readiness strategy selection
+        if self.readiness_strategy not in (
+            "selector",
+            "mutation",
+            "networkidle",
+            "fixed",
+        ):
+            raise ValueError(
+                "readiness_strategy must be one of 'selector', 'mutation', 'networkidle' or 'fixed'"
+            )
+
+        # Default to one conversion process per CPU core
+        if self.conversion_workers is None:
+            self.conversion_workers = os.cpu_count() or 1
+
+        # Validate concurrency limits
+        if self.concurrency < 1 or self.per_host_limit < 1:
+            raise ValueError("concurrency and per_host_limit must be at least 1")
+
+        # Validate rate limits
+        if not 0 < self.rate_min <= self.rate_initial <= self.rate_max:
+            raise ValueError(
+                "rate limits must satisfy 0 < rate_min <= rate_initial <= rate_max"
+            )
+
         # Set default HTTP headers if not provided
         if self.http_headers is None:
             self.http_headers = {
@@ -52,19 +198,30 @@ class ScraperConfig:
                 "Accept-Language": "en-US,en;q=0.9",
             }
 
+        # Set default markers of server-rendered article content
+        if self.content_markers is None:
+            self.content_markers = ["article-body", "<article"]
+
+        # Set default resource filtering rules for browser navigation
+        if self.blocked_resource_types is None:
+            self.blocked_resource_types = ["image", "media", "font", "stylesheet"]
+        if self.blocked_url_patterns is None:
+            self.blocked_url_patterns = [
+                r"google-analytics\.com",
+                r"googletagmanager\.com",
+                r"doubleclick\.net",
+                r"connect\.facebook\.net",
+                r"hotjar\.com",
+                r"intercom(cdn)?\.io",
+                r"static\.zdassets\.com/ekr",  # Zendesk chat widget
+                r"segment\.(io|com)",
+            ]
+        if self.allowed_url_patterns is None:
+            self.allowed_url_patterns = []
+
         # Set default unwanted selectors for content cleanup
         if self.unwanted_selectors is None:
-            self.unwanted_selectors = [
-                ".article-votes",
-                ".article-meta",
-                ".comments",
-                ".share-buttons",
-                "nav",
-                "footer",
-                "aside",
-                ".related-articles",
-                ".breadcrumbs",
-            ]
+            self.unwanted_selectors = list(DEFAULT_UNWANTED_SELECTORS)
 
 
 class ScraperUtils:
@@ -95,13 +252,74 @@ class ScraperUtils:
         """
         return hashlib.md5(content.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def get_content_fingerprint(content: str) -> str:
+        """
+        Fast fingerprint of whitespace-normalized article content for change detection.
+        """
+        normalized = " ".join(content.split())
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def strip_front_matter(text: str) -> str:
+        """
+        Remove the metadata header written at the top of saved markdown files.
+        """
+        if text.startswith("---\n"):
+            end = text.find("\n---\n", 4)
+            if end != -1:
+                return text[end + len("\n---\n") :]
+        return text
+
+    @staticmethod
+    def parse_timestamp(value: str) -> datetime.datetime:
+        """
+        Parse an ISO 8601 timestamp such as the help center's "2024-05-01T12:00:00Z".
+        """
+        return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    @staticmethod
+    def extract_validators(headers: dict) -> dict:
+        """
+        Extract cache validators (ETag, Last-Modified) from lower-cased response headers.
+        """
+        validators = {}
+        if headers.get("etag"):
+            validators["etag"] = headers["etag"]
+        if headers.get("last-modified"):
+            validators["last_modified"] = headers["last-modified"]
+        return validators
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """
+        Canonical form of a help center URL for deduplication: lower-cased
+        scheme and host, no fragment or trailing slash, and only the "page"
+        query parameter (other than page 1) kept.
+        """
+        parts = urlsplit(url)
+        query = urlencode(
+            [(k, v) for k, v in parse_qsl(parts.query) if k == "page" and v != "1"]
+        )
+        path = parts.path.rstrip("/") or "/"
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+    @staticmethod
+    def extract_article_id(url: str) -> str | None:
+        """
+        Extract the numeric help center article id from an article URL, e.g.
+        "360000000000" from ".../hc/en-us/articles/360000000000-Some-Title".
+        """
+        match = ARTICLE_ID_PATTERN.search(urlsplit(url).path)
+        return match.group(1) if match else None
+
     @staticmethod
     def is_article_url(url: str) -> bool:
         """
         Check if a URL is an article URL.
-        Article URLs typically contain '/articles/' in their path.
+        Article URLs contain '/articles/<numeric id>' in their path.
         """
-        return "/articles/" in url
+        return ScraperUtils.extract_article_id(url) is not None
 
     @staticmethod
     def create_html2text_converter() -> html2text.HTML2Text:
@@ -119,21 +337,34 @@ class ScraperUtils:
 
 
 class ArticleTracker:
-    """Handles tracking of processed articles for incremental updates."""
+    """
+    Handles tracking of processed articles for incremental updates.
+    Entries are keyed by article id, so slug, locale, query or fragment
+    variants of an article URL share one entry.
+    """
 
     def __init__(self, config: ScraperConfig):
         self.config = config
         # Load previously processed articles from disk
         self.processed_articles = self.load_processed_articles()
+        self.migrate_article_ids()
+        self.migrate_content_fingerprints()
+        # Articles whose last attempt failed, with the reason, kept across runs
+        self.failures = self.load_failures()
+        self.failed_this_run = {}
         # Track new and updated articles during current run
         self.new_articles = set()
         self.updated_articles = set()
 
-    def load_processed_articles(self) -> dict:
+    def load_processed_articles(self) -> dict | SQLiteArticleStore:
         """
         Load the log of previously processed articles.
-        Returns a dictionary with URL as key and metadata as value.
+        Returns a mapping with URL as key and metadata as value: a dict for the
+        JSON backend, or a SQLite-backed store that commits as it goes.
         """
+        if self.config.tracker_backend == "sqlite":
+            return self._open_sqlite_store()
+
         if not self.config.processed_articles_log.exists():
             return {}
 
@@ -146,10 +377,44 @@ class ArticleTracker:
             )
             return {}
 
+    def _open_sqlite_store(self) -> SQLiteArticleStore:
+        """
+        Open the SQLite tracker, importing the JSON log once if the database is empty.
+        """
+        store = SQLiteArticleStore(
+            self.config.tracker_db, commit_every=self.config.tracker_commit_batch
+        )
+        if len(store) == 0 and self.config.processed_articles_log.exists():
+            try:
+                imported = store.import_json(self.config.processed_articles_log)
+                print(
+                    f"{ScraperUtils.format_datetime()} Imported {imported} entries from {self.config.processed_articles_log} into {self.config.tracker_db}"
+                )
+            except (json.JSONDecodeError, OSError) as e:
+                print(
+                    f"{ScraperUtils.format_datetime()} Warning: Could not import processed articles log: {e}"
+                )
+        return store
+
     def save_processed_articles(self):
+        """
+        Save the log of processed articles and the failures log to disk.
+        """
+        self.save_failures()
+        self._save_article_log()
+
+    def _save_article_log(self):
         """
         Save the log of processed articles to disk.
+        The SQLite backend only needs its last pending batch committed.
         """
+        if isinstance(self.processed_articles, SQLiteArticleStore):
+            self.processed_articles.commit()
+            print(
+                f"{ScraperUtils.format_datetime()} Committed processed articles database: {len(self.processed_articles)} entries"
+            )
+            return
+
         try:
             with open(self.config.processed_articles_log, "w", encoding="utf-8") as f:
                 json.dump(self.processed_articles, f, indent=2, ensure_ascii=False)
@@ -161,8 +426,71 @@ class ArticleTracker:
                 f"{ScraperUtils.format_datetime()} Error saving processed articles log: {e}"
             )
 
+    def load_failures(self) -> dict | SQLiteArticleStore:
+        """
+        Load the failed-articles log: a "failures" table on the SQLite
+        tracker's connection, or a JSON file for the JSON backend.
+        """
+        if isinstance(self.processed_articles, SQLiteArticleStore):
+            return self.processed_articles.open_table("failures")
+
+        if not self.config.failed_articles_log.exists():
+            return {}
+        try:
+            with open(self.config.failed_articles_log, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            print(
+                f"{ScraperUtils.format_datetime()} Warning: Could not load failed articles log, starting fresh"
+            )
+            return {}
+
+    def save_failures(self):
+        """
+        Save the failed-articles log to disk.
+        """
+        if isinstance(self.failures, SQLiteArticleStore):
+            self.failures.commit()
+            return
+
+        try:
+            with open(self.config.failed_articles_log, "w", encoding="utf-8") as f:
+                json.dump(self.failures, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(
+                f"{ScraperUtils.format_datetime()} Error saving failed articles log: {e}"
+            )
+
+    def record_failure(self, article_url: str, reason: str):
+        """
+        Remember why an article failed so the next run retries it first.
+        """
+        key = self.article_key(article_url)
+        previous = self.failures.get(key) or {}
+        self.failures[key] = {
+            "url": article_url,
+            "reason": reason,
+            "failure_count": previous.get("failure_count", 0) + 1,
+            "last_failed": ScraperUtils.format_datetime(),
+        }
+        self.failed_this_run[article_url] = reason
+
+    def clear_failure(self, article_url: str):
+        """
+        Forget a previous failure once the article has been processed.
+        """
+        key = self.article_key(article_url)
+        if key in self.failures:
+            del self.failures[key]
+
+    def failed_keys(self) -> set[str]:
+        """
+        Tracker keys of the articles that failed on their last attempt.
+        """
+        return set(self.failures)
+
     def should_process_article(
-        self, article_url: str, content_hash: str = None
+        self, article_url: str, content_fingerprint: str = None
     ) -> tuple[bool, str]:
         """
         Determine if an article should be processed based on incremental update settings.
@@ -179,40 +507,206 @@ class ArticleTracker:
             return True, "incremental_updates disabled"
 
         # Process new articles that haven't been seen before
-        if article_url not in self.processed_articles:
+        entry = self.get_entry(article_url)
+        if entry is None:
             return True, "new article"
 
-        # Process articles with changed content (different hash)
+        # Process articles with changed content (different fingerprint)
         if (
-            content_hash
-            and self.processed_articles[article_url].get("content_hash") != content_hash
+            content_fingerprint
+            and entry.get("content_fingerprint") != content_fingerprint
         ):
             return True, "content changed"
 
         # Skip articles that haven't changed
         return False, "already processed and unchanged"
 
+    @staticmethod
+    def article_key(article_url: str) -> str:
+        """
+        Tracker key of an article: its numeric id, or the normalized URL when
+        the URL carries no id.
+        """
+        return ScraperUtils.extract_article_id(
+            article_url
+        ) or ScraperUtils.normalize_url(article_url)
+
+    def get_entry(self, article_url: str) -> dict | None:
+        """
+        Return the tracked entry of an article, whichever URL variant is given.
+        """
+        return self.processed_articles.get(self.article_key(article_url))
+
+    def migrate_article_ids(self):
+        """
+        Re-key entries logged by URL under their article id. When several URLs
+        map to one article, the most recently processed entry wins and the
+        markdown files of the others are removed. Saved files are renamed to
+        the id-prefixed names used for newly saved articles.
+        """
+        legacy_urls = [
+            key for key in self.processed_articles if self.article_key(key) != key
+        ]
+        if not legacy_urls:
+            return
+
+        migrated = 0
+        for article_url in legacy_urls:
+            entry = {"url": article_url, **self.processed_articles.pop(article_url)}
+            key = self.article_key(article_url)
+            existing = self.processed_articles.get(key)
+            if existing is not None:
+                # Keep the most recent of the duplicates, drop the other's file
+                if existing.get("last_processed", "") >= entry.get(
+                    "last_processed", ""
+                ):
+                    existing, entry = entry, existing
+                stale_file = Path(existing.get("file_path", ""))
+                if stale_file.is_file() and str(stale_file) != entry.get("file_path"):
+                    stale_file.unlink()
+
+            if key.isdigit():
+                entry = self._rename_to_id_filename(key, entry)
+            self.processed_articles[key] = entry
+            migrated += 1
+
+        print(
+            f"{ScraperUtils.format_datetime()} Migrated {migrated} processed articles to article id keys ({len(self.processed_articles)} distinct articles)"
+        )
+        # Files were renamed and removed; persist the matching log right away
+        # so a crash before the end of the run cannot leave stale file paths
+        self._save_article_log()
+
+    def _rename_to_id_filename(self, article_id: str, entry: dict) -> dict:
+        """
+        Move an entry's markdown file to the id-prefixed filename.
+        """
+        file_path = Path(entry.get("file_path", ""))
+        if not file_path.is_file() or file_path.name.startswith(f"{article_id}-"):
+            return entry
+
+        new_path = file_path.with_name(f"{article_id}-{file_path.name}")
+        file_path.rename(new_path)
+        return {**entry, "filename": new_path.name, "file_path": str(new_path)}
+
+    def migrate_content_fingerprints(self):
+        """
+        Backfill content fingerprints for entries logged before fingerprinting existed.
+        The fingerprint is rebuilt from the saved markdown file; entries whose
+        file is missing keep only the legacy raw-HTML content_hash.
+        """
+        migrated = 0
+        for article_url, entry in list(self.processed_articles.items()):
+            if entry.get("content_fingerprint"):
+                continue
+
+            file_path = Path(entry.get("file_path", ""))
+            if not file_path.is_file():
+                continue
+
+            markdown_content = ScraperUtils.strip_front_matter(
+                file_path.read_text(encoding="utf-8")
+            )
+            self.processed_articles[article_url] = {
+                **entry,
+                "content_fingerprint": ScraperUtils.get_content_fingerprint(
+                    markdown_content
+                ),
+            }
+            migrated += 1
+
+        if migrated:
+            print(
+                f"{ScraperUtils.format_datetime()} Migrated {migrated} processed articles to content fingerprints"
+            )
+
+    def should_fetch_article(
+        self, article_url: str, updated_at: str = None
+    ) -> tuple[bool, str]:
+        """
+        Decide before any page fetch whether an article can be skipped, based on
+        the updated_at timestamp reported by the help center article feed.
+
+        Returns:
+            tuple: (should_fetch: bool, reason: str)
+        """
+        if self.config.force_update_all or not self.config.enable_incremental_updates:
+            return True, "incremental checks disabled"
+
+        entry = self.get_entry(article_url)
+        if entry is None:
+            return True, "new article"
+
+        recorded = entry.get("updated_at")
+        if not updated_at or not recorded:
+            return True, "no feed timestamp recorded"
+
+        if ScraperUtils.parse_timestamp(updated_at) > ScraperUtils.parse_timestamp(
+            recorded
+        ):
+            return True, "updated in feed"
+
+        return False, "not updated since last run"
+
+    def get_conditional_headers(self, article_url: str) -> dict:
+        """
+        Build If-None-Match / If-Modified-Since headers from the stored validators.
+        Returns an empty dict when the article must be fetched unconditionally.
+        """
+        if (
+            self.config.force_update_all
+            or not self.config.enable_incremental_updates
+            or not self.config.enable_conditional_requests
+        ):
+            return {}
+
+        entry = self.get_entry(article_url) or {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update_article_metadata(self, article_url: str, metadata: dict):
+        """
+        Refresh stored metadata (cache validators, feed updated_at) of an
+        already tracked article.
+        """
+        key = self.article_key(article_url)
+        if metadata and key in self.processed_articles:
+            self.processed_articles[key] = {
+                **self.processed_articles[key],
+                **metadata,
+            }
+
     def track_article(
         self,
         article_url: str,
         filename: str,
         content_hash: str,
+        content_fingerprint: str,
         file_path: str,
         update_reason: str,
+        metadata: dict = None,
     ):
         """
         Track an article in the processed articles log and update counters.
+        Extra metadata (cache validators, feed updated_at) is merged into the entry.
         """
-        # Store article metadata in processed articles log
-        self.processed_articles[article_url] = {
+        # Store article metadata in processed articles log, keyed by article id
+        self.processed_articles[self.article_key(article_url)] = {
+            "url": article_url,
             "filename": filename,
             "content_hash": content_hash,
+            "content_fingerprint": content_fingerprint,
             "last_processed": ScraperUtils.format_datetime(),
             "file_path": file_path,
+            **(metadata or {}),
         }
 
         # Update tracking counters for reporting
-        if article_url not in self.processed_articles or update_reason == "new article":
+        if update_reason == "new article":
             self.new_articles.add(article_url)
         elif update_reason == "content changed":
             self.updated_articles.add(article_url)
@@ -0,0 +1,118 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from config import ScraperConfig, ScraperUtils
+from parsers import ParsedPage, get_parser_backend
+
+# Per-process state, built once by _init_worker
+_parser = None
+_converter = None
+
+
+def _init_worker(parser_backend: str):
+    """
+    Build the parser backend and html2text converter once per worker process.
+    """
+    global _parser, _converter
+    _parser = get_parser_backend(parser_backend)
+    _converter = ScraperUtils.create_html2text_converter()
+
+
+def extract_title(page: ParsedPage, article_url: str) -> str:
+    """
+    Extract the article title from HTML, with fallbacks.
+    """
+    title = page.title()
+    if title:
+        # Clean " - OptiSigns" from the title
+        return title.replace(" - OptiSigns", "").strip()
+    else:
+        # Fallback to URL path if no title tag is found
+        return article_url.split("/")[-1]
+
+
+def convert_article(
+    html: str, article_url: str, unwanted_selectors: list[str]
+) -> dict | None:
+    """
+    Parse raw article HTML, prune unwanted elements and convert it to markdown.
+
+    Returns:
+        dict: markdown, title, content_fingerprint, raw content_hash and the
+            seconds spent parsing and converting, or None when the page has
+            no body content
+    """
+    started = time.perf_counter()
+    page = _parser.parse(html)
+    content_html = page.content_html(unwanted_selectors)
+    if not content_html:
+        return None
+    parsed = time.perf_counter()
+
+    markdown_content = _converter.handle(content_html)
+    return {
+        "markdown": markdown_content,
+        "title": extract_title(page, article_url),
+        "content_fingerprint": ScraperUtils.get_content_fingerprint(markdown_content),
+        "content_hash": ScraperUtils.get_content_hash(html),
+        "timings": {"parse": parsed - started, "convert": time.perf_counter() - parsed},
+    }
+
+
+class ConversionStage:
+    """
+    Runs convert_article in a process pool so parsing and markdown conversion
+    never block the event loop. With zero workers it converts inline.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self._executor = None
+
+    def start(self):
+        """
+        Start the worker processes, or prepare in-process conversion.
+        """
+        if self.config.conversion_workers > 0:
+            # Workers start lazily, possibly after the browser, writer and
+            # HTTP threads are running; forking a threaded process can deadlock
+            # the child, so start them from a clean forkserver (or spawn)
+            start_method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.conversion_workers,
+                mp_context=multiprocessing.get_context(start_method),
+                initializer=_init_worker,
+                initargs=(self.config.parser_backend,),
+            )
+        else:
+            _init_worker(self.config.parser_backend)
+
+    async def convert(self, html: str, article_url: str) -> dict | None:
+        """
+        Convert one article, in a worker process when the pool is running.
+        """
+        if self._executor is None:
+            return convert_article(html, article_url, self.config.unwanted_selectors)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            convert_article,
+            html,
+            article_url,
+            self.config.unwanted_selectors,
+        )
+
+    def close(self):
+        """
+        Shut down the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,266 @@
+import asyncio
+import datetime
+import json
+import random
+import re
+import signal
+from collections.abc import Awaitable, Callable
+
+from config import ScraperUtils
+
+# Allowed ranges of the five cron fields: minute, hour, day, month, weekday
+CRON_FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+# Interval schedules such as "every 15m", "30m", "2h" or "900s"
+INTERVAL_PATTERN = re.compile(r"^(?:every\s+)?(\d+)\s*([smhd])$")
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+class IntervalSchedule:
+    """Runs every fixed number of seconds."""
+
+    def __init__(self, seconds: int):
+        if seconds <= 0:
+            raise ValueError("Schedule interval must be positive")
+        self.seconds = seconds
+
+    def next_after(self, now: datetime.datetime) -> datetime.datetime:
+        return now + datetime.timedelta(seconds=self.seconds)
+
+    def __str__(self) -> str:
+        return f"every {self.seconds}s"
+
+
+class CronSchedule:
+    """
+    Standard five-field cron expression (minute hour day month weekday) with
+    "*", lists, ranges and steps. Times are interpreted in UTC.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, CRON_FIELD_RANGES)
+        )
+        # Like cron, a restricted day and weekday match when either one does
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    @staticmethod
+    def _parse_field(field: str, low: int, high: int) -> set[int]:
+        values = set()
+        for part in field.split(","):
+            value_range, _, step = part.partition("/")
+            if value_range == "*":
+                start, end = low, high
+            elif "-" in value_range:
+                start, end = (int(v) for v in value_range.split("-"))
+            else:
+                start = end = int(value_range)
+                if step:
+                    end = high
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron field {field!r} out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return values
+
+    def _day_matches(self, moment: datetime.datetime) -> bool:
+        day_ok = moment.day in self.days
+        # Python weekdays start on Monday, cron's on Sunday
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, now: datetime.datetime) -> datetime.datetime:
+        moment = now.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        # Skip whole days, then hours, then minutes that cannot match
+        limit = moment + datetime.timedelta(days=366 * 4)
+        while moment < limit:
+            if moment.month not in self.months or not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + datetime.timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + datetime.timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += datetime.timedelta(minutes=1)
+            else:
+                return moment
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+    def __str__(self) -> str:
+        return f"cron {self.expression!r} (UTC)"
+
+
+def parse_schedule(spec: str) -> IntervalSchedule | CronSchedule:
+    """
+    Build a schedule from an interval ("every 15m", "2h") or a cron expression.
+    """
+    spec = spec.strip().lower()
+    match = INTERVAL_PATTERN.match(spec)
+    if match:
+        return IntervalSchedule(int(match.group(1)) * INTERVAL_UNITS[match.group(2)])
+    return CronSchedule(spec)
+
+
+class ScraperDaemon:
+    """
+    Long-running service that runs crawls on a schedule (with random jitter)
+    and on demand. Crawls never overlap; triggers arriving during a crawl
+    queue a single follow-up crawl.
+
+    On-demand triggers come from a small local HTTP endpoint:
+        POST /trigger   start a crawl as soon as possible
+        GET  /status    schedule, last result and whether a crawl is running
+    """
+
+    def __init__(
+        self,
+        crawl: Callable[[], Awaitable[bool]],
+        schedule: IntervalSchedule | CronSchedule,
+        jitter: float = 0,
+        trigger_host: str = "127.0.0.1",
+        trigger_port: int = 8765,
+    ):
+        self.crawl = crawl
+        self.schedule = schedule
+        self.jitter = jitter
+        self.trigger_host = trigger_host
+        self.trigger_port = trigger_port
+
+        self._trigger = asyncio.Event()
+        self._stop = asyncio.Event()
+        self.running = False
+        self.next_run = None
+        self.last_run = None
+
+    def _schedule_next(self):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.next_run = self.schedule.next_after(now) + datetime.timedelta(
+            seconds=random.uniform(0, self.jitter)
+        )
+        print(
+            f"{ScraperUtils.format_datetime()} Next scheduled crawl at {self.next_run.isoformat(timespec='seconds')}"
+        )
+
+    def status(self) -> dict:
+        return {
+            "schedule": str(self.schedule),
+            "running": self.running,
+            "trigger_pending": self._trigger.is_set(),
+            "next_run": self.next_run.isoformat() if self.next_run else None,
+            "last_run": self.last_run,
+        }
+
+    def trigger(self):
+        """
+        Request a crawl as soon as the current one (if any) finishes.
+        """
+        self._trigger.set()
+
+    def stop(self):
+        self._stop.set()
+        self._trigger.set()
+
+    async def _wait_for_next_run(self) -> str:
+        """
+        Sleep until the next scheduled time or an on-demand trigger.
+
+        Returns:
+            str: "trigger" or "schedule"
+        """
+        delay = (
+            self.next_run - datetime.datetime.now(datetime.timezone.utc)
+        ).total_seconds()
+        try:
+            await asyncio.wait_for(self._trigger.wait(), timeout=max(0, delay))
+        except asyncio.TimeoutError:
+            return "schedule"
+        self._trigger.clear()
+        return "trigger"
+
+    async def run(self):
+        """
+        Serve triggers and run crawls until SIGINT/SIGTERM.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except NotImplementedError:
+                pass
+
+        server = None
+        if self.trigger_port:
+            server = await asyncio.start_server(
+                self._handle_request, self.trigger_host, self.trigger_port
+            )
+            print(
+                f"{ScraperUtils.format_datetime()} Trigger endpoint listening on http://{self.trigger_host}:{self.trigger_port} (POST /trigger, GET /status)"
+            )
+
+        print(
+            f"{ScraperUtils.format_datetime()} Scraper service started, schedule: {self.schedule}"
+        )
+        self._schedule_next()
+        try:
+            while not self._stop.is_set():
+                reason = await self._wait_for_next_run()
+                if self._stop.is_set():
+                    break
+                if reason == "schedule":
+                    self._schedule_next()
+
+                print(f"{ScraperUtils.format_datetime()} Starting {reason} crawl")
+                self.running = True
+                started = datetime.datetime.now(datetime.timezone.utc)
+                try:
+                    success = await self.crawl()
+                finally:
+                    self.running = False
+                self.last_run = {
+                    "reason": reason,
+                    "started": started.isoformat(),
+                    "finished": datetime.datetime.now(
+                        datetime.timezone.utc
+                    ).isoformat(),
+                    "success": success,
+                }
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+        print(f"{ScraperUtils.format_datetime()} Scraper service stopped")
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        """
+        Minimal HTTP/1.0 handler for the trigger and status endpoints.
+        """
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            # Drain the request headers
+            while (await reader.readline()).strip():
+                pass
+
+            method, path = (request_line + ["", ""])[:2]
+            if method == "POST" and path == "/trigger":
+                self.trigger()
+                status, body = "202 Accepted", {"triggered": True, **self.status()}
+            elif method == "GET" and path == "/status":
+                status, body = "200 OK", self.status()
+            else:
+                status, body = "404 Not Found", {"error": "not found"}
+
+            data = json.dumps(body).encode("utf-8")
+            writer.write(
+                f"HTTP/1.0 {status}\r\nContent-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,225 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from urllib.parse import urljoin, urlparse
+
+import httpx
+from config import ScraperConfig, ScraperUtils
+from fetchers import FetchResult
+from parsers import ParserBackend
+from ratelimit import RateLimiter
+
+
+class ArticleFeedDiscovery:
+    """
+    Discovers articles from the help center's paginated JSON article listing
+    (``/api/v2/help_center/<locale>/articles.json``), together with their
+    ``updated_at`` timestamps.
+    """
+
+    def __init__(self, config: ScraperConfig, rate_limiter: RateLimiter = None):
+        self.config = config
+        self.rate_limiter = rate_limiter
+
+    @property
+    def feed_url(self) -> str:
+        return f"{self.config.base_url}/api/v2/help_center/{self.config.help_center_locale}/articles.json"
+
+    async def _fetch_page(
+        self, client: httpx.AsyncClient, page_number: int, semaphore: asyncio.Semaphore
+    ) -> dict:
+        """
+        Fetch one page of the article listing.
+        """
+        async with semaphore:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(self.feed_url)
+            response = await client.get(
+                self.feed_url,
+                params={"page": page_number, "per_page": self.config.feed_page_size},
+            )
+            if self.rate_limiter is not None:
+                self.rate_limiter.record(
+                    self.feed_url,
+                    response.status_code,
+                    response.elapsed.total_seconds(),
+                    response.headers,
+                )
+            response.raise_for_status()
+            return response.json()
+
+    async def discover(self) -> dict[str, str]:
+        """
+        Fetch every page of the article listing.
+        The first page reveals the page count; remaining pages are fetched concurrently.
+
+        Returns:
+            dict: Article URL -> updated_at timestamp
+
+        Raises:
+            httpx.HTTPError, ValueError: When the feed is unavailable or malformed
+        """
+        semaphore = asyncio.Semaphore(self.config.per_host_limit)
+        async with httpx.AsyncClient(
+            headers=self.config.http_headers,
+            timeout=self.config.timeout / 1000,
+            follow_redirects=True,
+        ) as client:
+            first_page = await self._fetch_page(client, 1, semaphore)
+            page_count = first_page.get("page_count") or 1
+
+            print(
+                f"{ScraperUtils.format_datetime()} Article feed has {first_page.get('count', '?')} articles over {page_count} page(s)"
+            )
+
+            other_pages = await asyncio.gather(
+                *(
+                    self._fetch_page(client, page_number, semaphore)
+                    for page_number in range(2, page_count + 1)
+                )
+            )
+
+        articles = {}
+        for feed_page in [first_page, *other_pages]:
+            for article in feed_page["articles"]:
+                article_url = article.get("html_url", "")
+                if article.get("draft") or not ScraperUtils.is_article_url(article_url):
+                    continue
+                articles[article_url] = article.get("updated_at")
+        return articles
+
+
+class SiteCrawlDiscovery:
+    """
+    Breadth-first crawl of the help center's listing pages: the home page,
+    categories, sections and their paginated article lists. Article pages are
+    recorded but never fetched. A pool of workers shares the frontier; URLs are
+    normalized and deduplicated, and the crawl is bounded by link depth and a
+    budget of fetched pages.
+    """
+
+    # Listing pages whose links are followed
+    LISTING_SEGMENTS = ("/categories/", "/sections/")
+
+    def __init__(
+        self,
+        config: ScraperConfig,
+        parser: ParserBackend,
+        fetch_page: Callable[..., Awaitable[FetchResult]],
+    ):
+        self.config = config
+        self.parser = parser
+        self.fetch_page = fetch_page
+        self.stats = {}
+
+    @property
+    def seed_urls(self) -> list[str]:
+        # Help center home (category list) and the main articles page (sidebar)
+        home = f"{self.config.base_url}/hc/{self.config.help_center_locale}"
+        return [home, f"{home}/articles"]
+
+    def _is_listing_url(self, url: str) -> bool:
+        return any(segment in url for segment in self.LISTING_SEGMENTS)
+
+    def _in_scope(self, url: str) -> bool:
+        base = urlparse(self.config.base_url)
+        parsed = urlparse(url)
+        return parsed.netloc == base.netloc and parsed.path.startswith(
+            f"/hc/{self.config.help_center_locale}"
+        )
+
+    async def discover(self) -> set[str]:
+        """
+        Crawl the listing pages and collect article URLs.
+
+        Returns:
+            set: Normalized article URLs
+        """
+        start_time = time.perf_counter()
+        frontier = asyncio.Queue()
+        visited = set()
+        articles = set()
+        pages = {"started": 0, "fetched": 0, "failed": 0}
+
+        for seed in self.seed_urls:
+            url = ScraperUtils.normalize_url(seed)
+            visited.add(url)
+            frontier.put_nowait((url, 0))
+
+        async def worker():
+            while True:
+                url, depth = await frontier.get()
+                try:
+                    # Stop fetching once the page budget is spent; drain the rest
+                    if pages["started"] >= self.config.crawl_page_budget:
+                        continue
+                    pages["started"] += 1
+                    for link, link_depth in await self._visit(url, depth, pages):
+                        if ScraperUtils.is_article_url(link):
+                            articles.add(link)
+                        elif link not in visited:
+                            visited.add(link)
+                            frontier.put_nowait((link, link_depth))
+                except Exception as e:
+                    # A bad page must not kill the worker, or join() never returns
+                    pages["failed"] += 1
+                    print(
+                        f"{ScraperUtils.format_datetime()} Error crawling {url}: {type(e).__name__}: {e}"
+                    )
+                finally:
+                    frontier.task_done()
+
+        workers = [
+            asyncio.create_task(worker()) for _ in range(self.config.concurrency)
+        ]
+        try:
+            await frontier.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        elapsed = time.perf_counter() - start_time
+        self.stats = {
+            "pages_fetched": pages["fetched"],
+            "pages_failed": pages["failed"],
+            "pages_seen": len(visited),
+            "articles_found": len(articles),
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_second": (
+                round(pages["fetched"] / elapsed, 2) if elapsed else None
+            ),
+        }
+        print(
+            f"{ScraperUtils.format_datetime()} Site crawl fetched {pages['fetched']} listing pages ({self.stats['pages_per_second']} pages/s), {len(visited)} seen, {len(articles)} articles found"
+        )
+        return articles
+
+    async def _visit(self, url: str, depth: int, pages: dict) -> list[tuple[str, int]]:
+        """
+        Fetch one listing page and return its in-scope links with their depth.
+        Links beyond the depth limit are dropped; article links are always kept.
+        """
+        result = await self.fetch_page(
+            url,
+            ["/articles/", "/sections/", "/categories/"],
+            ready_selector="a[href*='/articles/'], a[href*='/sections/']",
+        )
+        if not result.html:
+            pages["failed"] += 1
+            return []
+
+        links = []
+        for href in self.parser.parse(result.html).links() or []:
+            link = ScraperUtils.normalize_url(urljoin(url, href))
+            if not self._in_scope(link):
+                continue
+            if ScraperUtils.is_article_url(link):
+                links.append((link, depth + 1))
+            elif urlparse(link).path == urlparse(url).path:
+                # Another page of the same listing is not a level deeper
+                links.append((link, depth))
+            elif self._is_listing_url(link) and depth < self.config.crawl_max_depth:
+                links.append((link, depth + 1))
+        pages["fetched"] += 1
+        return links
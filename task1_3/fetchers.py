@@ -0,0 +1,456 @@
+import asyncio
+import importlib.util
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+import httpx
+from config import ScraperConfig, ScraperUtils
+from metrics import RunMetrics
+from playwright.async_api import async_playwright
+from ratelimit import THROTTLE_STATUSES, RateLimiter
+from readiness import create_readiness_strategy
+
+# HTTP/2 needs the optional "h2" package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching a single URL."""
+
+    url: str
+    html: str | None = None
+    status: int | None = None
+    engine: str = ""  # "http" or "playwright"
+    headers: dict = field(default_factory=dict)
+    ready_ms: float | None = None  # Time from request start until the page was ready
+    error: str | None = None  # Why the fetch failed, when it did
+    size: int = 0  # Body size in bytes
+    timings: dict = field(default_factory=dict)  # Engine phase -> seconds
+
+
+class HttpFetcher:
+    """Fetches pages with a pooled, keep-alive async HTTP client."""
+
+    engine = "http"
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self._client = None
+
+    async def start(self):
+        """
+        Open the shared HTTP client.
+        """
+        pool_size = self.config.concurrency * 2
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=self.config.http_headers,
+            timeout=self.config.timeout / 1000,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+        )
+
+    async def fetch(self, url: str, headers: dict = None) -> FetchResult:
+        """
+        Fetch a URL and return its body, status and response headers.
+        A 304 Not Modified answer to conditional headers carries no body.
+        """
+        response = await self._client.get(url, headers=headers)
+        html = response.text if response.status_code == 200 else None
+        elapsed = response.elapsed.total_seconds()
+        return FetchResult(
+            url=url,
+            html=html,
+            status=response.status_code,
+            engine=self.engine,
+            headers=dict(response.headers),
+            ready_ms=elapsed * 1000,
+            size=len(response.content),
+            timings={"http_request": elapsed},
+        )
+
+    async def close(self):
+        """
+        Close the HTTP client and its connection pool.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class ResourceFilter:
+    """Aborts browser requests for resources the markdown conversion never uses."""
+
+    # Rough average transfer size per resource type, used to estimate bytes saved
+    # since aborted requests never report their real size
+    ESTIMATED_BYTES = {
+        "image": 60_000,
+        "media": 500_000,
+        "font": 40_000,
+        "stylesheet": 30_000,
+        "script": 50_000,
+    }
+    DEFAULT_ESTIMATED_BYTES = 10_000
+
+    def __init__(self, config: ScraperConfig):
+        self.blocked_types = set(config.blocked_resource_types)
+        self.blocked_patterns = [re.compile(p) for p in config.blocked_url_patterns]
+        self.allowed_patterns = [re.compile(p) for p in config.allowed_url_patterns]
+
+        # Counters reported in the run artifact
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.blocked_by_type = {}
+        self.estimated_bytes_saved = 0
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Decide whether a request is blocked. Documents are always allowed.
+        """
+        if resource_type == "document":
+            return False
+        if any(p.search(url) for p in self.allowed_patterns):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(p.search(url) for p in self.blocked_patterns)
+
+    async def handle_route(self, route):
+        """
+        Playwright route handler: abort blocked requests and continue the rest.
+        """
+        request = route.request
+        if not self.should_block(request.resource_type, request.url):
+            self.allowed_requests += 1
+            await route.continue_()
+            return
+
+        self.blocked_requests += 1
+        self.blocked_by_type[request.resource_type] = (
+            self.blocked_by_type.get(request.resource_type, 0) + 1
+        )
+        self.estimated_bytes_saved += self.ESTIMATED_BYTES.get(
+            request.resource_type, self.DEFAULT_ESTIMATED_BYTES
+        )
+        await route.abort()
+
+    def stats(self) -> dict:
+        """
+        Return the filtering counters for reporting.
+        """
+        return {
+            "allowed_requests": self.allowed_requests,
+            "blocked_requests": self.blocked_requests,
+            "blocked_by_type": self.blocked_by_type,
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+        }
+
+
+class PlaywrightFetcher:
+    """Fetches pages in Chromium using a pool of browser pages."""
+
+    engine = "playwright"
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self._playwright = None
+        self._browser = None
+        self._contexts = []
+        self._pages = asyncio.Queue()
+        self._launch_lock = asyncio.Lock()
+        self.resource_filter = (
+            ResourceFilter(config) if config.block_resources else None
+        )
+        self.readiness = create_readiness_strategy(config)
+
+    async def start(self):
+        """
+        Launch the browser lazily; nothing happens until the first fetch.
+        """
+
+    async def warm_up(self):
+        """
+        Launch the browser and its page pool ahead of the first fetch.
+        """
+        await self._ensure_browser()
+
+    async def _ensure_browser(self):
+        """
+        Launch Chromium and create one page per concurrent worker on first use.
+        """
+        async with self._launch_lock:
+            if self._browser is not None:
+                if self._browser.is_connected():
+                    return
+                # The browser crashed or was killed; start over with a new one
+                print(
+                    f"{ScraperUtils.format_datetime()} Browser disconnected, relaunching..."
+                )
+                try:
+                    await self.close()
+                except Exception:
+                    self._contexts = []
+                    self._pages = asyncio.Queue()
+                    self._browser = None
+                    self._playwright = None
+
+            print(f"{ScraperUtils.format_datetime()} Launching browser...")
+            self._playwright = await async_playwright().start()
+            # Launch browser with headless/visible mode based on config
+            try:
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.config.headless
+                )
+            except Exception:
+                await self._playwright.stop()
+                self._playwright = None
+                raise
+
+            # Each page gets its own context so workers do not share state
+            for _ in range(self.config.concurrency):
+                context = await self._browser.new_context(
+                    extra_http_headers=self.config.http_headers
+                )
+                if self.resource_filter is not None:
+                    await context.route("**/*", self.resource_filter.handle_route)
+                self._contexts.append(context)
+                self._pages.put_nowait(await context.new_page())
+
+    async def fetch(self, url: str, ready_selector: str = None) -> FetchResult:
+        """
+        Navigate to a URL on a pooled page and return the rendered HTML.
+
+        Args:
+            url: Page to navigate to
+            ready_selector: Overrides ``config.content_selector`` for the
+                "selector" readiness strategy
+        """
+        await self._ensure_browser()
+
+        page = await self._pages.get()
+        try:
+            started = time.perf_counter()
+            response = await page.goto(
+                url, wait_until="domcontentloaded", timeout=self.config.timeout
+            )
+            navigated = time.perf_counter()
+            status = response.status if response else None
+            headers = await response.all_headers() if response else {}
+
+            # The site's error page is not article content
+            if status is not None and status >= 400:
+                return FetchResult(
+                    url=url,
+                    status=status,
+                    engine=self.engine,
+                    headers=headers,
+                    error=f"status {status}",
+                    timings={"navigation": navigated - started},
+                )
+
+            # Wait until the configured readiness condition holds
+            await self.readiness.wait(page, url, ready_selector)
+            ready = time.perf_counter()
+
+            html = await page.content()
+            return FetchResult(
+                url=url,
+                html=html,
+                status=status,
+                engine=self.engine,
+                headers=headers,
+                ready_ms=(ready - started) * 1000,
+                size=len(html.encode("utf-8")),
+                timings={
+                    "navigation": navigated - started,
+                    "readiness": ready - navigated,
+                },
+            )
+        finally:
+            self._pages.put_nowait(page)
+
+    async def close(self):
+        """
+        Close all browser contexts and stop Playwright.
+        """
+        for context in self._contexts:
+            await context.close()
+        self._contexts = []
+        self._pages = asyncio.Queue()
+
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+class Fetcher:
+    """
+    Routes fetches to the configured engine.
+
+    In "auto" mode the HTTP client is tried first and the browser is used only
+    when the response does not look server-rendered.
+    """
+
+    def __init__(self, config: ScraperConfig, metrics: RunMetrics = None):
+        self.config = config
+        self.metrics = metrics
+        mode = config.fetch_engine
+        self.http = HttpFetcher(config) if mode in ("auto", "http") else None
+        self.browser = (
+            PlaywrightFetcher(config) if mode in ("auto", "playwright") else None
+        )
+
+        # Per-host semaphores bounding concurrent requests across all engines,
+        # and adaptive per-host request rates
+        self._host_semaphores = {}
+        self.rate_limiter = RateLimiter(config)
+
+    async def start(self):
+        """
+        Start every configured engine.
+        """
+        for engine in (self.http, self.browser):
+            if engine is not None:
+                await engine.start()
+
+    async def warm_up(self):
+        """
+        Launch the browser now so no crawl pays its startup cost. A failed
+        launch is reported and retried on the first browser fetch.
+        """
+        if self.browser is None:
+            return
+        try:
+            await self.browser.warm_up()
+        except Exception as e:
+            print(
+                f"{ScraperUtils.format_datetime()} Warning: Could not warm up browser: {e}"
+            )
+
+    async def close(self):
+        """
+        Shut down every configured engine.
+        """
+        for engine in (self.http, self.browser):
+            if engine is not None:
+                await engine.close()
+
+    def resource_filter_stats(self) -> dict | None:
+        """
+        Return the browser resource filter counters, if filtering is active.
+        """
+        if self.browser is None or self.browser.resource_filter is None:
+            return None
+        return self.browser.resource_filter.stats()
+
+    def _get_host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """
+        Return the semaphore limiting concurrent requests for the URL's host.
+        """
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.config.per_host_limit)
+        return self._host_semaphores[host]
+
+    @staticmethod
+    def looks_rendered(html: str | None, markers: list[str]) -> bool:
+        """
+        Cheap check that an HTML document carries its content server-side.
+        """
+        if not html or "<body" not in html:
+            return False
+        return any(marker in html for marker in markers)
+
+    async def fetch(
+        self,
+        url: str,
+        markers: list[str] = None,
+        headers: dict = None,
+        ready_selector: str = None,
+    ) -> FetchResult:
+        """
+        Fetch a URL with the configured engine(s).
+
+        Args:
+            url: Page to fetch
+            markers: Substrings proving the HTTP response is usable as-is;
+                defaults to ``config.content_markers``
+            headers: Extra request headers for the HTTP engine, e.g. conditional
+                validators; 304 and error answers are returned without a browser
+                fallback
+            ready_selector: Element the browser waits for before capturing
+        """
+        markers = markers or self.config.content_markers
+
+        async with self._get_host_semaphore(url):
+            # Throttled requests are retried once the rate limiter has backed
+            # off and any Retry-After period has passed
+            for attempt in range(self.config.throttle_retries + 1):
+                result = await self._fetch_once(url, markers, headers, ready_selector)
+                if result.status not in THROTTLE_STATUSES:
+                    break
+                if attempt < self.config.throttle_retries:
+                    print(
+                        f"{ScraperUtils.format_datetime()} Retrying throttled request for {url} ({attempt + 1}/{self.config.throttle_retries})"
+                    )
+            return result
+
+    async def _timed(self, url: str, request) -> FetchResult:
+        """
+        Run one engine request under the rate limiter and feed back its outcome.
+        """
+        queued = time.perf_counter()
+        await self.rate_limiter.acquire(url)
+        started = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.observe("rate_limit_wait", started - queued)
+        try:
+            result = await request
+        except Exception:
+            self.rate_limiter.record(url, None, time.perf_counter() - started)
+            raise
+        self.rate_limiter.record(
+            url, result.status, time.perf_counter() - started, result.headers
+        )
+        if self.metrics is not None:
+            self.metrics.record_response(result.size, result.timings)
+        return result
+
+    async def _fetch_once(
+        self,
+        url: str,
+        markers: list[str],
+        headers: dict = None,
+        ready_selector: str = None,
+    ) -> FetchResult:
+        if self.http is not None:
+            try:
+                result = await self._timed(url, self.http.fetch(url, headers))
+            except httpx.HTTPError as e:
+                if self.browser is None:
+                    raise
+                print(
+                    f"{ScraperUtils.format_datetime()} HTTP fetch failed for {url} ({e}), falling back to browser"
+                )
+            else:
+                # Only a 200 that lacks the content can be fixed by rendering;
+                # 304s, throttling and error statuses are answers in themselves
+                if (
+                    self.browser is None
+                    or result.status != 200
+                    or self.looks_rendered(result.html, markers)
+                ):
+                    return result
+                print(
+                    f"{ScraperUtils.format_datetime()} HTTP response for {url} does not look rendered, falling back to browser"
+                )
+
+        return await self._timed(url, self.browser.fetch(url, ready_selector))
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the OptiSigns help center.
+Serves a sidebar page, category and paginated section pages, generated article
+pages and the JSON article feed so the scraper can be exercised without hitting
+support.optisigns.com.
+
+Usage:
+    python fixture_site.py --port 8000 --articles 50
+    python fixture_site.py --articles 200 --latency 0.05 --article-size 6000
+    BASE_URL=http://127.0.0.1:8000 python main.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Article body blocks modelled on real help center pages (see scrape_output/);
+# "{n}" becomes a per-article attachment id
+ARTICLE_BLOCKS = [
+    "<p>In this guide, we will walk you through the end to end process to install "
+    "the OptiSigns Digital Signage app on your device and assign a playlist to it.</p>",
+    "<h2><strong>Here are the high-level steps:</strong></h2>",
+    "<ol><li><strong>Download</strong> &amp; <strong>set up</strong> the OptiSigns "
+    "app on your device.</li><li>Use the OptiSigns web portal to assign content "
+    "and manage your screens.</li></ol>",
+    '<p><a href="/hc/article_attachments/{n}"><img src="/hc/article_attachments/{n}" '
+    'alt=""></a></p>',
+    '<p>Go to our website: <a href="https://app.optisigns.com/app/screenManagement">'
+    "https://app.optisigns.com</a>. If you don't have an account already, create "
+    "one, or log in with your Google or Microsoft account.</p>",
+    "<ul><li>Click the <strong>Add screen</strong> button.</li><li>Type in the "
+    "pair code shown on your screen and click <strong>Pair</strong>.</li><li>Assign "
+    "a playlist or an asset to the screen.</li></ul>",
+    "<table><tr><th>Model</th><th>Firmware</th><th>Supported</th></tr>"
+    "<tr><td>QM55R</td><td>T-KTM2WWC</td><td>Yes</td></tr>"
+    "<tr><td>QB43R</td><td>T-HKMFDEUC</td><td>Yes</td></tr></table>",
+    "<pre><code>curl -sSL https://links.optisigns.com/rpi-install | bash</code></pre>",
+    "<h2>Troubleshooting</h2><p>If the screen stays on the pairing code, check that "
+    "the device can reach <em>app.optisigns.com</em> and restart the app.</p>",
+]
+
+
+class FixtureSite:
+    """Generated help center served from a background thread."""
+
+    FIRST_ARTICLE_ID = 360000000000
+    FIRST_CATEGORY_ID = 115000000000
+    FIRST_SECTION_ID = 116000000000
+
+    def __init__(
+        self,
+        articles: int = 50,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        serve_feed: bool = True,
+        categories: int = 2,
+        sections_per_category: int = 2,
+        section_page_size: int = 10,
+        sidebar_limit: int = None,
+        throttle_every: int = 0,
+        latency: float = 0.0,
+        article_size: int = 0,
+    ):
+        self.serve_feed = serve_feed
+        # Seconds every response is delayed by, simulating network and server time
+        self.latency = latency
+        # Approximate article body size in bytes; 0 serves minimal pages, larger
+        # values serve full pages with realistic chrome and generated content
+        self.article_size = article_size
+        self.requests_served = 0
+        # Answer every Nth article request with 429 and Retry-After: 1
+        self.throttle_every = throttle_every
+        self.article_requests = 0
+        self._lock = threading.Lock()
+        self.section_page_size = section_page_size
+        self.sidebar_limit = sidebar_limit
+        self.categories = [
+            {"id": self.FIRST_CATEGORY_ID + c, "title": f"Fixture Category {c + 1}"}
+            for c in range(categories)
+        ]
+        self.sections = [
+            {
+                "id": self.FIRST_SECTION_ID + len(self.categories) * s + c,
+                "title": f"Fixture Section {c + 1}.{s + 1}",
+                "category_id": category["id"],
+            }
+            for c, category in enumerate(self.categories)
+            for s in range(sections_per_category)
+        ]
+        # Articles are spread round-robin over the sections
+        self.articles = [
+            {
+                "id": self.FIRST_ARTICLE_ID + i,
+                "title": f"Fixture Article {i + 1}",
+                "section_id": self.sections[i % len(self.sections)]["id"],
+                "updated_at": "2025-01-01T00:00:00Z",
+                "revision": 1,
+            }
+            for i in range(articles)
+        ]
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def article_url(self, article: dict) -> str:
+        slug = article["title"].replace(" ", "-")
+        return f"{self.base_url}/hc/en-us/articles/{article['id']}-{slug}"
+
+    def listing_url(self, kind: str, item: dict) -> str:
+        slug = item["title"].replace(" ", "-").replace(".", "-")
+        return f"{self.base_url}/hc/en-us/{kind}/{item['id']}-{slug}"
+
+    def touch(self, index: int, updated_at: str):
+        """
+        Simulate an edit: bump an article's revision and feed timestamp.
+        """
+        self.articles[index]["revision"] += 1
+        self.articles[index]["updated_at"] = updated_at
+
+    def start(self) -> "FixtureSite":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def throttled(self) -> bool:
+        """
+        Count an article request and decide whether to throttle it.
+        """
+        with self._lock:
+            self.article_requests += 1
+            return bool(self.throttle_every) and (
+                self.article_requests % self.throttle_every == 0
+            )
+
+    def render_sidebar(self) -> str:
+        # With a sidebar limit, the remaining articles are only reachable
+        # through categories and sections
+        links = "".join(
+            f'<li><a href="{self.article_url(a)}">{a["title"]}</a></li>'
+            for a in self.articles[: self.sidebar_limit]
+        )
+        return (
+            "<html><head><title>Articles - OptiSigns</title></head><body>"
+            f'<ul class="knowledge-tree">{links}</ul></body></html>'
+        )
+
+    def render_home(self) -> str:
+        links = "".join(
+            f'<li><a href="{self.listing_url("categories", c)}">{c["title"]}</a></li>'
+            for c in self.categories
+        )
+        return (
+            "<html><head><title>OptiSigns Help Center</title></head><body>"
+            f'<ul class="blocks-list">{links}</ul></body></html>'
+        )
+
+    def render_category(self, category: dict) -> str:
+        links = "".join(
+            f'<li><a href="{self.listing_url("sections", s)}">{s["title"]}</a></li>'
+            for s in self.sections
+            if s["category_id"] == category["id"]
+        )
+        return (
+            f"<html><head><title>{category['title']} - OptiSigns</title></head><body>"
+            f'<ul class="section-tree">{links}</ul></body></html>'
+        )
+
+    def render_section(self, section: dict, page: int) -> str:
+        articles = [a for a in self.articles if a["section_id"] == section["id"]]
+        size = self.section_page_size
+        links = "".join(
+            f'<li><a href="{self.article_url(a)}">{a["title"]}</a></li>'
+            for a in articles[(page - 1) * size : page * size]
+        )
+        section_url = self.listing_url("sections", section)
+        pagination = ""
+        if page > 1:
+            pagination += (
+                f'<a href="{section_url}?page={page - 1}#articles">Previous</a>'
+            )
+        if page * size < len(articles):
+            pagination += f'<a href="{section_url}?page={page + 1}#articles">Next</a>'
+        return (
+            f"<html><head><title>{section['title']} - OptiSigns</title></head><body>"
+            f'<ul class="article-list">{links}</ul>'
+            f'<nav class="pagination">{pagination}</nav></body></html>'
+        )
+
+    def render_article(self, article: dict) -> str:
+        if self.article_size:
+            return self.render_full_article(article)
+        return (
+            f"<html><head><title>{article['title']} - OptiSigns</title></head><body>"
+            "<nav>Home</nav>"
+            f'<article class="article-body"><h1>{article["title"]}</h1>'
+            f"<p>Revision {article['revision']} of this fixture article.</p></article>"
+            "<footer>Footer</footer></body></html>"
+        )
+
+    def render_full_article(self, article: dict) -> str:
+        """
+        Render an article page shaped like the real help center: header
+        navigation, breadcrumbs, an inline script, vote and related-article
+        widgets and a footer around a body of about ``article_size`` bytes.
+        """
+        blocks = []
+        size = 0
+        index = article["id"] % len(ARTICLE_BLOCKS)
+        while size < self.article_size:
+            block = ARTICLE_BLOCKS[index % len(ARTICLE_BLOCKS)].replace(
+                "{n}", str(article["id"] * 100 + len(blocks))
+            )
+            blocks.append(block)
+            size += len(block)
+            index += 1
+        related = "".join(
+            f'<li><a href="{self.article_url(a)}">{a["title"]}</a></li>'
+            for a in self.articles[:5]
+        )
+        return (
+            f"<html><head><title>{article['title']} - OptiSigns</title>"
+            '<link rel="stylesheet" href="/hc/theming_assets/style.css">'
+            '<script>window.HelpCenter = {"account": "optisigns", "locale": "en-us"};'
+            "</script></head><body>"
+            '<a class="skip-navigation" href="#main-content">Skip to main content</a>'
+            '<header><nav><a href="/hc/en-us">Help Center</a>'
+            '<a href="https://app.optisigns.com">Sign in</a></nav></header>'
+            '<nav class="breadcrumbs"><a href="/hc/en-us">OptiSigns Help Center</a>'
+            '</nav><main id="main-content">'
+            f'<article class="article-body"><h1>{article["title"]}</h1>'
+            f"<p>Revision {article['revision']} of this fixture article.</p>"
+            f"{''.join(blocks)}</article>"
+            '<div class="article-votes">Was this article helpful?</div>'
+            f'<aside class="related-articles"><ul>{related}</ul></aside></main>'
+            "<footer>Powered by Zendesk</footer></body></html>"
+        )
+
+    def render_feed(self, page: int, per_page: int) -> str:
+        page_count = max(1, -(-len(self.articles) // per_page))
+        items = self.articles[(page - 1) * per_page : page * per_page]
+        return json.dumps(
+            {
+                "articles": [
+                    {
+                        "id": a["id"],
+                        "title": a["title"],
+                        "html_url": self.article_url(a),
+                        "updated_at": a["updated_at"],
+                        "draft": False,
+                    }
+                    for a in items
+                ],
+                "page": page,
+                "per_page": per_page,
+                "page_count": page_count,
+                "count": len(self.articles),
+            }
+        )
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: str, content_type: str):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                with site._lock:
+                    site.requests_served += 1
+                if site.latency:
+                    time.sleep(site.latency)
+
+                parsed = urlparse(self.path)
+                path = parsed.path.rstrip("/")
+                query = parse_qs(parsed.query)
+
+                if path.endswith("/articles.json") and site.serve_feed:
+                    page = int(query.get("page", ["1"])[0])
+                    per_page = int(query.get("per_page", ["30"])[0])
+                    self._send(
+                        200, site.render_feed(page, per_page), "application/json"
+                    )
+                elif path == "/hc/en-us":
+                    self._send(200, site.render_home(), "text/html")
+                elif path == "/hc/en-us/articles":
+                    self._send(200, site.render_sidebar(), "text/html")
+                elif path.startswith(("/hc/en-us/categories/", "/hc/en-us/sections/")):
+                    kind, item_id = path.split("/")[3], path.split("/")[4]
+                    items = site.categories if kind == "categories" else site.sections
+                    for item in items:
+                        if str(item["id"]) == item_id.split("-", 1)[0]:
+                            if kind == "categories":
+                                body = site.render_category(item)
+                            else:
+                                page = int(query.get("page", ["1"])[0])
+                                body = site.render_section(item, page)
+                            self._send(200, body, "text/html")
+                            return
+                    self._send(404, "Not found", "text/plain")
+                elif path.startswith("/hc/en-us/articles/") and site.throttled():
+                    self.send_response(429)
+                    self.send_header("Retry-After", "1")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                elif path.startswith("/hc/en-us/articles/"):
+                    article_id = path.rsplit("/", 1)[-1].split("-", 1)[0]
+                    for article in site.articles:
+                        if str(article["id"]) == article_id:
+                            self._send(200, site.render_article(article), "text/html")
+                            return
+                    self._send(404, "Not found", "text/plain")
+                else:
+                    self._send(404, "Not found", "text/plain")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local fixture help center.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument(
+        "--no-feed", action="store_true", help="Do not serve the JSON article feed."
+    )
+    parser.add_argument("--categories", type=int, default=2)
+    parser.add_argument("--sections-per-category", type=int, default=2)
+    parser.add_argument(
+        "--sidebar-limit",
+        type=int,
+        default=None,
+        help="List only this many articles in the sidebar.",
+    )
+    parser.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        help="Answer every Nth article request with 429 Too Many Requests.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Delay every response by this many seconds.",
+    )
+    parser.add_argument(
+        "--article-size",
+        type=int,
+        default=0,
+        help="Serve realistic article pages with bodies of about this many bytes.",
+    )
+    args = parser.parse_args()
+
+    site = FixtureSite(
+        articles=args.articles,
+        port=args.port,
+        serve_feed=not args.no_feed,
+        categories=args.categories,
+        sections_per_category=args.sections_per_category,
+        sidebar_limit=args.sidebar_limit,
+        throttle_every=args.throttle_every,
+        latency=args.latency,
+        article_size=args.article_size,
+    )
+    print(f"Serving fixture help center at {site.base_url} (Ctrl+C to stop)")
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ OptiSigns Scraper - Main Entry Point
 Wraps the scraper with enhanced logging, error handling, and scheduling support.
 """
 
+import argparse
 import asyncio
 import json
 import logging
@@ -14,15 +15,25 @@ from datetime import datetime
 from pathlib import Path
 
 from config import ScraperConfig, ScraperUtils
+from daemon import ScraperDaemon, parse_schedule
 from scraper import OptiSignsScraper
 
 
 class ScraperRunner:
     """Main runner class that wraps the scraper with enhanced functionality."""
 
-    def __init__(self):
+    def __init__(self, resume: bool = False, replay: bool = False):
+        # Continue an interrupted run from its checkpoint instead of starting over
+        self.resume = resume
+        # Re-convert cached raw pages instead of crawling
+        self.replay = replay
+
         # Setup logging system and track execution metrics
         self.setup_logging()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Start timing and statistics for a new crawl."""
         self.start_time = time.time()
         # Initialize statistics tracking for scraping operations
         self.stats = {
@@ -66,10 +77,44 @@ class ScraperRunner:
             pages_to_crawl=int(os.getenv("PAGES_TO_CRAWL", "30")),
             headless=os.getenv("HEADLESS", "true").lower() == "true",
             article_sort_method=os.getenv("SORT_METHOD", "alphabetical"),
+            discovery_mode=os.getenv("DISCOVERY_MODE", "feed"),
+            crawl_max_depth=int(os.getenv("CRAWL_MAX_DEPTH", "3")),
+            crawl_page_budget=int(os.getenv("CRAWL_PAGE_BUDGET", "500")),
             enable_incremental_updates=os.getenv("INCREMENTAL_UPDATES", "true").lower()
             == "true",
             force_update_all=os.getenv("FORCE_UPDATE_ALL", "false").lower() == "true",
+            tracker_backend=os.getenv("TRACKER_BACKEND", "json"),
+            skip_unchanged_writes=os.getenv("SKIP_UNCHANGED_WRITES", "true").lower()
+            == "true",
+            raw_cache=os.getenv("RAW_CACHE", "true").lower() == "true",
+            archive=os.getenv("ARCHIVE", "true").lower() == "true",
+            archive_dir=os.getenv("ARCHIVE_DIR", "archive"),
+            enable_conditional_requests=os.getenv(
+                "CONDITIONAL_REQUESTS", "true"
+            ).lower()
+            == "true",
             timeout=int(os.getenv("TIMEOUT", "60000")),
+            fetch_engine=os.getenv("FETCH_ENGINE", "auto"),
+            parser_backend=os.getenv("PARSER_BACKEND", "beautifulsoup"),
+            conversion_workers=(
+                int(os.getenv("CONVERSION_WORKERS"))
+                if os.getenv("CONVERSION_WORKERS")
+                else None
+            ),
+            readiness_strategy=os.getenv("READINESS_STRATEGY", "selector"),
+            content_selector=os.getenv("CONTENT_SELECTOR", ".article-body"),
+            readiness_timeout=int(os.getenv("READINESS_TIMEOUT", "5000")),
+            block_resources=os.getenv("BLOCK_RESOURCES", "true").lower() == "true",
+            concurrency=int(os.getenv("CONCURRENCY", "4")),
+            per_host_limit=int(os.getenv("PER_HOST_LIMIT", "4")),
+            rate_limit=os.getenv("RATE_LIMIT", "true").lower() == "true",
+            rate_initial=float(os.getenv("RATE_INITIAL", "2.0")),
+            rate_max=float(os.getenv("RATE_MAX", "20.0")),
+            fetch_retries=int(os.getenv("FETCH_RETRIES", "2")),
+            breaker_failure_threshold=float(
+                os.getenv("BREAKER_FAILURE_THRESHOLD", "0.5")
+            ),
+            breaker_cooldown=float(os.getenv("BREAKER_COOLDOWN", "30")),
         )
 
     def calculate_stats(self, scraper: OptiSignsScraper):
@@ -107,12 +152,38 @@ class ScraperRunner:
                 "base_url": scraper.config.base_url,
                 "output_dir": str(scraper.config.output_dir),
                 "pages_to_crawl": scraper.config.pages_to_crawl,
+                "discovery_mode": scraper.config.discovery_mode,
                 "incremental_updates": scraper.config.enable_incremental_updates,
                 "force_update_all": scraper.config.force_update_all,
+                "resume": self.resume,
+                "replay": self.replay,
+                "raw_cache": scraper.config.raw_cache,
+                "archive": scraper.config.archive,
+                "tracker_backend": scraper.config.tracker_backend,
+                "skip_unchanged_writes": scraper.config.skip_unchanged_writes,
+                "fetch_engine": scraper.config.fetch_engine,
+                "readiness_strategy": scraper.config.readiness_strategy,
+                "parser_backend": scraper.config.parser_backend,
+                "conversion_workers": scraper.config.conversion_workers,
+                "concurrency": scraper.config.concurrency,
+                "per_host_limit": scraper.config.per_host_limit,
+                "rate_limit": scraper.config.rate_limit,
             },
             "new_articles": list(scraper.article_tracker.new_articles),
             "updated_articles": list(scraper.article_tracker.updated_articles),
             "total_articles_found": len(scraper.article_urls),
+            "resumed_articles": scraper.resumed_articles,
+            "site_crawl": scraper.site_crawl.stats,
+            "failed_articles": scraper.article_tracker.failed_this_run,
+            "circuit_breaker": scraper.circuit_breaker.stats(),
+            "rate_limiter": scraper.fetcher.rate_limiter.stats(),
+            "fetch_engines": scraper.fetch_engines,
+            "file_writes": scraper.writer.stats(),
+            "raw_cache": scraper.raw_cache.stats(),
+            "archive": scraper.archive_result,
+            "resource_filter": scraper.fetcher.resource_filter_stats(),
+            "time_to_ready_ms": scraper.ready_times,
+            "metrics": scraper.metrics.summary(),
             "environment": {"python_version": sys.version, "platform": sys.platform},
         }
 
@@ -132,6 +203,22 @@ class ScraperRunner:
             with open(latest_file, "w", encoding="utf-8") as f:
                 json.dump(artifact, f, indent=2, ensure_ascii=False)
 
+            # Export phase timings and counters for Prometheus (node_exporter
+            # textfile collector)
+            metrics_file = Path(
+                os.getenv("METRICS_TEXTFILE", str(artifact_dir / "scraper.prom"))
+            )
+            scraper.metrics.write_prometheus(
+                metrics_file,
+                {
+                    "run_success": int(success),
+                    "articles_added": self.stats["added"],
+                    "articles_updated": self.stats["updated"],
+                    "articles_failed": len(scraper.article_tracker.failed_this_run),
+                },
+            )
+            self.logger.info(f"Metrics written: {metrics_file}")
+
         except Exception as e:
             self.logger.error(f"Failed to save run artifact: {e}")
 
@@ -163,7 +250,10 @@ class ScraperRunner:
 
             # Initialize and run the core scraper
             scraper = OptiSignsScraper(config)
-            await scraper.run()
+            if self.replay:
+                await scraper.replay()
+            else:
+                await scraper.run(resume=self.resume)
 
             # Calculate processing statistics
             self.calculate_stats(scraper)
@@ -191,11 +281,89 @@ class ScraperRunner:
 
             return 1
 
+    async def crawl_and_report(self, scraper: OptiSignsScraper, resume: bool) -> bool:
+        """Run one crawl on a started scraper and record its artifact."""
+        self.reset_stats()
+        try:
+            await scraper.crawl(resume=resume)
+        except Exception as e:
+            self.stats["errors"] = 1
+            self.logger.error(f"Scraping failed: {e}", exc_info=True)
+            self.save_run_artifact(scraper, False)
+            return False
+
+        self.calculate_stats(scraper)
+        self.save_run_artifact(scraper, True)
+        self.log_summary()
+        return True
+
+    async def serve(self):
+        """
+        Service mode: keep the browser and tracker loaded and crawl on a
+        schedule (SCHEDULE, cron expression or interval such as "every 30m")
+        plus on-demand triggers over a local HTTP endpoint.
+        """
+        self.logger.info("Starting OptiSigns scraper service...")
+        try:
+            config = self.get_config()
+            schedule = parse_schedule(os.getenv("SCHEDULE", "0 2 * * *"))
+        except ValueError as e:
+            self.logger.error(f"Invalid service configuration: {e}")
+            return 1
+
+        # Startup cost (imports, tracker load, browser launch) is paid once here
+        scraper = OptiSignsScraper(config)
+        await scraper.start(
+            warm_browser=os.getenv("WARM_BROWSER", "true").lower() == "true"
+        )
+
+        # Only the first crawl may resume an interrupted run
+        pending_resume = [self.resume]
+
+        async def crawl() -> bool:
+            resume, pending_resume[0] = pending_resume[0], False
+            return await self.crawl_and_report(scraper, resume)
+
+        daemon = ScraperDaemon(
+            crawl,
+            schedule,
+            jitter=float(os.getenv("SCHEDULE_JITTER", "300")),
+            trigger_host=os.getenv("TRIGGER_HOST", "127.0.0.1"),
+            trigger_port=int(os.getenv("TRIGGER_PORT", "8765")),
+        )
+        try:
+            await daemon.run()
+        finally:
+            await scraper.close()
+        return 0
+
 
 def main():
     """Entry point for the application."""
-    runner = ScraperRunner()
-    exit_code = asyncio.run(runner.run())
+    parser = argparse.ArgumentParser(description="Scrape OptiSigns support articles.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run from its checkpoint, skipping discovery and finished articles.",
+    )
+    # Replay runs once offline, so it cannot be combined with the service
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a long-lived service with a warm browser, crawling on SCHEDULE and on POST /trigger.",
+    )
+    mode.add_argument(
+        "--replay",
+        action="store_true",
+        help="Regenerate markdown from the raw page cache with the current conversion settings, without network access.",
+    )
+    args = parser.parse_args()
+    if args.replay and args.resume:
+        parser.error("argument --resume: not allowed with argument --replay")
+
+    runner = ScraperRunner(resume=args.resume, replay=args.replay)
+    exit_code = asyncio.run(runner.serve() if args.serve else runner.run())
     sys.exit(exit_code)
 
 
@@ -0,0 +1,197 @@
+import functools
+import math
+import os
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RunMetrics:
+    """
+    Lightweight per-run instrumentation: durations per phase (fetch,
+    navigation, readiness, parse, convert, save, ...), bytes fetched and page
+    throughput. Summaries go into the run artifact and a Prometheus textfile.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Drop everything measured so far and restart the run clock.
+        """
+        self.durations = defaultdict(list)
+        self.bytes_fetched = 0
+        self.pages_fetched = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def finish(self):
+        """
+        Stop the run clock so throughput covers only the run itself.
+        """
+        self.finished = time.perf_counter()
+
+    def observe(self, phase: str, seconds: float):
+        self.durations[phase].append(seconds)
+
+    @contextmanager
+    def time(self, phase: str):
+        """
+        Time the enclosed block as one observation of the phase.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - started)
+
+    def record_response(self, size: int, timings: dict[str, float] = None):
+        """
+        Record one engine response: its body size (a page is counted when it
+        has a body) and the engine's own phase timings.
+        """
+        if size:
+            self.pages_fetched += 1
+            self.bytes_fetched += size
+        for phase, seconds in (timings or {}).items():
+            self.observe(phase, seconds)
+
+    def summary(self) -> dict:
+        """
+        Per-phase count, total, p50, p95 and max (milliseconds) plus fetch
+        volume and throughput.
+        """
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        phases = {}
+        for phase, values in sorted(self.durations.items()):
+            ordered = sorted(values)
+            phases[phase] = {
+                "count": len(ordered),
+                "total_ms": round(sum(ordered) * 1000, 1),
+                "p50_ms": round(percentile(ordered, 0.5) * 1000, 1),
+                "p95_ms": round(percentile(ordered, 0.95) * 1000, 1),
+                "max_ms": round(ordered[-1] * 1000, 1),
+            }
+        return {
+            "phases": phases,
+            "pages_fetched": self.pages_fetched,
+            "bytes_fetched": self.bytes_fetched,
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_second": (
+                round(self.pages_fetched / elapsed, 2) if elapsed > 0 else 0.0
+            ),
+        }
+
+    def write_prometheus(self, path: Path, extra_gauges: dict[str, float] = None):
+        """
+        Write the summary in the Prometheus text exposition format, e.g. for
+        the node_exporter textfile collector. The file is replaced atomically
+        so the collector never reads a partial file.
+
+        Args:
+            path: Target .prom file
+            extra_gauges: Further run gauges, e.g. article counts, name -> value
+        """
+        summary = self.summary()
+        lines = [
+            "# HELP scraper_phase_duration_seconds Duration of scraper phases in the last run.",
+            "# TYPE scraper_phase_duration_seconds summary",
+        ]
+        for phase, values in sorted(self.durations.items()):
+            ordered = sorted(values)
+            for quantile in (0.5, 0.95):
+                lines.append(
+                    f'scraper_phase_duration_seconds{{phase="{phase}",quantile="{quantile}"}} {percentile(ordered, quantile):.6f}'
+                )
+            lines.append(
+                f'scraper_phase_duration_seconds_sum{{phase="{phase}"}} {sum(ordered):.6f}'
+            )
+            lines.append(
+                f'scraper_phase_duration_seconds_count{{phase="{phase}"}} {len(ordered)}'
+            )
+        lines += [
+            "# HELP scraper_phase_duration_max_seconds Slowest observation per phase in the last run.",
+            "# TYPE scraper_phase_duration_max_seconds gauge",
+        ]
+        for phase, values in sorted(self.durations.items()):
+            lines.append(
+                f'scraper_phase_duration_max_seconds{{phase="{phase}"}} {max(values):.6f}'
+            )
+
+        gauges = {
+            "scraper_pages_fetched": (
+                "Pages fetched in the last run.",
+                summary["pages_fetched"],
+            ),
+            "scraper_fetched_bytes": (
+                "Body bytes fetched in the last run.",
+                summary["bytes_fetched"],
+            ),
+            "scraper_pages_per_second": (
+                "Page fetch throughput of the last run.",
+                summary["pages_per_second"],
+            ),
+            "scraper_run_duration_seconds": (
+                "Wall-clock duration of the last run.",
+                summary["elapsed_seconds"],
+            ),
+            "scraper_last_run_timestamp_seconds": (
+                "Unix time the last run finished.",
+                round(time.time()),
+            ),
+        }
+        for name, value in (extra_gauges or {}).items():
+            gauges[f"scraper_{name}"] = (
+                f"{name.replace('_', ' ').capitalize()} in the last run.",
+                value,
+            )
+        for name, (help_text, value) in gauges.items():
+            lines += [
+                f"# HELP {name} {help_text}",
+                f"# TYPE {name} gauge",
+                f"{name} {value}",
+            ]
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        try:
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+
+def timed(phase: str):
+    """
+    Decorator timing an async method as one observation of the phase in the
+    instance's ``metrics``.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            with self.metrics.time(phase):
+                return await method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
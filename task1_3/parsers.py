@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+HTML parser backends used for link discovery, selector pruning and title extraction.
+
+Run directly to check that the backends agree on saved HTML pages:
+    python parsers.py page1.html page2.html
+"""
+
+import sys
+
+from bs4 import BeautifulSoup
+from config import DEFAULT_UNWANTED_SELECTORS, ScraperUtils
+from selectolax.lexbor import LexborHTMLParser
+
+
+class ParsedPage:
+    """A parsed HTML document exposing the operations the scraper needs."""
+
+    def title(self) -> str | None:
+        """
+        Return the text of the <title> tag, or None if there is none.
+        """
+        raise NotImplementedError
+
+    def links(self, scope_selector: str = None) -> list[str] | None:
+        """
+        Return the href of every link inside the first element matching
+        ``scope_selector`` (the whole document when omitted).
+        Returns None when the scope selector matches nothing.
+        """
+        raise NotImplementedError
+
+    def content_html(self, unwanted_selectors: list[str]) -> str | None:
+        """
+        Remove unwanted elements from the body and return it serialized,
+        or None when the document has no body.
+        """
+        raise NotImplementedError
+
+
+class SoupPage(ParsedPage):
+    def __init__(self, html: str, features: str):
+        self.soup = BeautifulSoup(html, features)
+
+    def title(self) -> str | None:
+        title_tag = self.soup.find("title")
+        return title_tag.get_text() if title_tag else None
+
+    def links(self, scope_selector: str = None) -> list[str] | None:
+        scope = self.soup.select_one(scope_selector) if scope_selector else self.soup
+        if scope is None:
+            return None
+        return [link["href"] for link in scope.find_all("a", href=True)]
+
+    def content_html(self, unwanted_selectors: list[str]) -> str | None:
+        body = self.soup.body
+        if body is None:
+            return None
+        for selector in unwanted_selectors:
+            for unwanted in body.select(selector):
+                unwanted.decompose()
+        return str(body)
+
+
+class LexborPage(ParsedPage):
+    def __init__(self, html: str):
+        self.tree = LexborHTMLParser(html)
+
+    def title(self) -> str | None:
+        title_tag = self.tree.css_first("title")
+        return title_tag.text() if title_tag else None
+
+    def links(self, scope_selector: str = None) -> list[str] | None:
+        scope = self.tree.css_first(scope_selector) if scope_selector else self.tree
+        if scope is None:
+            return None
+        # A valueless href is None here but "" in BeautifulSoup
+        return [link.attributes.get("href") or "" for link in scope.css("a[href]")]
+
+    def content_html(self, unwanted_selectors: list[str]) -> str | None:
+        body = self.tree.body
+        if body is None:
+            return None
+        for selector in unwanted_selectors:
+            for unwanted in body.css(selector):
+                unwanted.decompose()
+        # The HTML serializer escapes U+00A0 as &nbsp;, BeautifulSoup keeps the
+        # character; undo it so both backends produce identical markdown
+        return body.html.replace("&nbsp;", "\u00a0")
+
+
+class ParserBackend:
+    """Builds ParsedPage objects for one parsing library."""
+
+    name = "base"
+
+    def parse(self, html: str) -> ParsedPage:
+        raise NotImplementedError
+
+
+class BeautifulSoupBackend(ParserBackend):
+    """BeautifulSoup with the pure-Python html.parser (original behaviour)."""
+
+    name = "beautifulsoup"
+
+    def parse(self, html: str) -> ParsedPage:
+        return SoupPage(html, "html.parser")
+
+
+class SelectolaxBackend(ParserBackend):
+    """selectolax on the lexbor engine: a C parser with CSS selector support."""
+
+    name = "selectolax"
+
+    def parse(self, html: str) -> ParsedPage:
+        return LexborPage(html)
+
+
+PARSER_BACKENDS = {
+    backend.name: backend for backend in (BeautifulSoupBackend, SelectolaxBackend)
+}
+
+
+def get_parser_backend(name: str) -> ParserBackend:
+    """
+    Return the parser backend registered under ``name``.
+    """
+    return PARSER_BACKENDS[name]()
+
+
+def check_parity(html: str, unwanted_selectors: list[str]) -> list[str]:
+    """
+    Compare every backend against BeautifulSoup on one document.
+
+    Returns:
+        list: Descriptions of the aspects where a backend disagrees
+    """
+
+    def to_markdown(content: str | None) -> str | None:
+        # html2text converters keep state between documents, so each
+        # conversion gets a fresh one
+        if not content:
+            return None
+        return ScraperUtils.create_html2text_converter().handle(content)
+
+    reference = BeautifulSoupBackend().parse(html)
+    reference_content = reference.content_html(unwanted_selectors)
+    expected = {
+        "title": reference.title(),
+        "links": reference.links(),
+        "markdown": to_markdown(reference_content),
+    }
+
+    mismatches = []
+    for name, backend_class in PARSER_BACKENDS.items():
+        page = backend_class().parse(html)
+        content = page.content_html(unwanted_selectors)
+        actual = {
+            "title": page.title(),
+            "links": page.links(),
+            "markdown": to_markdown(content),
+        }
+        for aspect, value in expected.items():
+            if actual[aspect] != value:
+                mismatches.append(f"{name}: {aspect} differs")
+    return mismatches
+
+
+if __name__ == "__main__":
+    failures = 0
+    for path in sys.argv[1:]:
+        with open(path, "r", encoding="utf-8") as f:
+            mismatches = check_parity(f.read(), DEFAULT_UNWANTED_SELECTORS)
+        print(f"{path}: {'OK' if not mismatches else ', '.join(mismatches)}")
+        failures += bool(mismatches)
+    sys.exit(1 if failures else 0)
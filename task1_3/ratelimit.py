@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import email.utils
+import time
+from urllib.parse import urlparse
+
+from config import ScraperConfig, ScraperUtils
+
+# Status codes signalling that the server wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date.
+
+    Returns:
+        float: Seconds to wait, or None when the header is absent or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+class HostRateController:
+    """
+    Token bucket for one host whose refill rate is tuned by AIMD: every healthy
+    response adds a fixed amount to the rate, while throttling (429/503) halves
+    it and a slow response trims it. A Retry-After header pauses the host
+    until the given time.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.rate = config.rate_initial
+        self.tokens = 1.0
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+        # Counters reported in the run artifact
+        self.requests = 0
+        self.throttle_events = 0
+        self.slow_responses = 0
+        self.retry_after_seconds = 0.0
+        self.min_rate_seen = self.rate
+        self.max_rate_seen = self.rate
+
+    def _refill(self, now: float):
+        self.tokens = min(
+            self.config.rate_burst, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """
+        Wait until the host may receive another request.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    self.requests += 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def record(self, status: int | None, latency: float, retry_after: float = None):
+        """
+        Adjust the rate from the outcome of one request.
+
+        Args:
+            status: HTTP status, or None when the request failed outright
+            latency: Seconds the request took
+            retry_after: Seconds requested by a Retry-After header
+        """
+        config = self.config
+        if status in THROTTLE_STATUSES:
+            self.throttle_events += 1
+            self.rate = max(config.rate_min, self.rate * 0.5)
+            self.tokens = 0.0
+            if retry_after is not None:
+                wait = min(retry_after, config.max_retry_after)
+                self.retry_after_seconds += wait
+                self._blocked_until = max(self._blocked_until, time.monotonic() + wait)
+        elif status is None or latency > config.rate_latency_target:
+            self.slow_responses += 1
+            self.rate = max(config.rate_min, self.rate * 0.8)
+        else:
+            self.rate = min(config.rate_max, self.rate + config.rate_increase)
+
+        self.min_rate_seen = min(self.min_rate_seen, self.rate)
+        self.max_rate_seen = max(self.max_rate_seen, self.rate)
+
+    def stats(self) -> dict:
+        return {
+            "current_rate": round(self.rate, 2),
+            "min_rate": round(self.min_rate_seen, 2),
+            "max_rate": round(self.max_rate_seen, 2),
+            "requests": self.requests,
+            "throttle_events": self.throttle_events,
+            "slow_responses": self.slow_responses,
+            "retry_after_seconds": round(self.retry_after_seconds, 1),
+        }
+
+
+class RateLimiter:
+    """Adaptive per-host request rate control shared by all fetch engines."""
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self._hosts = {}
+
+    def _controller(self, url: str) -> HostRateController:
+        host = urlparse(url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = HostRateController(self.config)
+        return self._hosts[host]
+
+    async def acquire(self, url: str):
+        if self.config.rate_limit:
+            await self._controller(url).acquire()
+
+    def record(
+        self, url: str, status: int | None, latency: float, headers: dict = None
+    ):
+        if not self.config.rate_limit:
+            return
+        retry_after = parse_retry_after((headers or {}).get("retry-after"))
+        controller = self._controller(url)
+        controller.record(status, latency, retry_after)
+        if status in THROTTLE_STATUSES:
+            print(
+                f"{ScraperUtils.format_datetime()} Throttled by {urlparse(url).netloc} (status {status}), rate lowered to {controller.rate:.2f} req/s"
+                + (f", waiting {retry_after:.0f}s" if retry_after is not None else "")
+            )
+
+    def stats(self) -> dict:
+        return {host: controller.stats() for host, controller in self._hosts.items()}
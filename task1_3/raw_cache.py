@@ -0,0 +1,170 @@
+import asyncio
+import json
+import sqlite3
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import zstandard
+
+
+class RawResponseCache:
+    """
+    Store of raw article responses, keyed by URL and fetch time, so markdown
+    can be regenerated offline after changing the cleaning or conversion
+    settings. Bodies are zstd-compressed into a SQLite database (WAL mode);
+    only the newest ``keep`` responses per URL are retained and inserts are
+    committed in batches. During a crawl, compression and database writes run
+    on a dedicated thread (store_async, commit_async) so they never block the
+    event loop.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        keep: int = 3,
+        level: int = 10,
+        commit_every: int = 50,
+    ):
+        self.db_path = Path(db_path)
+        self.keep = keep
+        self.commit_every = commit_every
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._conn = None
+        self._pending = 0
+        self._executor = None
+
+        # Counters reported in the run artifact
+        self.stored = 0
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+
+    def open(self):
+        """
+        Open (and create if needed) the cache database.
+        """
+        if self._conn is not None:
+            return
+        # Written from the cache thread, read from the caller's thread
+        # during replay; the two never overlap
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+                url TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                status INTEGER,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (url, fetched_at)
+            )""")
+        self._conn.commit()
+
+    def store(self, url: str, status: int | None, headers: dict, html: str):
+        """
+        Compress and record one response, dropping versions beyond ``keep``.
+        """
+        self.open()
+        raw = html.encode("utf-8")
+        body = self._compressor.compress(raw)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (url, fetched_at, status, headers, body) VALUES (?, ?, ?, ?, ?)",
+            (url, time.time(), status, json.dumps(headers), body),
+        )
+        self._conn.execute(
+            """DELETE FROM responses WHERE url = ? AND fetched_at NOT IN (
+                SELECT fetched_at FROM responses WHERE url = ?
+                ORDER BY fetched_at DESC LIMIT ?)""",
+            (url, url, self.keep),
+        )
+        self.stored += 1
+        self.raw_bytes += len(raw)
+        self.compressed_bytes += len(body)
+
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    @property
+    def pending(self) -> int:
+        """
+        Responses stored since the last commit.
+        """
+        return self._pending
+
+    async def _run(self, func, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="raw-cache"
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+
+    async def store_async(self, url: str, status: int | None, headers: dict, html: str):
+        """
+        store() on the cache thread.
+        """
+        await self._run(self.store, url, status, headers, html)
+
+    async def commit_async(self):
+        """
+        commit() on the cache thread, after every store queued before it.
+        """
+        if self._pending:
+            await self._run(self.commit)
+
+    def latest(self) -> Iterator[dict]:
+        """
+        Yield the newest stored response of every URL, ordered by URL.
+
+        Yields:
+            dict: url, fetched_at, status, headers and the decompressed html
+        """
+        self.open()
+        rows = self._conn.execute(
+            """SELECT r.url, r.fetched_at, r.status, r.headers, r.body
+            FROM responses r
+            JOIN (SELECT url, MAX(fetched_at) AS newest FROM responses GROUP BY url) n
+                ON r.url = n.url AND r.fetched_at = n.newest
+            ORDER BY r.url"""
+        )
+        for url, fetched_at, status, headers, body in rows:
+            yield {
+                "url": url,
+                "fetched_at": fetched_at,
+                "status": status,
+                "headers": json.loads(headers),
+                "html": self._decompressor.decompress(body).decode("utf-8"),
+            }
+
+    def stats(self) -> dict:
+        return {
+            "stored": self.stored,
+            "raw_bytes": self.raw_bytes,
+            "compressed_bytes": self.compressed_bytes,
+            "compression_ratio": (
+                round(self.raw_bytes / self.compressed_bytes, 2)
+                if self.compressed_bytes
+                else None
+            ),
+        }
+
+    def commit(self):
+        """
+        Commit pending inserts to disk.
+        """
+        if self._conn is not None:
+            self._conn.commit()
+        self._pending = 0
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._conn is not None:
+            self.commit()
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,113 @@
+from config import ScraperConfig, ScraperUtils
+
+# Resolves once the DOM has seen no mutations for quietMs, or after timeoutMs
+MUTATION_QUIESCENCE_JS = """
+([quietMs, timeoutMs]) => new Promise((resolve) => {
+    let finished = false;
+    let quietTimer = null;
+    const observer = new MutationObserver(() => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(finish, quietMs);
+    });
+    const hardStop = setTimeout(finish, timeoutMs);
+    function finish() {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(hardStop);
+        resolve();
+    }
+    observer.observe(document, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+    quietTimer = setTimeout(finish, quietMs);
+})
+"""
+
+
+class ReadinessStrategy:
+    """Decides when a navigated page is ready to be captured."""
+
+    name = "base"
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+
+    async def wait(self, page, url: str, selector: str = None):
+        """
+        Wait until the page is ready. Timeouts are not errors: the page is
+        captured as-is once the upper bound is reached.
+        """
+        try:
+            await self._wait(page, selector)
+        except Exception as e:
+            print(
+                f"{ScraperUtils.format_datetime()} Readiness '{self.name}' not reached for {url} within {self.config.readiness_timeout} ms: {e}"
+            )
+
+    async def _wait(self, page, selector: str = None):
+        raise NotImplementedError
+
+
+class SelectorReadiness(ReadinessStrategy):
+    """Ready once the content selector is attached to the DOM."""
+
+    name = "selector"
+
+    async def _wait(self, page, selector: str = None):
+        await page.wait_for_selector(
+            selector or self.config.content_selector,
+            state="attached",
+            timeout=self.config.readiness_timeout,
+        )
+
+
+class MutationReadiness(ReadinessStrategy):
+    """Ready once the DOM stops changing for ``mutation_quiet_ms``."""
+
+    name = "mutation"
+
+    async def _wait(self, page, selector: str = None):
+        await page.evaluate(
+            MUTATION_QUIESCENCE_JS,
+            [self.config.mutation_quiet_ms, self.config.readiness_timeout],
+        )
+
+
+class NetworkIdleReadiness(ReadinessStrategy):
+    """Ready once the network has been idle, bounded by the readiness timeout."""
+
+    name = "networkidle"
+
+    async def _wait(self, page, selector: str = None):
+        await page.wait_for_load_state(
+            "networkidle", timeout=self.config.readiness_timeout
+        )
+
+
+class FixedDelayReadiness(ReadinessStrategy):
+    """Legacy behaviour: always wait a fixed 1500 ms."""
+
+    name = "fixed"
+
+    async def _wait(self, page, selector: str = None):
+        await page.wait_for_timeout(1500)
+
+
+READINESS_STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (
+        SelectorReadiness,
+        MutationReadiness,
+        NetworkIdleReadiness,
+        FixedDelayReadiness,
+    )
+}
+
+
+def create_readiness_strategy(config: ScraperConfig) -> ReadinessStrategy:
+    """
+    Build the readiness strategy selected in the configuration.
+    """
+    return READINESS_STRATEGIES[config.readiness_strategy](config)
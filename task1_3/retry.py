@@ -0,0 +1,131 @@
+import asyncio
+import random
+import time
+from collections import deque
+
+import httpx
+from config import ScraperConfig, ScraperUtils
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from ratelimit import THROTTLE_STATUSES
+
+# Statuses of a struggling site: timeouts, throttling and transient server errors
+TRANSIENT_STATUSES = (408, 425, 429, 500, 502, 503, 504)
+# Statuses retried here; throttling is already retried by the fetcher, which
+# honours Retry-After
+RETRYABLE_STATUSES = tuple(
+    status for status in TRANSIENT_STATUSES if status not in THROTTLE_STATUSES
+)
+
+
+class RetryPolicy:
+    """
+    Decides which fetch failures are transient and how long to wait before
+    the next attempt (exponential backoff with full jitter).
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+
+    @staticmethod
+    def is_retryable_error(error: Exception) -> bool:
+        if isinstance(error, (httpx.TimeoutException, httpx.TransportError)):
+            return True
+        if isinstance(error, (asyncio.TimeoutError, PlaywrightTimeoutError)):
+            return True
+        # Network-level browser failures; a missing or broken browser is not transient
+        if isinstance(error, PlaywrightError):
+            return "net::ERR_" in str(error)
+        return False
+
+    @staticmethod
+    def is_transient_status(status: int | None) -> bool:
+        return status in TRANSIENT_STATUSES
+
+    @staticmethod
+    def is_retryable_status(status: int | None) -> bool:
+        return status in RETRYABLE_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Seconds to wait after the given failed attempt (0-based).
+        """
+        ceiling = min(
+            self.config.retry_backoff_max,
+            self.config.retry_backoff_base * 2**attempt,
+        )
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Fails fetches fast once too many recent requests failed.
+
+    The breaker watches a sliding window of outcomes. When the failure rate
+    crosses the threshold it opens and rejects fetches for a cool-down period;
+    afterwards a single probe is let through and its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.state = "closed"
+        self._outcomes = deque(maxlen=config.breaker_window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """
+        Whether a fetch may go ahead now.
+        """
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.config.breaker_cooldown:
+                self.rejected += 1
+                return False
+            self.state = "half_open"
+        # Half-open: only one probe at a time
+        if self._probe_in_flight:
+            self.rejected += 1
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def record(self, success: bool):
+        if self.state == "half_open":
+            self._probe_in_flight = False
+            if success:
+                print(
+                    f"{ScraperUtils.format_datetime()} Circuit breaker closed: probe request succeeded"
+                )
+                self.state = "closed"
+                self._outcomes.clear()
+            else:
+                self._open("probe request failed")
+            return
+
+        self._outcomes.append(success)
+        failures = self._outcomes.count(False)
+        if (
+            len(self._outcomes) >= self.config.breaker_min_requests
+            and failures / len(self._outcomes) >= self.config.breaker_failure_threshold
+        ):
+            self._open(f"{failures} of the last {len(self._outcomes)} requests failed")
+
+    def _open(self, reason: str):
+        self.state = "open"
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        print(
+            f"{ScraperUtils.format_datetime()} Circuit breaker opened ({reason}); failing fast for {self.config.breaker_cooldown:.0f}s"
+        )
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "times_opened": self.times_opened,
+            "rejected_requests": self.rejected,
+        }
@@ -1,9 +1,18 @@
 import asyncio
+from pathlib import Path
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from archive import SnapshotArchive
+from checkpoint import RunCheckpoint
 from config import ArticleTracker, ScraperConfig, ScraperUtils
-from playwright.async_api import async_playwright
+from conversion import ConversionStage
+from discovery import ArticleFeedDiscovery, SiteCrawlDiscovery
+from fetchers import Fetcher, FetchResult
+from metrics import RunMetrics, timed
+from parsers import ParsedPage, get_parser_backend
+from raw_cache import RawResponseCache
+from retry import CircuitBreaker, RetryPolicy
+from writer import ArticleWriter
 
 
 class OptiSignsScraper:
@@ -18,14 +27,53 @@ class OptiSignsScraper:
         # Initialize article tracking for incremental updates
         self.article_tracker = ArticleTracker(config)
 
-        # Create HTML to markdown converter with custom settings
-        self.h2t = ScraperUtils.create_html2text_converter()
+        # Create HTML parser backend for discovery and the CPU stage that
+        # converts articles to markdown in worker processes
+        self.parser = get_parser_backend(config.parser_backend)
+        self.conversion = ConversionStage(config)
+
+        # Background thread writing markdown files atomically, skipping unchanged ones
+        self.writer = ArticleWriter(config)
+
+        # Compressed raw article responses, replayed offline by replay()
+        self.raw_cache = RawResponseCache(
+            config.raw_cache_db, keep=config.raw_cache_keep
+        )
+
+        # Deduplicated history of every run's article versions
+        self.archive = SnapshotArchive(config.archive_dir)
+        self.archive_result = None
 
         # Ensure the output directory exists
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Store discovered article URLs
+        # Store discovered article URLs and their feed updated_at timestamps
         self.article_urls = set()
+        self.article_updated_at = {}
+        # Per-phase timings, bytes fetched and throughput of the current run
+        self.metrics = RunMetrics()
+
+        # Fetch engine layer (HTTP first, browser fallback) and engine used per URL
+        self.fetcher = Fetcher(config, self.metrics)
+        self.fetch_engines = {}
+        self.ready_times = {}
+
+        # Discovery shares the fetcher's per-host rate control
+        self.feed_discovery = ArticleFeedDiscovery(config, self.fetcher.rate_limiter)
+        self.site_crawl = SiteCrawlDiscovery(
+            config, self.parser, self._fetch_page_content
+        )
+
+        # Retry policy for transient fetch failures and a circuit breaker that
+        # fails fast during site-wide outages
+        self.retry_policy = RetryPolicy(config)
+        self.circuit_breaker = CircuitBreaker(config)
+
+        # Journal of planned and finished articles for resuming interrupted runs
+        self.checkpoint = RunCheckpoint(config)
+        self.resumed_articles = 0
+        # Finished articles waiting for their cached pages to be committed
+        self._pending_marks = []
 
         # Display initialization information
         print(f"{ScraperUtils.format_datetime()} Scraper initialized with settings:")
@@ -33,34 +81,178 @@ class OptiSignsScraper:
         print(f"  Output Directory: {self.config.output_dir}")
         print(f"  Articles to Process: {self.config.pages_to_crawl}")
         print(f"  Article Sort Method: {self.config.article_sort_method}")
+        print(f"  Discovery Mode: {self.config.discovery_mode}")
         print(f"  Incremental Updates: {self.config.enable_incremental_updates}")
         print(f"  Force Update All: {self.config.force_update_all}")
         print(f"  Headless Mode: {self.config.headless}")
+        print(f"  Fetch Engine: {self.config.fetch_engine}")
+        print(f"  Readiness Strategy: {self.config.readiness_strategy}")
+        print(f"  Parser Backend: {self.config.parser_backend}")
+        print(f"  Conversion Workers: {self.config.conversion_workers}")
+        print(f"  Concurrency: {self.config.concurrency}")
+        print(f"  Per-host Limit: {self.config.per_host_limit}")
+        print(f"  Adaptive Rate Limit: {self.config.rate_limit}")
         print(
             f"  Previously processed articles: {len(self.article_tracker.processed_articles)}\n"
         )
 
-    async def _fetch_page_content(self, page, url: str) -> str | None:
+    @timed("fetch")
+    async def _fetch_page_content(
+        self,
+        url: str,
+        markers: list[str] = None,
+        headers: dict = None,
+        ready_selector: str = None,
+    ) -> FetchResult:
         """
-        Navigates to a URL and returns its HTML content.
-        Handles common HTTP headers for better scraping behavior.
+        Fetches a URL through the configured fetch engine(s).
+        Transient failures are retried with exponential backoff; while the
+        circuit breaker is open, fetches fail immediately. Failures are
+        reported and returned as a result without HTML, with the reason set.
         """
-        try:
-            # Set browser headers to appear more like a real browser
-            await page.set_extra_http_headers(self.config.http_headers)
-            await page.goto(
-                url, wait_until="domcontentloaded", timeout=self.config.timeout
+        for attempt in range(self.config.fetch_retries + 1):
+            if not self.circuit_breaker.allow():
+                result = FetchResult(url=url, error="circuit breaker open")
+                break
+
+            try:
+                result = await self.fetcher.fetch(url, markers, headers, ready_selector)
+            except Exception as e:
+                self.circuit_breaker.record(False)
+                error = f"{type(e).__name__}: {e}"
+                retryable = self.retry_policy.is_retryable_error(e)
+                result = FetchResult(url=url, error=error)
+            else:
+                # Only transient statuses count against the site's health;
+                # a 404 is a healthy answer about a missing page
+                self.circuit_breaker.record(
+                    not self.retry_policy.is_transient_status(result.status)
+                )
+                retryable = self.retry_policy.is_retryable_status(result.status)
+                if not retryable:
+                    break
+                error = f"status {result.status}"
+
+            if not retryable or attempt == self.config.fetch_retries:
+                break
+
+            delay = self.retry_policy.backoff(attempt)
+            print(
+                f"{ScraperUtils.format_datetime()} Fetch of {url} failed ({error}), retrying in {delay:.1f}s ({attempt + 1}/{self.config.fetch_retries})"
+            )
+            await asyncio.sleep(delay)
+
+        # Remember which engine served the URL and how long it took to be
+        # ready, for failed fetches too
+        if result.engine:
+            self.fetch_engines[url] = result.engine
+        if result.ready_ms is not None:
+            self.ready_times[url] = round(result.ready_ms, 1)
+        # An error page left after the last retry is not article content
+        if result.status is not None and not (
+            200 <= result.status < 300 or result.status == 304
+        ):
+            result.html = None
+        if not result.html and result.status != 304:
+            result.error = result.error or f"status {result.status}"
+            print(
+                f"{ScraperUtils.format_datetime()} Error fetching {url}: {result.error}"
+            )
+        return result
+
+    async def _discover_articles(self):
+        """
+        Collect article URLs from the help center article feed, which also
+        yields updated_at timestamps for pre-fetch skipping. Falls back to a
+        crawl of the site's categories and sections when the feed is disabled,
+        unavailable or empty, and to the sidebar when the crawl finds nothing.
+        """
+        if self.config.discovery_mode == "feed":
+            print(
+                f"{ScraperUtils.format_datetime()} Collecting article URLs from feed: {self.feed_discovery.feed_url}"
+            )
+            try:
+                self.article_updated_at = await self.feed_discovery.discover()
+            except Exception as e:
+                print(
+                    f"{ScraperUtils.format_datetime()} Warning: Article feed unavailable ({e}), falling back to site crawl"
+                )
+            else:
+                if self.article_updated_at:
+                    self.article_urls.update(self.article_updated_at)
+                    print(
+                        f"{ScraperUtils.format_datetime()} Finished collecting URLs. Found {len(self.article_urls)} article URLs from feed."
+                    )
+                    return
+                print(
+                    f"{ScraperUtils.format_datetime()} Warning: Article feed returned no articles, falling back to site crawl"
+                )
+
+        if self.config.discovery_mode in ("feed", "crawl"):
+            print(
+                f"{ScraperUtils.format_datetime()} Crawling categories and sections from: {', '.join(self.site_crawl.seed_urls)}"
+            )
+            self.article_urls.update(await self.site_crawl.discover())
+            if self.article_urls:
+                print(
+                    f"{ScraperUtils.format_datetime()} Finished collecting URLs. Found {len(self.article_urls)} article URLs from site crawl."
+                )
+                return
+            print(
+                f"{ScraperUtils.format_datetime()} Warning: Site crawl found no articles, falling back to sidebar discovery"
             )
 
-            # Wait for dynamic content to load completely
-            await page.wait_for_timeout(1500)
+        await self._crawl_for_article_urls()
 
-            return await page.content()
-        except Exception as e:
-            print(f"{ScraperUtils.format_datetime()} Error fetching {url}: {e}")
-            return None
+    def _dedupe_article_urls(self):
+        """
+        Keep one normalized URL per article id, so slug, locale, query or
+        fragment variants of an article are fetched only once. URLs in the
+        configured locale are preferred.
+        """
+        locale_prefix = f"/hc/{self.config.help_center_locale}/"
+        by_key = {}
+        for article_url in sorted(self.article_urls):
+            canonical = ScraperUtils.normalize_url(article_url)
+            key = ArticleTracker.article_key(canonical)
+            current = by_key.get(key)
+            if current is None or (
+                locale_prefix not in current and locale_prefix in canonical
+            ):
+                by_key[key] = canonical
+            if article_url in self.article_updated_at:
+                self.article_updated_at[canonical] = self.article_updated_at[
+                    article_url
+                ]
+
+        duplicates = len(self.article_urls) - len(by_key)
+        self.article_urls = set(by_key.values())
+        if duplicates:
+            print(
+                f"{ScraperUtils.format_datetime()} Dropped {duplicates} duplicate article URLs ({len(self.article_urls)} distinct articles)"
+            )
 
-    async def _crawl_for_article_urls(self, page):
+    def _skip_unchanged_in_feed(self, article_url: str, article_index: int) -> bool:
+        """
+        Skip an article before fetching it when its feed updated_at is not newer
+        than the one recorded on the last run.
+        """
+        updated_at = self.article_updated_at.get(article_url)
+        if updated_at is None:
+            return False
+
+        should_fetch, reason = self.article_tracker.should_fetch_article(
+            article_url, updated_at
+        )
+        if should_fetch:
+            return False
+
+        print(
+            f"{ScraperUtils.format_datetime()} Skipping article {article_index+1} without fetching: {reason}"
+        )
+        return True
+
+    async def _crawl_for_article_urls(self):
         """
         Extract all article URLs from the left sidebar navigation.
 
@@ -77,8 +269,12 @@ class OptiSignsScraper:
         main_url = self.config.base_url + "/hc/en-us/articles"
         print(f"{ScraperUtils.format_datetime()} Visiting main page: {main_url}")
 
-        # Fetch the page content
-        html_content = await self._fetch_page_content(page, main_url)
+        # Fetch the page content; a server-rendered sidebar is enough over HTTP
+        html_content = (
+            await self._fetch_page_content(
+                main_url, ["knowledge-tree"], ready_selector=".knowledge-tree"
+            )
+        ).html
         if not html_content:
             print(
                 f"{ScraperUtils.format_datetime()} Error: Could not fetch main page content"
@@ -86,19 +282,18 @@ class OptiSignsScraper:
             return
 
         # Parse HTML and extract article links from sidebar
-        soup = BeautifulSoup(html_content, "html.parser")
-        self._extract_sidebar_links(soup)
+        self._extract_sidebar_links(self.parser.parse(html_content))
 
         print(
             f"{ScraperUtils.format_datetime()} Finished collecting URLs. Found {len(self.article_urls)} article URLs from sidebar."
         )
 
-    def _extract_sidebar_links(self, soup: BeautifulSoup):
+    def _extract_sidebar_links(self, page: ParsedPage):
         """
         Extract article URLs from the left sidebar navigation.
 
         Args:
-            soup: BeautifulSoup object of the main page
+            page: Parsed main page
         """
         # Try multiple sidebar selectors to find the navigation menu
         sidebar_selectors = [
@@ -116,16 +311,15 @@ class OptiSignsScraper:
 
         # Try each selector until we find the sidebar
         for selector in sidebar_selectors:
-            sidebar = soup.select_one(selector)
-            if sidebar:
+            sidebar_links = page.links(selector)
+            if sidebar_links is not None:
                 print(
                     f"{ScraperUtils.format_datetime()} Found sidebar using selector: {selector}"
                 )
                 sidebar_found = True
 
                 # Extract all article links from the sidebar
-                for link in sidebar.find_all("a", href=True):
-                    href = link["href"]
+                for href in sidebar_links:
                     # full_url = urljoin(self.config.base_url, href)
                     full_url = href
 
@@ -149,8 +343,7 @@ class OptiSignsScraper:
                 f"{ScraperUtils.format_datetime()} Warning: Could not find sidebar with common selectors. Trying to find all article links on page..."
             )
             # Search entire page for article links as backup
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
+            for href in page.links():
                 full_url = urljoin(self.config.base_url, href)
 
                 # Only process links within our target domain
@@ -166,9 +359,7 @@ class OptiSignsScraper:
                                 f"{ScraperUtils.format_datetime()} Found {len(self.article_urls)} article URLs so far."
                             )
 
-    async def _process_and_save_article(
-        self, page, article_url: str, article_index: int
-    ):
+    async def _process_and_save_article(self, article_url: str, article_index: int):
         """
         Fetches an individual article, cleans its HTML, converts to markdown, and saves it.
         Includes incremental update functionality to skip unchanged articles.
@@ -176,176 +367,527 @@ class OptiSignsScraper:
         print(
             f"\n{ScraperUtils.format_datetime()} Processing article {article_index+1}: {article_url}"
         )
-        # Fetch the article's HTML content
-        html_content = await self._fetch_page_content(page, article_url)
+        # Fetch the article's HTML content, conditionally if validators are known
+        result = await self._fetch_page_content(
+            article_url,
+            headers=self.article_tracker.get_conditional_headers(article_url),
+        )
+        metadata = ScraperUtils.extract_validators(result.headers)
+        if article_url in self.article_updated_at:
+            metadata["updated_at"] = self.article_updated_at[article_url]
+
+        # Short-circuit on 304 Not Modified without downloading or parsing the page
+        if result.status == 304:
+            self.article_tracker.update_article_metadata(article_url, metadata)
+            print(
+                f"{ScraperUtils.format_datetime()} Skipping article {article_index+1}: not modified (304)"
+            )
+            return True
 
+        html_content = result.html
         if not html_content:
+            self.article_tracker.record_failure(article_url, result.error)
             return False
 
-        # Create content hash for change detection in incremental updates
-        content_hash = ScraperUtils.get_content_hash(html_content)
+        # Keep the raw page so markdown can be regenerated without a crawl
+        if self.config.raw_cache:
+            await self.raw_cache.store_async(
+                article_url, result.status, result.headers, html_content
+            )
+
+        return await self._convert_and_save(
+            article_url, article_index, html_content, metadata
+        )
+
+    async def _convert_and_save(
+        self,
+        article_url: str,
+        article_index: int,
+        html_content: str,
+        metadata: dict,
+    ) -> bool:
+        """
+        Convert fetched (or cached) article HTML and save it when it changed.
+        """
+        # Parse, prune and convert to markdown off the event loop. The
+        # fingerprint covers only the pruned, normalized content so tokens,
+        # timestamps and widgets elsewhere in the page do not register as
+        # changes; the raw page hash is kept for reference.
+        with self.metrics.time("conversion"):
+            converted = await self.conversion.convert(html_content, article_url)
+        if converted is None:
+            print(
+                f"{ScraperUtils.format_datetime()} Error: No body content found for {article_url}, skipping."
+            )
+            self.article_tracker.record_failure(article_url, "no body content")
+            return False
+
+        for phase, seconds in converted["timings"].items():
+            self.metrics.observe(phase, seconds)
+        content_fingerprint = converted["content_fingerprint"]
 
         # Check if we should process this article based on incremental update settings
         should_process, reason = self.article_tracker.should_process_article(
-            article_url, content_hash
+            article_url, content_fingerprint
         )
         if not should_process:
+            self.article_tracker.update_article_metadata(article_url, metadata)
             print(
                 f"{ScraperUtils.format_datetime()} Skipping article {article_index+1}: {reason}"
             )
             return True  # Return True as it's not an error, just skipped
 
-        # Parse HTML content
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Extract the main article content using various selectors
-        article_content_div = self._find_article_content(soup, article_url)
-        if not article_content_div:
-            return False
-
-        # Convert HTML content to clean markdown format
-        markdown_content = self._convert_to_markdown(article_content_div)
-
         # Save the processed article to file and update tracking
-        return self._save_article_to_file(
-            soup, article_url, article_index, markdown_content, content_hash, reason
-        )
-
-    def _find_article_content(self, soup: BeautifulSoup, article_url: str):
-        """
-        Find the main article content from the HTML soup.
-        Uses body content directly for simplicity.
-        """
-        if soup.body:
-            return soup.body
-
-        print(
-            f"{ScraperUtils.format_datetime()} Error: No body content found for {article_url}, skipping."
+        return await self._save_article_to_file(
+            converted["title"],
+            article_url,
+            article_index,
+            converted["markdown"],
+            converted["content_hash"],
+            content_fingerprint,
+            reason,
+            metadata,
         )
-        return None
 
-    def _convert_to_markdown(self, content_element) -> str:
-        """
-        Convert HTML content to clean markdown format.
-        """
-        # Remove unwanted elements
-        for selector in self.config.unwanted_selectors:
-            for unwanted in content_element.select(selector):
-                unwanted.decompose()
-
-        return self.h2t.handle(str(content_element))
-
-    def _save_article_to_file(
+    @timed("save")
+    async def _save_article_to_file(
         self,
-        soup: BeautifulSoup,
+        title: str,
         article_url: str,
         article_index: int,
         markdown_content: str,
         content_hash: str,
+        content_fingerprint: str,
         update_reason: str,
+        metadata: dict = None,
     ) -> bool:
         """
         Save the article content to a markdown file and update tracking.
+        The file is written by the writer thread, which leaves it untouched
+        when the body on disk is already identical.
         """
-        # Extract and clean the article title for filename
-        title = self._extract_title(soup, article_url)
+        # Clean the article title for filename
         slug = ScraperUtils.slugify(title)
 
         # Create fallback filename if title processing fails
         if not slug:
             slug = f"article-{article_index}-{hash(article_url) % 10000}"
 
-        file_name = f"{slug}.md"
+        # Prefix the article id so a renamed article keeps one file per id
+        article_id = ScraperUtils.extract_article_id(article_url)
+        file_name = f"{article_id}-{slug}.md" if article_id else f"{slug}.md"
         file_path = self.config.output_dir / file_name
 
         # Create markdown file with metadata header
         header = f"---\nurl: {article_url}\ndate_scraped: {ScraperUtils.format_datetime()}\n---\n\n"
-        final_content = header + markdown_content
 
-        # Write the markdown file to disk
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(final_content)
+        # A tracked entry with the same fingerprint and path means the file
+        # already holds this body, so the writer need not read it back
+        entry = self.article_tracker.get_entry(article_url) or {}
+        fingerprint_matches = entry.get(
+            "content_fingerprint"
+        ) == content_fingerprint and entry.get("file_path") == str(file_path)
+
+        # Write the markdown file to disk off the event loop
+        written = await self.writer.write(
+            article_url, file_path, header, markdown_content, fingerprint_matches
+        )
+
+        # Remove the file saved under the article's previous title
+        previous_file = entry.get("file_path")
+        if previous_file and previous_file != str(file_path):
+            Path(previous_file).unlink(missing_ok=True)
 
         # Update article tracking for incremental updates
         self.article_tracker.track_article(
-            article_url, file_name, content_hash, str(file_path), update_reason
+            article_url,
+            file_name,
+            content_hash,
+            content_fingerprint,
+            str(file_path),
+            update_reason,
+            metadata,
         )
 
-        action = "Updated" if update_reason == "content changed" else "Saved"
+        if not written:
+            action = "Unchanged on disk, write avoided"
+        elif update_reason == "content changed":
+            action = "Updated"
+        else:
+            action = "Saved"
         print(f"{ScraperUtils.format_datetime()} {action}: {file_path}")
         return True
 
-    def _extract_title(self, soup: BeautifulSoup, article_url: str) -> str:
+    async def _article_worker(self, queue: asyncio.Queue) -> int:
+        """
+        Pull articles from the shared queue and process them one at a time.
+
+        Tracker updates happen synchronously on the event loop between awaits,
+        so results from concurrent workers are merged without extra locking.
+
+        Returns:
+            int: Number of articles this worker processed successfully
+        """
+        processed = 0
+        while True:
+            try:
+                article_index, article_url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return processed
+
+            # Articles unchanged according to the feed cost no request at all
+            if self._skip_unchanged_in_feed(article_url, article_index):
+                processed += 1
+                self._record_progress(article_url, True)
+                continue
+
+            try:
+                success = await self._process_and_save_article(
+                    article_url, article_index
+                )
+            except Exception as e:
+                print(
+                    f"{ScraperUtils.format_datetime()} Error processing {article_url}: {e}"
+                )
+                # Failing to log the failure must not take the worker down
+                try:
+                    self.article_tracker.record_failure(
+                        article_url, f"{type(e).__name__}: {e}"
+                    )
+                except Exception as record_error:
+                    print(
+                        f"{ScraperUtils.format_datetime()} Could not record failure of {article_url}: {record_error}"
+                    )
+                success = False
+
+            if success:
+                processed += 1
+                self.article_tracker.clear_failure(article_url)
+            self._record_progress(article_url, success)
+
+    def _record_progress(self, article_url: str, success: bool):
         """
-        Extract the article title from HTML, with fallbacks.
+        Journal a finished article together with its tracker entry.
         """
-        title_tag = soup.find("title")
-        if title_tag:
-            # Clean " - OptiSigns" from the title
-            return title_tag.get_text().replace(" - OptiSigns", "").strip()
+        if article_url in self.article_tracker.new_articles:
+            change = "new"
+        elif article_url in self.article_tracker.updated_articles:
+            change = "updated"
         else:
-            # Fallback to URL path if no title tag is found
-            return article_url.split("/")[-1]
+            change = None
+        self._pending_marks.append(
+            (article_url, success, self.article_tracker.get_entry(article_url), change)
+        )
+        # A resumed run never refetches journaled articles, so their cached
+        # pages must be committed first: marks wait for the cache's next batch
+        # commit rather than forcing a commit per article
+        if not self.raw_cache.pending:
+            self._write_marks()
 
-    async def run(self):
+    async def _flush_progress(self):
         """
-        Executes the main scraping process: extracting URLs from sidebar and then processing articles.
+        Commit the raw cache and journal every article that was waiting for it.
         """
-        async with async_playwright() as p:
-            # Launch browser with headless/visible mode based on config
-            browser = await p.chromium.launch(headless=self.config.headless)
-            page = await browser.new_page()
+        await self.raw_cache.commit_async()
+        self._write_marks()
 
-            # Step 1: Extract all article URLs from the sidebar navigation
-            await self._crawl_for_article_urls(page)
+    def _write_marks(self):
+        for mark in self._pending_marks:
+            self.checkpoint.mark(*mark)
+        self._pending_marks = []
 
-            # Step 2: Sort articles for reproducibility and select which ones to process
-            articles_processed = 0
+    async def _plan_articles(self) -> list[str]:
+        """
+        Discover articles, sort them and select the ones to process in this run.
+        """
+        # Step 1: Collect all article URLs from the feed, site crawl or sidebar
+        # and reduce them to one URL per article id
+        await self._discover_articles()
+        self._dedupe_article_urls()
+
+        # Step 2: Sort articles for reproducibility and select which ones to process
+        # Convert URL set to list and sort based on configured method
+        article_list = list(self.article_urls)
+
+        if self.config.article_sort_method == "alphabetical":
+            article_list = sorted(article_list)
+            sort_desc = "sorted alphabetically"
+        elif self.config.article_sort_method == "reverse":
+            article_list = sorted(article_list, reverse=True)
+            sort_desc = "sorted reverse alphabetically"
+        else:  # discovery_order
+            sort_desc = "in discovery order"
+
+        # Articles that failed last run go first so they are retried
+        failed_keys = self.article_tracker.failed_keys()
+        retry_first = [
+            url
+            for url in article_list
+            if ArticleTracker.article_key(url) in failed_keys
+        ]
+        if retry_first:
+            retry_set = set(retry_first)
+            article_list = retry_first + [
+                url for url in article_list if url not in retry_set
+            ]
+            print(
+                f"{ScraperUtils.format_datetime()} Prioritising {len(retry_first)} articles that failed on their last attempt"
+            )
+
+        # Limit the number of articles to process based on configuration
+        articles_to_process = article_list[: self.config.pages_to_crawl]
 
-            # Convert URL set to list and sort based on configured method
-            article_list = list(self.article_urls)
+        print(f"-" * 50)
+        print(
+            f"\n{ScraperUtils.format_datetime()} Found {len(article_list)} total articles, {sort_desc}."
+        )
+        print(
+            f"{ScraperUtils.format_datetime()} Processing first {len(articles_to_process)} articles for reproducibility..."
+        )
+        return articles_to_process
 
-            if self.config.article_sort_method == "alphabetical":
-                article_list = sorted(article_list)
-                sort_desc = "sorted alphabetically"
-            elif self.config.article_sort_method == "reverse":
-                article_list = sorted(article_list, reverse=True)
-                sort_desc = "sorted reverse alphabetically"
-            else:  # discovery_order
-                sort_desc = "in discovery order"
+    def _restore_checkpoint(self, checkpoint: dict) -> list[str]:
+        """
+        Restore the plan and finished articles of an interrupted run.
+        Tracker entries journaled since the tracker was last saved are replayed.
 
-            # Limit the number of articles to process based on configuration
-            articles_to_process = article_list[: self.config.pages_to_crawl]
+        Returns:
+            list: The planned articles, in their original order
+        """
+        articles_to_process = checkpoint["articles"]
+        self.article_urls.update(articles_to_process)
+        self.article_updated_at = checkpoint["updated_at"]
+
+        tracker = self.article_tracker
+        for article_url, entry in checkpoint["completed"].items():
+            if entry:
+                tracker.processed_articles[tracker.article_key(article_url)] = entry
+        tracker.new_articles.update(checkpoint["new"])
+        tracker.updated_articles.update(checkpoint["updated"])
+        self.resumed_articles = len(checkpoint["completed"])
+
+        print(f"-" * 50)
+        print(
+            f"\n{ScraperUtils.format_datetime()} Resuming from checkpoint: {self.resumed_articles} of {len(articles_to_process)} articles already done, {len(checkpoint['failed'])} to retry."
+        )
+        return articles_to_process
 
-            print(f"-" * 50)
+    def _archive_snapshot(self):
+        """
+        Archive this run's version of every tracked article file. A failed
+        snapshot is reported without failing the run.
+        """
+        if not self.config.archive:
+            return
+        try:
+            with self.metrics.time("archive"):
+                self.archive_result = self.archive.snapshot(
+                    self.article_tracker.processed_articles, self.config.base_url
+                )
+        except Exception as e:
             print(
-                f"\n{ScraperUtils.format_datetime()} Found {len(article_list)} total articles, {sort_desc}."
+                f"{ScraperUtils.format_datetime()} Warning: Could not archive this run: {e}"
             )
+            return
+        print(
+            f"{ScraperUtils.format_datetime()} Archived run {self.archive_result['run_id']}: {self.archive_result['articles']} articles, {self.archive_result['new_blobs']} new versions ({self.archive_result['bytes_added']} bytes)"
+        )
+
+    async def start(self, warm_browser: bool = False):
+        """
+        Start the fetch engines, conversion workers and file writer.
+
+        Args:
+            warm_browser (bool): Launch the browser now instead of on first use
+        """
+        await self.fetcher.start()
+        if warm_browser:
+            await self.fetcher.warm_up()
+        self.conversion.start()
+        self.writer.start()
+
+    async def close(self):
+        """
+        Shut down everything started by start().
+        """
+        await self.fetcher.close()
+        self.conversion.close()
+        self.writer.close()
+        self.raw_cache.close()
+
+    def _reset_run_state(self):
+        """
+        Clear per-crawl results so a long-lived scraper reports each crawl separately.
+        """
+        self.article_urls = set()
+        self.article_updated_at = {}
+        self.fetch_engines = {}
+        self.ready_times = {}
+        self.resumed_articles = 0
+        self._pending_marks = []
+        self.article_tracker.new_articles = set()
+        self.article_tracker.updated_articles = set()
+        self.article_tracker.failed_this_run = {}
+        self.writer.written = 0
+        self.writer.avoided = 0
+        self.metrics.reset()
+        self.archive_result = None
+        self.raw_cache.stored = 0
+        self.raw_cache.raw_bytes = 0
+        self.raw_cache.compressed_bytes = 0
+
+    async def crawl(self, resume: bool = False):
+        """
+        Discover article URLs and process articles, reusing the started engines.
+
+        Args:
+            resume (bool): Continue an interrupted run from its checkpoint,
+                skipping discovery and the articles it already finished
+        """
+        self._reset_run_state()
+        try:
+            checkpoint = self.checkpoint.load() if resume else None
+            if checkpoint:
+                articles_to_process = self._restore_checkpoint(checkpoint)
+                self.checkpoint.resume()
+            else:
+                if resume:
+                    print(
+                        f"{ScraperUtils.format_datetime()} No usable checkpoint found, starting a fresh run"
+                    )
+                with self.metrics.time("discovery"):
+                    articles_to_process = await self._plan_articles()
+                self.checkpoint.start(articles_to_process, self.article_updated_at)
+
+            # Process the pending articles with a pool of concurrent workers
+            completed = checkpoint["completed"] if checkpoint else {}
+            queue = asyncio.Queue()
+            for i, article_url in enumerate(articles_to_process):
+                if article_url not in completed:
+                    queue.put_nowait((i, article_url))
+
+            pending = queue.qsize()
+            worker_count = max(1, min(self.config.concurrency, pending))
             print(
-                f"{ScraperUtils.format_datetime()} Processing first {len(articles_to_process)} articles for reproducibility..."
+                f"{ScraperUtils.format_datetime()} Starting {worker_count} worker(s) for {pending} articles..."
             )
+            workers = [
+                asyncio.create_task(self._article_worker(queue))
+                for _ in range(worker_count)
+            ]
+            try:
+                results = await asyncio.gather(*workers)
+            finally:
+                # A crashed worker stops its siblings before the engines close
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            articles_processed = sum(results) + self.resumed_articles
+        finally:
+            await self._flush_progress()
+            self.checkpoint.close()
+
+        # Save the processed articles log for future incremental updates
+        with self.metrics.time("tracker_save"):
+            self.article_tracker.save_processed_articles()
+        self.raw_cache.commit()
+        self._archive_snapshot()
+        self.metrics.finish()
 
-            # Process each selected article
-            for i, article_url in enumerate(articles_to_process):
-                success = await self._process_and_save_article(page, article_url, i)
-                if success:
-                    articles_processed += 1
+        # The checkpoint is only kept while some planned article still failed,
+        # so a resumed run retries just those
+        if articles_processed == len(articles_to_process):
+            self.checkpoint.clear()
 
-                # Small delay between articles to be respectful to the server
-                await asyncio.sleep(2)
+        # Display completion summary with incremental update information
+        print(
+            f"\n{ScraperUtils.format_datetime()} Task complete! Successfully processed {articles_processed} out of {len(articles_to_process)} articles and saved them to '{self.config.output_dir}'."
+        )
 
-            await browser.close()
+        # Print incremental update summary statistics
+        self.article_tracker.print_summary(len(articles_to_process))
 
-            # Save the processed articles log for future incremental updates
-            self.article_tracker.save_processed_articles()
+    async def run(self, resume: bool = False):
+        """
+        Executes the main scraping process: discovering article URLs and then processing articles.
 
-            # Display completion summary with incremental update information
+        Args:
+            resume (bool): Continue an interrupted run from its checkpoint,
+                skipping discovery and the articles it already finished
+        """
+        await self.start()
+        try:
+            await self.crawl(resume)
+        finally:
+            await self.close()
+
+    async def replay(self):
+        """
+        Regenerate markdown from the raw response cache without any network
+        access. The newest cached page of every article is parsed, converted
+        and saved again with the current cleaning and conversion settings,
+        keeping every conversion worker busy; unchanged articles are skipped
+        as in a crawl.
+        """
+        self._reset_run_state()
+        self.conversion.start()
+        self.writer.start()
+        try:
+            # Newest cached response per article; URL variants share an id
+            responses = {}
+            for response in self.raw_cache.latest():
+                key = self.article_tracker.article_key(response["url"])
+                if (
+                    key not in responses
+                    or response["fetched_at"] > responses[key]["fetched_at"]
+                ):
+                    responses[key] = response
+            self.article_urls = {response["url"] for response in responses.values()}
             print(
-                f"\n{ScraperUtils.format_datetime()} Task complete! Successfully processed {articles_processed} out of {len(articles_to_process)} articles and saved them to '{self.config.output_dir}'."
+                f"{ScraperUtils.format_datetime()} Replaying {len(responses)} cached articles from {self.config.raw_cache_db}"
+            )
+
+            # Enough articles in flight to saturate the conversion workers
+            semaphore = asyncio.Semaphore(max(1, self.config.conversion_workers) * 2)
+
+            async def replay_article(article_index: int, response: dict) -> bool:
+                article_url = response["url"]
+                # Keep the validators and feed timestamp of the tracked entry
+                entry = self.article_tracker.get_entry(article_url) or {}
+                metadata = {
+                    k: entry[k]
+                    for k in ("etag", "last_modified", "updated_at")
+                    if k in entry
+                } or ScraperUtils.extract_validators(response["headers"])
+                async with semaphore:
+                    try:
+                        return await self._convert_and_save(
+                            article_url, article_index, response["html"], metadata
+                        )
+                    except Exception as e:
+                        print(
+                            f"{ScraperUtils.format_datetime()} Error replaying {article_url}: {e}"
+                        )
+                        return False
+
+            results = await asyncio.gather(
+                *(
+                    replay_article(i, response)
+                    for i, response in enumerate(responses.values())
+                )
             )
+        finally:
+            await self.close()
 
-            # Print incremental update summary statistics
-            self.article_tracker.print_summary(len(articles_to_process))
+        with self.metrics.time("tracker_save"):
+            self.article_tracker.save_processed_articles()
+        self._archive_snapshot()
+        self.metrics.finish()
+
+        print(
+            f"\n{ScraperUtils.format_datetime()} Replay complete! Successfully re-converted {sum(results)} out of {len(results)} cached articles into '{self.config.output_dir}'."
+        )
+        self.article_tracker.print_summary(len(results))
 
 
 # Example usage
@@ -0,0 +1,149 @@
+import json
+import sqlite3
+from collections.abc import MutableMapping
+from pathlib import Path
+
+
+class SQLiteArticleStore(MutableMapping):
+    """
+    Processed-articles log stored in SQLite (WAL mode), usable wherever the
+    JSON-backed dict is. Entries are keyed by tracker key (article id) with
+    the content hash and fingerprint in indexed columns; writes and deletes
+    are committed in small batches so a crash loses at most ``commit_every``
+    updates.
+
+    Several tables of one database share a connection (see ``open_table``):
+    a second connection would wait on the batch transaction held open by the
+    first and fail with "database is locked".
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        table: str = "articles",
+        commit_every: int = 10,
+        connection: sqlite3.Connection = None,
+    ):
+        self.db_path = Path(db_path)
+        self.table = table
+        self.commit_every = commit_every
+        self._pending = 0
+
+        self._owns_connection = connection is None
+        if connection is None:
+            connection = sqlite3.connect(self.db_path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        self._conn = connection
+        self._conn.execute(f"""CREATE TABLE IF NOT EXISTS {table} (
+                article_key TEXT PRIMARY KEY,
+                content_hash TEXT,
+                content_fingerprint TEXT,
+                data TEXT NOT NULL
+            )""")
+        # Databases created before entries were keyed by article id
+        columns = [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+        if "url" in columns:
+            self._conn.execute(f"ALTER TABLE {table} RENAME COLUMN url TO article_key")
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_content_hash ON {table} (content_hash)"
+        )
+        self._conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_fingerprint ON {table} (content_fingerprint)"
+        )
+        self._conn.commit()
+
+    def open_table(self, table: str) -> "SQLiteArticleStore":
+        """
+        Open another table of the same database on this store's connection.
+        Committing either store commits the pending writes of both.
+        """
+        return SQLiteArticleStore(
+            self.db_path, table, commit_every=self.commit_every, connection=self._conn
+        )
+
+    def __getitem__(self, key: str) -> dict:
+        row = self._conn.execute(
+            f"SELECT data FROM {self.table} WHERE article_key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return json.loads(row[0])
+
+    def __setitem__(self, key: str, entry: dict):
+        self._write(key, entry)
+        self._count_pending()
+
+    def _count_pending(self):
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def __delitem__(self, key: str):
+        cursor = self._conn.execute(
+            f"DELETE FROM {self.table} WHERE article_key = ?", (key,)
+        )
+        if cursor.rowcount == 0:
+            raise KeyError(key)
+        self._count_pending()
+
+    def __contains__(self, key) -> bool:
+        return (
+            self._conn.execute(
+                f"SELECT 1 FROM {self.table} WHERE article_key = ?", (key,)
+            ).fetchone()
+            is not None
+        )
+
+    def __iter__(self):
+        keys = [
+            row[0]
+            for row in self._conn.execute(f"SELECT article_key FROM {self.table}")
+        ]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def _write(self, key: str, entry: dict):
+        self._conn.execute(
+            f"""INSERT INTO {self.table} (article_key, content_hash, content_fingerprint, data)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(article_key) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    content_fingerprint = excluded.content_fingerprint,
+                    data = excluded.data""",
+            (
+                key,
+                entry.get("content_hash"),
+                entry.get("content_fingerprint"),
+                json.dumps(entry, ensure_ascii=False),
+            ),
+        )
+
+    def import_json(self, json_path: Path) -> int:
+        """
+        One-shot import of an existing processed-articles JSON log.
+
+        Returns:
+            int: Number of imported entries
+        """
+        with open(json_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        for key, entry in entries.items():
+            self._write(key, entry)
+        self.commit()
+        return len(entries)
+
+    def commit(self):
+        """
+        Commit pending writes to disk.
+        """
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self):
+        self.commit()
+        if self._owns_connection:
+            self._conn.close()
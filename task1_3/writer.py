@@ -0,0 +1,176 @@
+import asyncio
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from config import ScraperConfig, ScraperUtils
+
+
+@dataclass
+class WriteJob:
+    """One markdown file to write: front matter header plus article body."""
+
+    article_url: str
+    file_path: Path
+    header: str
+    body: str
+    fingerprint_matches: bool = False  # Tracker already holds this body's fingerprint
+    future: Future = field(default_factory=Future)
+
+
+class ArticleWriter:
+    """
+    Writes markdown files from a background thread so disk I/O never stalls
+    the event loop. Jobs are drained in batches; each file is written to a
+    temporary file and renamed into place, and the directory is synced once
+    per batch. With write avoidance enabled, a file whose body is unchanged is
+    left untouched, keeping its mtime and date_scraped header.
+    """
+
+    def __init__(self, config: ScraperConfig):
+        self.config = config
+        self.written = 0
+        self.avoided = 0
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def start(self):
+        """
+        Start the writer thread.
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="article-writer", daemon=True
+        )
+        self._thread.start()
+
+    async def write(
+        self,
+        article_url: str,
+        file_path: Path,
+        header: str,
+        body: str,
+        fingerprint_matches: bool = False,
+    ) -> bool:
+        """
+        Queue a file for writing and wait until it is on disk (or skipped).
+
+        Returns:
+            bool: True if the file was written, False if the write was avoided
+        """
+        job = WriteJob(article_url, file_path, header, body, fingerprint_matches)
+        self._queue.put(job)
+        return await asyncio.wrap_future(job.future)
+
+    def stats(self) -> dict:
+        return {"written": self.written, "avoided": self.avoided}
+
+    def close(self):
+        """
+        Flush queued writes and stop the writer thread.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        running = True
+        while running:
+            # Block for the first job, then take whatever else is already queued
+            batch = [self._queue.get()]
+            while len(batch) < self.config.writer_batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            results = []
+            directories = set()
+            for job in batch:
+                if job is None:
+                    running = False
+                    continue
+                try:
+                    written = self._write_job(job)
+                except Exception as e:
+                    job.future.set_exception(e)
+                    continue
+                if written:
+                    directories.add(job.file_path.parent)
+                results.append((job, written))
+
+            # Persist the renames of the whole batch with one sync per directory,
+            # then report the batch as done. A failed sync fails the batch's
+            # writes but not the thread, which later writers still wait on.
+            try:
+                for directory in directories:
+                    self._fsync_directory(directory)
+            except Exception as e:
+                for job, _ in results:
+                    job.future.set_exception(e)
+                continue
+            for job, written in results:
+                job.future.set_result(written)
+
+    def _write_job(self, job: WriteJob) -> bool:
+        if self.config.skip_unchanged_writes and self._is_unchanged(job):
+            self.avoided += 1
+            return False
+
+        self._atomic_write(job.file_path, job.header + job.body)
+        self.written += 1
+        return True
+
+    @staticmethod
+    def _is_unchanged(job: WriteJob) -> bool:
+        """
+        Check whether the file on disk already holds this article's body.
+        A matching tracked fingerprint avoids reading the file at all.
+        """
+        if not job.file_path.is_file():
+            return False
+        if job.fingerprint_matches:
+            return True
+
+        # Compare everything after the header written by _save_article_to_file
+        existing = job.file_path.read_text(encoding="utf-8")
+        header_end = existing.find("\n---\n\n")
+        return (
+            existing.startswith(f"---\nurl: {job.article_url}\n")
+            and header_end != -1
+            and existing[header_end + len("\n---\n\n") :] == job.body
+        )
+
+    @staticmethod
+    def _atomic_write(file_path: Path, content: str):
+        """
+        Write to a temporary file in the same directory, then rename it over
+        the target so readers never see a partially written file.
+        """
+        # mkstemp creates the file as 0600; keep the permissions of a plain open()
+        mode = file_path.stat().st_mode & 0o777 if file_path.exists() else 0o644
+        fd, temp_path = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+        try:
+            os.fchmod(fd, mode)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, file_path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _fsync_directory(directory: Path):
+        fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
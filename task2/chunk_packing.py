@@ -0,0 +1,100 @@
+import statistics
+
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+
+class ChunkPacker:
+    """
+    Turns header sections from MarkdownHeaderTextSplitter into well-sized
+    chunks: adjacent small sections are merged up to a character budget and
+    oversized sections are split, with every chunk starting with the header
+    path of its first section.
+    """
+
+    def __init__(self, headers_to_split_on: list[tuple[str, str]], max_chars: int):
+        # Metadata name ("Header 2") -> markdown marker ("##")
+        self.markers = {name: marker for marker, name in headers_to_split_on}
+        self.max_chars = max_chars
+
+    def _headers(self, section) -> list[str]:
+        return [
+            f"{self.markers[name]} {value}"
+            for name, value in section.metadata.items()
+            if name in self.markers
+        ]
+
+    def _pieces(self, headers: list[str], body: str) -> list[str]:
+        """
+        Split a section body that would not fit the budget with its headers.
+        """
+        room = self.max_chars - len("\n".join(headers)) - 1
+        if len(body) <= room:
+            return [body]
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=max(room, self.max_chars // 2), chunk_overlap=0
+        )
+        return splitter.split_text(body)
+
+    def pack(self, sections) -> list[str]:
+        """
+        Pack the sections of one document into chunk texts.
+
+        Args:
+            sections: Documents from MarkdownHeaderTextSplitter, in order
+
+        Returns:
+            list[str]: Chunk texts, each at most max_chars long unless a single
+                piece cannot be split further
+        """
+        chunks = []
+        current = ""
+        current_headers = []
+        for section in sections:
+            headers = self._headers(section)
+            for body in self._pieces(headers, section.page_content):
+                # Appended text repeats only the headers that differ from the
+                # previous section's path
+                shared = 0
+                while (
+                    shared < min(len(headers), len(current_headers))
+                    and headers[shared] == current_headers[shared]
+                ):
+                    shared += 1
+                appended = "\n".join(headers[shared:] + [body])
+                if current and len(current) + 2 + len(appended) <= self.max_chars:
+                    current += "\n\n" + appended
+                else:
+                    if current:
+                        chunks.append(current)
+                    current = "\n".join(headers + [body])
+                current_headers = headers
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+def size_stats(sizes: list[int]) -> dict:
+    """
+    Summarize a chunk size distribution (characters).
+    """
+    if not sizes:
+        return {"count": 0}
+    ordered = sorted(sizes)
+    return {
+        "count": len(ordered),
+        "min": ordered[0],
+        "median": int(statistics.median(ordered)),
+        "p90": ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))],
+        "max": ordered[-1],
+        "mean": round(statistics.mean(ordered)),
+        "total": sum(ordered),
+    }
+
+
+def format_size_stats(stats: dict) -> str:
+    if not stats["count"]:
+        return "0 chunks"
+    return (
+        f"{stats['count']} chunks, min {stats['min']}, median {stats['median']}, "
+        f"p90 {stats['p90']}, max {stats['max']}, mean {stats['mean']}"
+    )
@@ -1,11 +1,14 @@
 import argparse
-import io
 import os
 import time
 
 from dotenv import load_dotenv
 from langchain_text_splitters import MarkdownHeaderTextSplitter
-from openai import OpenAI
+from openai import NotFoundError, OpenAI
+
+from chunk_packing import ChunkPacker, format_size_stats, size_stats
+from upload_engine import UploadEngine
+from upload_manifest import UploadManifest, chunk_hash
 
 
 def setup_configuration():
@@ -25,6 +28,49 @@ def setup_configuration():
         default="data",
         help="Directory where markdown files are located. Defaults to 'data'.",
     )
+    parser.add_argument(
+        "--manifest",
+        help="Local record of uploaded chunks, so only new or changed chunks are uploaded. Defaults to 'upload_manifest.json'.",
+    )
+    parser.add_argument(
+        "--prune-unmanaged",
+        action="store_true",
+        help="Also detach and delete vector store files not in the manifest (e.g. left by runs before the manifest existed).",
+    )
+    parser.add_argument(
+        "--chunk-budget",
+        type=int,
+        help="Target chunk size in characters (about 4 per token): smaller header sections are merged and larger ones split. 0 uploads one chunk per section. Overrides CHUNK_BUDGET from .env. Defaults to 3000.",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        help="Maximum concurrent API requests. Overrides UPLOAD_MAX_IN_FLIGHT from .env. Defaults to 8.",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        help="Retries per request on rate limits and transient errors. Overrides UPLOAD_MAX_RETRIES from .env. Defaults to 5.",
+    )
+    parser.add_argument(
+        "--attach-batch-size",
+        type=int,
+        help="File ids attached per vector store file batch. Overrides ATTACH_BATCH_SIZE from .env. Defaults to 500.",
+    )
+    parser.add_argument(
+        "--attach-retries",
+        type=int,
+        help="Times files that failed processing are resubmitted. Overrides ATTACH_RETRIES from .env. Defaults to 2.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        help="Seconds between file batch status polls. Overrides ATTACH_POLL_INTERVAL from .env. Defaults to 5.",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="OpenAI API base URL, e.g. of a local mock server. Overrides OPENAI_BASE_URL from .env.",
+    )
     args = parser.parse_args()
 
     # Load environment variables from .env file
@@ -36,6 +82,32 @@ def setup_configuration():
         "assistant_id": args.assistant_id or os.getenv("ASSISTANT_ID"),
         "vector_store_id": os.getenv("VECTOR_STORE_ID"),
         "markdown_files_directory": args.folder,
+        "manifest_path": args.manifest
+        or os.getenv("UPLOAD_MANIFEST", "upload_manifest.json"),
+        "prune_unmanaged": args.prune_unmanaged,
+        "chunk_budget": (
+            args.chunk_budget
+            if args.chunk_budget is not None
+            else int(os.getenv("CHUNK_BUDGET", "3000"))
+        ),
+        "max_in_flight": args.max_in_flight
+        or int(os.getenv("UPLOAD_MAX_IN_FLIGHT", "8")),
+        "max_retries": (
+            args.max_retries
+            if args.max_retries is not None
+            else int(os.getenv("UPLOAD_MAX_RETRIES", "5"))
+        ),
+        "attach_batch_size": args.attach_batch_size
+        or int(os.getenv("ATTACH_BATCH_SIZE", "500")),
+        "attach_retries": (
+            args.attach_retries
+            if args.attach_retries is not None
+            else int(os.getenv("ATTACH_RETRIES", "2"))
+        ),
+        "attach_poll_interval": args.poll_interval
+        or float(os.getenv("ATTACH_POLL_INTERVAL", "5")),
+        "attach_timeout": float(os.getenv("ATTACH_TIMEOUT", "300")),
+        "base_url": args.base_url or os.getenv("OPENAI_BASE_URL"),
         "vector_store_name": "OptiSigns Customer Support Docs",
     }
     return config
@@ -47,6 +119,16 @@ OPENAI_API_KEY = config["api_key"]
 ASSISTANT_ID = config["assistant_id"]
 VECTOR_STORE_ID = config["vector_store_id"]
 MARKDOWN_FILES_DIRECTORY = config["markdown_files_directory"]
+MANIFEST_PATH = config["manifest_path"]
+PRUNE_UNMANAGED = config["prune_unmanaged"]
+CHUNK_BUDGET = config["chunk_budget"]
+MAX_IN_FLIGHT = config["max_in_flight"]
+MAX_RETRIES = config["max_retries"]
+ATTACH_BATCH_SIZE = config["attach_batch_size"]
+ATTACH_RETRIES = config["attach_retries"]
+ATTACH_POLL_INTERVAL = config["attach_poll_interval"]
+ATTACH_TIMEOUT = config["attach_timeout"]
+BASE_URL = config["base_url"]
 VECTOR_STORE_NAME = config["vector_store_name"]
 
 # Validate required configuration and initialize OpenAI client
@@ -60,7 +142,10 @@ try:
             "Assistant ID not found. Provide it via --assistant-id or ASSISTANT_ID in .env."
         )
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = OpenAI(api_key=OPENAI_API_KEY, base_url=BASE_URL)
+    # Bulk calls run concurrently through the engine, which does the retrying
+    engine = UploadEngine(max_in_flight=MAX_IN_FLIGHT, max_retries=MAX_RETRIES)
+    engine_client = client.with_options(max_retries=0)
     print("OpenAI client initialized successfully.")
 except Exception as e:
     print(f"Error initializing: {e}")
@@ -68,12 +153,25 @@ except Exception as e:
 
 
 # --- 1. Read, Chunk, and Upload Files ---
+# The manifest records which chunk versions are already uploaded, so only new
+# or changed chunks are uploaded and superseded ones can be removed
+manifest = UploadManifest(MANIFEST_PATH)
+print(f"Loaded upload manifest '{MANIFEST_PATH}': {len(manifest.chunks)} chunks.")
+
 # Initialize tracking variables for the chunking and upload process
-uploaded_file_ids = []
+# Keys of every chunk produced in this run, and files that could not be processed
+current_chunk_keys = set()
+failed_files = set()
+# New or changed chunks, uploaded concurrently once all files are chunked
+pending_chunks = []
 # Initialize counters for tracking file processing
 file_upload_success_count = 0
 file_upload_failed_count = 0
+unchanged_chunk_count = 0
 total_chunks_created = 0
+# Chunk sizes in characters before and after packing
+section_sizes = []
+chunk_sizes = []
 
 print(
     f"\n--- Starting file chunking and uploading from '{MARKDOWN_FILES_DIRECTORY}' ---"
@@ -93,6 +191,8 @@ headers_to_split_on = [
     ("###", "Header 3"),
 ]
 markdown_splitter = MarkdownHeaderTextSplitter(headers_to_split_on=headers_to_split_on)
+# Merge small sections and split large ones into chunks of about CHUNK_BUDGET
+chunk_packer = ChunkPacker(headers_to_split_on, CHUNK_BUDGET) if CHUNK_BUDGET else None
 
 # Process each markdown file in the directory
 for filename in os.listdir(MARKDOWN_FILES_DIRECTORY):
@@ -103,40 +203,102 @@ for filename in os.listdir(MARKDOWN_FILES_DIRECTORY):
             with open(filepath, "r", encoding="utf-8") as f:
                 markdown_text = f.read()
 
-            # Split the document into chunks based on headers
-            chunks = markdown_splitter.split_text(markdown_text)
-            total_chunks_created += len(chunks)
-            print(f"\nProcessing '{filename}': Split into {len(chunks)} chunks.")
-
-            # Upload each chunk as a separate file to OpenAI
-            for i, chunk in enumerate(chunks):
-                # The chunk object has `page_content` and `metadata`.
+            # Split the document into sections based on headers
+            sections = markdown_splitter.split_text(markdown_text)
+            section_contents = []
+            for section in sections:
+                # The section object has `page_content` and `metadata`.
                 # We'll format the metadata back into the content for better context.
-                chunk_content = ""
+                section_content = ""
                 # Add headers from metadata back to the content
-                for header, value in chunk.metadata.items():
-                    chunk_content += f"{value}\n"
+                for header, value in section.metadata.items():
+                    section_content += f"{value}\n"
+
+                section_content += section.page_content
+                section_contents.append(section_content)
+            section_sizes += [len(content) for content in section_contents]
 
-                chunk_content += chunk.page_content
+            # Pack the sections into chunks of about the budget
+            if chunk_packer:
+                chunks = chunk_packer.pack(sections)
+                print(
+                    f"\nProcessing '{filename}': Split into {len(sections)} sections, packed into {len(chunks)} chunks."
+                )
+            else:
+                chunks = section_contents
+                print(f"\nProcessing '{filename}': Split into {len(chunks)} chunks.")
+            total_chunks_created += len(chunks)
+            chunk_sizes += [len(chunk_content) for chunk_content in chunks]
 
+            # Queue each new or changed chunk for upload as a separate file
+            for i, chunk_content in enumerate(chunks):
                 # Create a unique filename for the chunk
                 chunk_filename = f"{os.path.splitext(filename)[0]}_chunk_{i+1}.md"
 
-                # Upload the chunk as an in-memory file
-                with io.BytesIO(chunk_content.encode("utf-8")) as chunk_file:
-                    print(f"  Uploading chunk '{chunk_filename}'...")
-                    uploaded_file = client.files.create(
-                        file=(chunk_filename, chunk_file), purpose="assistants"
-                    )
-                    uploaded_file_ids.append(uploaded_file.id)
-                    file_upload_success_count += 1
-                    print(
-                        f"  Successfully uploaded chunk '{chunk_filename}' with File ID: {uploaded_file.id}"
-                    )
+                # Leave chunks that are already uploaded alone
+                digest = chunk_hash(chunk_content)
+                current_chunk_keys.add(manifest.key(filename, i))
+                if manifest.is_current(filename, i, digest):
+                    unchanged_chunk_count += 1
+                    continue
+
+                pending_chunks.append(
+                    {
+                        "file": filename,
+                        "index": i,
+                        "hash": digest,
+                        "chunk_filename": chunk_filename,
+                        "content": chunk_content.encode("utf-8"),
+                    }
+                )
 
         except Exception as e:
+            failed_files.add(filename)
+            print(f"Error processing '{filename}': {e}")
+
+
+def upload_chunk(chunk):
+    # Bytes rather than a stream, so a retried request sends the content again
+    return engine_client.files.create(
+        file=(chunk["chunk_filename"], chunk["content"]), purpose="assistants"
+    )
+
+
+# Upload the queued chunks as in-memory files, recording each in the manifest
+if pending_chunks:
+    print(
+        f"\nUploading {len(pending_chunks)} new or changed chunks ({MAX_IN_FLIGHT} requests in flight)..."
+    )
+try:
+    for chunk, uploaded_file, error in engine.map(
+        upload_chunk,
+        pending_chunks,
+        "Upload",
+        size=lambda chunk: len(chunk["content"]),
+    ):
+        if error:
             file_upload_failed_count += 1
-            print(f"Error processing and uploading chunks for '{filename}': {e}")
+            # Keep the file's previous chunks until it uploads completely
+            failed_files.add(chunk["file"])
+            print(f"  Error uploading chunk '{chunk['chunk_filename']}': {error}")
+            continue
+        file_upload_success_count += 1
+        manifest.record(
+            chunk["file"],
+            chunk["index"],
+            chunk["hash"],
+            uploaded_file.id,
+            chunk["chunk_filename"],
+        )
+        # Persist progress so an interrupted run does not re-upload
+        if file_upload_success_count % 50 == 0:
+            manifest.save()
+finally:
+    manifest.save()
+
+# Chunks of deleted files, or beyond the end of a shortened file, are obsolete
+manifest.remove_stale(current_chunk_keys, failed_files)
+manifest.save()
 
 
 # Display summary of chunking and upload process
@@ -145,8 +307,21 @@ print(
     f"Total markdown files processed: {len([f for f in os.listdir(MARKDOWN_FILES_DIRECTORY) if f.endswith('.md')])}"
 )
 print(f"Total chunks created: {total_chunks_created}")
+print("Chunk sizes in characters:")
+if chunk_packer:
+    print(f"  Before packing: {format_size_stats(size_stats(section_sizes))}")
+    print(f"  After packing:  {format_size_stats(size_stats(chunk_sizes))}")
+else:
+    print(f"  {format_size_stats(size_stats(chunk_sizes))}")
+print(f"Unchanged chunks (already uploaded): {unchanged_chunk_count}")
 print(f"Successfully uploaded file chunks: {file_upload_success_count}")
+print(f"Obsolete chunks to remove: {len(manifest.pending_deletes)}")
 print(f"Failed uploads: {file_upload_failed_count}")
+if "Upload" in engine.stats:
+    upload_stats = engine.stats["Upload"]
+    print(
+        f"Upload time: {upload_stats['seconds']}s ({upload_stats['per_second']} chunks/s, {upload_stats['retries']} retries)"
+    )
 
 
 # --- 2. Create/Retrieve a Vector Store ---
@@ -204,84 +379,246 @@ if not VECTOR_STORE_ID:
         exit()
 
 # --- 3. Add Uploaded Files (Chunks) to the Vector Store ---
-# Associate all uploaded file chunks with the vector store
-vector_store_file_objects = []
-if uploaded_file_ids and VECTOR_STORE_ID:
+# Attach the uploaded file chunks not yet attached, including those of an
+# earlier run that stopped before attaching, in file batches and wait for
+# each batch to finish processing. When the manifest was built against
+# another store, every recorded chunk is attached.
+if VECTOR_STORE_ID and manifest.vector_store_id != VECTOR_STORE_ID:
+    manifest.reset_attached()
+    manifest.vector_store_id = VECTOR_STORE_ID
+    manifest.save()
+attach_file_ids = manifest.unattached_file_ids() if VECTOR_STORE_ID else []
+attached_count = 0
+# File id -> last processing error, for files that never attached
+attach_failures = {}
+
+
+def create_file_batch(file_ids):
+    return engine_client.vector_stores.file_batches.create(
+        vector_store_id=VECTOR_STORE_ID, file_ids=file_ids
+    )
+
+
+def retrieve_file_batch(batch_id):
+    return engine_client.vector_stores.file_batches.retrieve(
+        batch_id, vector_store_id=VECTOR_STORE_ID
+    )
+
+
+def list_unsuccessful_batch_files(batch):
+    unsuccessful = []
+    for status in ("failed", "cancelled"):
+        if getattr(batch.file_counts, status):
+            unsuccessful += engine_client.vector_stores.file_batches.list_files(
+                batch.id, vector_store_id=VECTOR_STORE_ID, filter=status, limit=100
+            )
+    return unsuccessful
+
+
+def detach_file(file_id):
+    try:
+        engine_client.vector_stores.files.delete(
+            file_id, vector_store_id=VECTOR_STORE_ID
+        )
+    except NotFoundError:
+        pass  # Never attached
+
+
+if attach_file_ids and VECTOR_STORE_ID:
     print(
-        f"\n--- Adding {len(uploaded_file_ids)} file chunks to Vector Store '{VECTOR_STORE_ID}' ---"
+        f"\n--- Adding {len(attach_file_ids)} file chunks to Vector Store '{VECTOR_STORE_ID}' in batches of up to {ATTACH_BATCH_SIZE} ---"
     )
-    for file_id in uploaded_file_ids:
-        try:
-            print(f"Adding file_id '{file_id}' to vector store...")
-            vector_store_file = client.vector_stores.files.create(
-                vector_store_id=VECTOR_STORE_ID, file_id=file_id
+    submit_file_ids = list(attach_file_ids)
+    for attempt in range(ATTACH_RETRIES + 1):
+        if attempt:
+            print(
+                f"\nResubmitting {len(submit_file_ids)} file chunks (attempt {attempt + 1}/{ATTACH_RETRIES + 1})..."
             )
-            vector_store_file_objects.append(vector_store_file)
+            # Detach failed files first so they are processed afresh
+            for file_id, _, error in engine.map(
+                detach_file, submit_file_ids, "Detach", progress=False
+            ):
+                if error:
+                    print(f"Error detaching file_id '{file_id}': {error}")
+
+        # Submit the file ids in batches
+        batch_file_ids = {}
+        unsubmitted_file_ids = []
+        for file_ids, batch, error in engine.map(
+            create_file_batch,
+            [
+                submit_file_ids[i : i + ATTACH_BATCH_SIZE]
+                for i in range(0, len(submit_file_ids), ATTACH_BATCH_SIZE)
+            ],
+            "Submit batches",
+            progress=False,
+        ):
+            if error:
+                print(f"Error creating a file batch of {len(file_ids)} files: {error}")
+                unsubmitted_file_ids += file_ids
+            else:
+                batch_file_ids[batch.id] = file_ids
+        print(f"Submitted {len(batch_file_ids)} file batches.")
+
+        # Poll each batch's own status until it is no longer in progress
+        pending_batches = set(batch_file_ids)
+        finished_batches = []
+        deadline = time.time() + ATTACH_TIMEOUT
+        poll = 0
+        while pending_batches:
+            poll += 1
+            in_progress_batches = []
+            for batch_id, batch, error in engine.map(
+                retrieve_file_batch, sorted(pending_batches), "Poll", progress=False
+            ):
+                if error:
+                    print(f"Error polling file batch '{batch_id}': {error}")
+                    continue
+                if batch.status == "in_progress":
+                    in_progress_batches.append(batch)
+                else:
+                    finished_batches.append(batch)
+                    pending_batches.discard(batch_id)
+            counts = [b.file_counts for b in finished_batches + in_progress_batches]
             print(
-                f"Successfully initiated add for file_id '{file_id}'. Status: {vector_store_file.status}"
+                f"  Poll {poll}: Batches done={len(finished_batches)}/{len(batch_file_ids)}, "
+                f"Completed={sum(c.completed for c in counts)}, Failed={sum(c.failed for c in counts)}, "
+                f"In Progress={sum(c.in_progress for c in counts)}"
             )
-        except Exception as e:
-            print(f"Error adding file_id '{file_id}' to vector store: {e}")
+            if not pending_batches:
+                break
+            if time.time() >= deadline:
+                print(
+                    f"\nWarning: {len(pending_batches)} file batches still processing after {ATTACH_TIMEOUT}s; not waiting for them."
+                )
+                break
+            time.sleep(ATTACH_POLL_INTERVAL)
+
+        # Collect the files of finished batches that failed processing
+        failed_file_ids = []
+        attached_file_ids = []
+        for batch in finished_batches:
+            if not batch.file_counts.failed + batch.file_counts.cancelled:
+                attached_file_ids += batch_file_ids[batch.id]
+        for batch, failed_files_in_batch, error in engine.map(
+            list_unsuccessful_batch_files,
+            [
+                b
+                for b in finished_batches
+                if b.file_counts.failed + b.file_counts.cancelled
+            ],
+            "List failures",
+            progress=False,
+        ):
+            if error:
+                # Left unattached in the manifest; attached again next run
+                print(f"Error listing failed files of batch '{batch.id}': {error}")
+                continue
+            batch_failed_ids = {f.id for f in failed_files_in_batch}
+            attached_file_ids += [
+                file_id
+                for file_id in batch_file_ids[batch.id]
+                if file_id not in batch_failed_ids
+            ]
+            for vector_store_file in failed_files_in_batch:
+                error_message = (
+                    vector_store_file.last_error.message
+                    if vector_store_file.last_error
+                    else vector_store_file.status
+                )
+                print(f"  File '{vector_store_file.id}' failed: {error_message}")
+                attach_failures[vector_store_file.id] = error_message
+                failed_file_ids.append(vector_store_file.id)
+
+        # Attached files' replaced versions become deletable
+        attached_count += len(attached_file_ids)
+        manifest.mark_attached(attached_file_ids)
+        manifest.save()
+
+        submit_file_ids = failed_file_ids + unsubmitted_file_ids
+        for file_id in unsubmitted_file_ids:
+            attach_failures.setdefault(file_id, "file batch could not be created")
+        for file_id in set(attach_failures) - set(submit_file_ids):
+            del attach_failures[file_id]  # Attached on resubmission
+        if not submit_file_ids:
+            break
+
+    # Delete files that never attached and upload their chunks again next run
+    for file_id, error_message in attach_failures.items():
+        print(f"Giving up on file_id '{file_id}': {error_message}")
+        manifest.forget_file_id(file_id)
+    print(
+        f"Attached {attached_count} of {len(attach_file_ids)} file chunks; {len(attach_failures)} failed."
+    )
+    manifest.save()
 else:
     print(
         "No new file chunks to add to the vector store or VECTOR_STORE_ID is missing. Skipping file addition."
     )
 
 
-# --- 4. Poll Vector Store Status for File Processing ---
-# Monitor the vector store until all files are processed
-if uploaded_file_ids and VECTOR_STORE_ID:
-    print(f"\n--- Polling Vector Store for file processing status ---")
-    retries = 0
-    max_retries = 60  # Poll for up to 5 minutes (60 * 5 seconds)
-    poll_interval_seconds = 5
+# --- 4. Remove Obsolete Chunks ---
+# Detach and delete the file ids queued in the manifest: removed chunks, and
+# superseded ones whose replacements are attached, so the store never lacks
+# an article. Ids that fail stay queued for the next run.
+if PRUNE_UNMANAGED and VECTOR_STORE_ID:
+    # Store files unknown to the manifest, e.g. from runs before it existed
+    managed_file_ids = set(manifest.file_ids()) | set(manifest.pending_deletes)
+    try:
+        for vector_store_file in client.vector_stores.files.list(
+            vector_store_id=VECTOR_STORE_ID, limit=100
+        ):
+            if vector_store_file.id not in managed_file_ids:
+                manifest.pending_deletes.append(vector_store_file.id)
+    except Exception as e:
+        print(f"Error listing vector store files for pruning: {e}")
 
-    # Keep checking until all files are processed or timeout
-    while retries < max_retries:
-        try:
-            current_vector_store = client.vector_stores.retrieve(VECTOR_STORE_ID)
-            file_counts = current_vector_store.file_counts
 
-            print(
-                f"  Poll {retries+1}/{max_retries}: Total={file_counts.total}, Completed={file_counts.completed}, Failed={file_counts.failed}, Pending={file_counts.pending}, In Progress={file_counts.in_progress}"
+def remove_file(file_id):
+    if VECTOR_STORE_ID:
+        try:
+            engine_client.vector_stores.files.delete(
+                file_id, vector_store_id=VECTOR_STORE_ID
             )
+        except NotFoundError:
+            pass  # Already detached
+    try:
+        engine_client.files.delete(file_id)
+    except NotFoundError:
+        pass  # Already deleted
 
-            # Break when no files are pending or in progress
-            if file_counts.pending == 0 and file_counts.in_progress == 0:
-                print(
-                    "\nAll file chunks seem to have finished processing in the vector store."
-                )
-                break
-
-        except Exception as e:
-            print(f"Error while polling vector store status: {e}")
-            break  # Exit loop on error
-
-        time.sleep(poll_interval_seconds)
-        retries += 1
 
-    # Display timeout warning if needed
-    if retries == max_retries:
-        print(
-            "\nWarning: Polling timed out. Some file chunks might still be processing."
-        )
-
-    # Show final processing statistics
+obsolete_file_ids = list(dict.fromkeys(manifest.pending_deletes))
+if obsolete_file_ids:
+    print(f"\n--- Removing {len(obsolete_file_ids)} obsolete file chunks ---")
+    removed_count = 0
+    try:
+        for file_id, _, error in engine.map(remove_file, obsolete_file_ids, "Remove"):
+            if error:
+                print(f"Error removing obsolete file_id '{file_id}': {error}")
+            else:
+                manifest.deleted(file_id)
+                removed_count += 1
+    finally:
+        manifest.save()
+    print(f"Removed {removed_count} of {len(obsolete_file_ids)} obsolete file chunks.")
+
+
+# --- 5. Vector Store Summary ---
+# Show the processing state of the whole store
+if VECTOR_STORE_ID:
     print(f"\n--- Final Vector Store File Processing Summary ---")
-    final_vector_store = client.vector_stores.retrieve(VECTOR_STORE_ID)
-    final_file_counts = final_vector_store.file_counts
-    print(f"  Total files in store: {final_file_counts.total}")
-    print(f"  Files completed processing: {final_file_counts.completed}")
-    print(f"  Files failed processing: {final_file_counts.failed}")
-    print(f"  Files in progress: {final_file_counts.in_progress}")
-
-    if final_file_counts.failed > 0:
-        print(
-            "\nNote: Some files failed processing. Please check the OpenAI UI for details."
-        )
+    try:
+        final_file_counts = client.vector_stores.retrieve(VECTOR_STORE_ID).file_counts
+        print(f"  Total files in store: {final_file_counts.total}")
+        print(f"  Files completed processing: {final_file_counts.completed}")
+        print(f"  Files failed processing: {final_file_counts.failed}")
+        print(f"  Files in progress: {final_file_counts.in_progress}")
+    except Exception as e:
+        print(f"Error retrieving vector store status: {e}")
 
 
-# --- 5. Update Your Assistant to Use the Vector Store ---
+# --- 6. Update Your Assistant to Use the Vector Store ---
 # Connect the vector store to the OpenAI assistant for Q&A functionality
 print(
     f"\n--- Updating Assistant '{ASSISTANT_ID}' to use Vector Store '{VECTOR_STORE_ID}' ---"
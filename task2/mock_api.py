@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the parts of the OpenAI API used by main.py: files,
+vector stores, vector store files and file batches, and assistant updates.
+Lets uploads be exercised and timed without an OpenAI account.
+
+Usage:
+    python mock_api.py --port 8100 --latency 0.05 --rate-limit-every 50
+    python main.py --base-url http://127.0.0.1:8100/v1 --api-key test --assistant-id asst_test --folder data
+"""
+
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockOpenAI:
+    """In-memory OpenAI API served from a background thread."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        rate_limit_every: int = 0,
+        fail_every: int = 0,
+        processing_delay: float = 0.2,
+    ):
+        # Seconds every request is delayed by
+        self.latency = latency
+        # Answer every Nth request with 429 and Retry-After: 1
+        self.rate_limit_every = rate_limit_every
+        # Every Nth file attached to a vector store fails processing
+        self.fail_every = fail_every
+        # Seconds an attached file stays "in_progress"
+        self.processing_delay = processing_delay
+
+        self.files = {}
+        self.vector_stores = {}
+        self.store_files = {}  # vector store id -> {file id: vector store file}
+        self.batches = {}
+        self.assistants = {}
+        self.requests = {}  # "METHOD /path/pattern" -> count
+        self.attached = 0
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockOpenAI":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._thread is not None:
+            self._server.shutdown()
+        self._server.server_close()
+
+    def _new_id(self, prefix: str) -> str:
+        return f"{prefix}{next(self._counter):06d}"
+
+    # Objects
+
+    def _file_counts(self, files: list[dict]) -> dict:
+        counts = {"in_progress": 0, "completed": 0, "failed": 0, "cancelled": 0}
+        for store_file in files:
+            counts[self._refresh(store_file)["status"]] += 1
+        return {**counts, "total": len(files)}
+
+    def _refresh(self, store_file: dict) -> dict:
+        """Finish processing of attached files once their delay has passed."""
+        if (
+            store_file["status"] == "in_progress"
+            and time.time() >= store_file["_ready_at"]
+        ):
+            store_file["status"] = "failed" if store_file["_fails"] else "completed"
+            if store_file["_fails"]:
+                store_file["last_error"] = {
+                    "code": "server_error",
+                    "message": "Simulated processing failure",
+                }
+        return store_file
+
+    def _public(self, obj: dict) -> dict:
+        return {k: v for k, v in obj.items() if not k.startswith("_")}
+
+    def _vector_store(self, store_id: str) -> dict:
+        store = self.vector_stores[store_id]
+        return {
+            **store,
+            "file_counts": self._file_counts(list(self.store_files[store_id].values())),
+        }
+
+    def _attach(self, store_id: str, file_id: str, batch_id: str = None) -> dict:
+        self.attached += 1
+        store_file = {
+            "id": file_id,
+            "object": "vector_store.file",
+            "usage_bytes": self.files[file_id]["bytes"],
+            "created_at": int(time.time()),
+            "vector_store_id": store_id,
+            "status": "in_progress",
+            "last_error": None,
+            "_ready_at": time.time() + self.processing_delay,
+            "_fails": bool(self.fail_every) and self.attached % self.fail_every == 0,
+            "_batch_id": batch_id,
+        }
+        self.store_files[store_id][file_id] = store_file
+        return store_file
+
+    def _batch(self, batch: dict) -> dict:
+        files = [
+            self.store_files[batch["vector_store_id"]][file_id]
+            for file_id in batch["_file_ids"]
+            if file_id in self.store_files[batch["vector_store_id"]]
+        ]
+        counts = self._file_counts(files)
+        status = "in_progress" if counts["in_progress"] else "completed"
+        return {**self._public(batch), "status": status, "file_counts": counts}
+
+    @staticmethod
+    def _page(items: list[dict], query: dict) -> dict:
+        limit = int(query.get("limit", ["20"])[0])
+        after = query.get("after", [None])[0]
+        if after:
+            ids = [item["id"] for item in items]
+            items = items[ids.index(after) + 1 :] if after in ids else []
+        page = items[:limit]
+        return {
+            "object": "list",
+            "data": page,
+            "first_id": page[0]["id"] if page else None,
+            "last_id": page[-1]["id"] if page else None,
+            "has_more": len(items) > limit,
+        }
+
+    # Routing
+
+    def handle(self, method: str, path: str, query: dict, body) -> tuple[int, dict]:
+        parts = path.strip("/").split("/")[1:]  # drop "v1"
+        now = int(time.time())
+
+        if parts == ["files"] and method == "POST":
+            filename, content = body
+            file_id = self._new_id("file-")
+            self.files[file_id] = {
+                "id": file_id,
+                "object": "file",
+                "bytes": len(content),
+                "created_at": now,
+                "filename": filename,
+                "purpose": "assistants",
+                "status": "processed",
+                "_content": content,
+            }
+            return 200, self._public(self.files[file_id])
+        if len(parts) == 2 and parts[0] == "files" and method == "DELETE":
+            if self.files.pop(parts[1], None) is None:
+                return 404, _error(f"No such File object: {parts[1]}")
+            return 200, {"id": parts[1], "object": "file", "deleted": True}
+
+        if parts == ["vector_stores"] and method == "GET":
+            return 200, self._page(
+                [self._vector_store(store_id) for store_id in self.vector_stores],
+                query,
+            )
+        if parts == ["vector_stores"] and method == "POST":
+            store_id = self._new_id("vs_")
+            self.vector_stores[store_id] = {
+                "id": store_id,
+                "object": "vector_store",
+                "created_at": now,
+                "name": body.get("name"),
+                "usage_bytes": 0,
+                "status": "completed",
+                "last_active_at": now,
+                "metadata": {},
+            }
+            self.store_files[store_id] = {}
+            return 200, self._vector_store(store_id)
+
+        if parts and parts[0] == "vector_stores" and len(parts) >= 2:
+            store_id = parts[1]
+            if store_id not in self.vector_stores:
+                return 404, _error(f"No vector store found with id '{store_id}'.")
+            if len(parts) == 2 and method == "GET":
+                return 200, self._vector_store(store_id)
+            files = self.store_files[store_id]
+
+            if parts[2:] == ["files"] and method == "POST":
+                if body["file_id"] not in self.files:
+                    return 404, _error(f"No file found with id '{body['file_id']}'.")
+                return 200, self._public(self._attach(store_id, body["file_id"]))
+            if parts[2:] == ["files"] and method == "GET":
+                items = [self._public(self._refresh(f)) for f in files.values()]
+                return 200, self._page(items, query)
+            if len(parts) == 4 and parts[2] == "files" and method == "DELETE":
+                if files.pop(parts[3], None) is None:
+                    return 404, _error(f"No file found with id '{parts[3]}'.")
+                return 200, {
+                    "id": parts[3],
+                    "object": "vector_store.file.deleted",
+                    "deleted": True,
+                }
+
+            if parts[2:] == ["file_batches"] and method == "POST":
+                missing = [f for f in body["file_ids"] if f not in self.files]
+                if missing:
+                    return 404, _error(f"No file found with id '{missing[0]}'.")
+                batch_id = self._new_id("vsfb_")
+                for file_id in body["file_ids"]:
+                    self._attach(store_id, file_id, batch_id)
+                self.batches[batch_id] = {
+                    "id": batch_id,
+                    "object": "vector_store.files_batch",
+                    "created_at": now,
+                    "vector_store_id": store_id,
+                    "_file_ids": list(body["file_ids"]),
+                }
+                return 200, self._batch(self.batches[batch_id])
+            if len(parts) >= 4 and parts[2] == "file_batches":
+                batch = self.batches.get(parts[3])
+                if batch is None or batch["vector_store_id"] != store_id:
+                    return 404, _error(f"No batch found with id '{parts[3]}'.")
+                if len(parts) == 4 and method == "GET":
+                    return 200, self._batch(batch)
+                if parts[4:] == ["files"] and method == "GET":
+                    wanted = query.get("filter", [None])[0]
+                    items = [
+                        self._public(self._refresh(files[file_id]))
+                        for file_id in batch["_file_ids"]
+                        if file_id in files
+                    ]
+                    if wanted:
+                        items = [f for f in items if f["status"] == wanted]
+                    return 200, self._page(items, query)
+
+        if len(parts) == 2 and parts[0] == "assistants" and method == "POST":
+            assistant = self.assistants.setdefault(
+                parts[1],
+                {
+                    "id": parts[1],
+                    "object": "assistant",
+                    "created_at": now,
+                    "name": "Mock Assistant",
+                    "description": None,
+                    "model": "gpt-4o",
+                    "instructions": None,
+                    "tools": [{"type": "file_search"}],
+                    "metadata": {},
+                },
+            )
+            assistant["tool_resources"] = body.get("tool_resources", {})
+            return 200, assistant
+
+        return 404, _error(f"Unknown route {method} {path}")
+
+    def count_request(self, method: str, path: str) -> bool:
+        """
+        Count a request by route and decide whether to rate-limit it.
+        """
+        # Object ids ("file-000001", "vs_000002", "asst_1") collapse to {id}
+        route = "/".join(
+            "{id}" if part != "v1" and any(c.isdigit() for c in part) else part
+            for part in path.strip("/").split("/")
+        )
+        with self._lock:
+            key = f"{method} /{route}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+            total = sum(self.requests.values())
+            return bool(self.rate_limit_every) and total % self.rate_limit_every == 0
+
+    def _make_handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, payload: dict, headers: dict = None):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _body(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length) if length else b""
+                content_type = self.headers.get("Content-Type", "")
+                if content_type.startswith("multipart/form-data"):
+                    return _parse_upload(raw, content_type)
+                return json.loads(raw) if raw else {}
+
+            def _dispatch(self, method: str):
+                parsed = urlparse(self.path)
+                body = self._body() if method == "POST" else None
+                if api.latency:
+                    time.sleep(api.latency)
+                if api.count_request(method, parsed.path):
+                    self._send(
+                        429,
+                        _error("Rate limit reached", "rate_limit_exceeded"),
+                        {"Retry-After": "1"},
+                    )
+                    return
+                with api._lock:
+                    status, payload = api.handle(
+                        method, parsed.path, parse_qs(parsed.query), body
+                    )
+                self._send(status, payload)
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def do_DELETE(self):
+                self._dispatch("DELETE")
+
+        return Handler
+
+
+def _error(message: str, code: str = None) -> dict:
+    return {
+        "error": {
+            "message": message,
+            "type": "invalid_request_error",
+            "param": None,
+            "code": code,
+        }
+    }
+
+
+def _parse_upload(raw: bytes, content_type: str) -> tuple[str, bytes]:
+    """
+    Extract the uploaded file name and content from a multipart body.
+    """
+    boundary = content_type.split("boundary=", 1)[1].strip('"').encode("latin-1")
+    for part in raw.split(b"--" + boundary):
+        head, _, content = part.partition(b"\r\n\r\n")
+        if b'name="file"' in head:
+            filename = head.split(b'filename="', 1)[1].split(b'"', 1)[0]
+            return filename.decode("utf-8"), content.removesuffix(b"\r\n")
+    return "", b""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local mock OpenAI API.")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Delay every request (seconds)."
+    )
+    parser.add_argument(
+        "--rate-limit-every",
+        type=int,
+        default=0,
+        help="Answer every Nth request with 429 Too Many Requests.",
+    )
+    parser.add_argument(
+        "--fail-every",
+        type=int,
+        default=0,
+        help="Make every Nth attached file fail processing.",
+    )
+    parser.add_argument(
+        "--processing-delay",
+        type=float,
+        default=0.2,
+        help="Seconds attached files stay in progress.",
+    )
+    args = parser.parse_args()
+
+    api = MockOpenAI(
+        port=args.port,
+        latency=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        fail_every=args.fail_every,
+        processing_delay=args.processing_delay,
+    )
+    print(f"Serving mock OpenAI API at {api.base_url} (Ctrl+C to stop)")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
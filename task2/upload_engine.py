@@ -0,0 +1,133 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from openai import APIConnectionError, InternalServerError, RateLimitError
+
+# Errors worth another attempt: rate limits, 5xx responses, timeouts and
+# dropped connections (APITimeoutError is an APIConnectionError)
+RETRYABLE_ERRORS = (RateLimitError, InternalServerError, APIConnectionError)
+
+
+class UploadEngine:
+    """
+    Runs API calls on a thread pool with a bounded number of requests in
+    flight, retrying rate limits and transient errors with exponential
+    backoff, and reports progress and throughput per stage.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 8,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        progress_interval: float = 2.0,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.progress_interval = progress_interval
+        # Stage label -> count, failed, retries, bytes, seconds, per_second
+        self.stats = {}
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """
+        Seconds to wait before the next attempt: jittered exponential backoff,
+        but never less than a Retry-After the server asked for.
+        """
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        delay = random.uniform(delay / 2, delay)
+        response = getattr(error, "response", None)
+        if response is not None:
+            try:
+                delay = max(delay, float(response.headers.get("retry-after")))
+            except (TypeError, ValueError):
+                pass
+        return delay
+
+    def call(self, func, *args, **kwargs):
+        """
+        Call func, retrying retryable errors up to max_retries times.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    raise
+                with self._lock:
+                    self._retries += 1
+                time.sleep(self._backoff(attempt, e))
+
+    def map(self, func, items: list, label: str, size=None, progress: bool = True):
+        """
+        Run func(item) for every item concurrently.
+
+        Args:
+            func: Function making one API request
+            items: Arguments, one per call
+            label: Stage name used in progress lines and stats
+            size: Optional function giving an item's size in bytes, for
+                throughput reporting
+            progress: Whether to print progress lines
+
+        Yields:
+            tuple: (item, result, error) in completion order; error is None on
+                success
+        """
+        total = len(items)
+        done = failed = transferred = 0
+        retries_before = self._retries
+        started = last_report = time.perf_counter()
+
+        def report(now: float):
+            elapsed = max(now - started, 1e-9)
+            line = f"  {label}: {done}/{total} done ({done / elapsed:.1f}/s"
+            if size:
+                line += f", {transferred / elapsed / 1024:.1f} KiB/s"
+            print(f"{line}), {failed} failed, {self._retries - retries_before} retries")
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            futures = {pool.submit(self.call, func, item): item for item in items}
+            try:
+                for future in as_completed(futures):
+                    item = futures[future]
+                    try:
+                        result, error = future.result(), None
+                        if size:
+                            transferred += size(item)
+                    except Exception as e:
+                        result, error = None, e
+                        failed += 1
+                    done += 1
+
+                    now = time.perf_counter()
+                    if (
+                        progress
+                        and now - last_report >= self.progress_interval
+                        and done < total
+                    ):
+                        report(now)
+                        last_report = now
+                    yield item, result, error
+            finally:
+                # Stop queued calls if the caller gives up early
+                for future in futures:
+                    future.cancel()
+
+        elapsed = time.perf_counter() - started
+        if progress and total:
+            report(time.perf_counter())
+        self.stats[label] = {
+            "count": done,
+            "failed": failed,
+            "retries": self._retries - retries_before,
+            "bytes": transferred,
+            "seconds": round(elapsed, 3),
+            "per_second": round(done / elapsed, 2) if elapsed else None,
+        }
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import tempfile
+
+
+def chunk_hash(content: str) -> str:
+    """Content hash identifying an uploaded chunk version."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class UploadManifest:
+    """
+    Local record of what is already in the vector store.
+
+    Maps (markdown file, chunk index) to the hash of the chunk content, the
+    OpenAI file id it was uploaded as and whether that file is attached to the
+    vector store, so a run only uploads new or changed chunks. File ids that
+    are superseded or removed wait in ``pending_deletes`` until deleted, and a
+    superseded id only moves there once its replacement is attached; an
+    interrupted run therefore leaves nothing untracked.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.vector_store_id = None
+        self.chunks = {}
+        self.pending_deletes = []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.vector_store_id = data.get("vector_store_id")
+            self.chunks = data.get("chunks", {})
+            self.pending_deletes = data.get("pending_deletes", [])
+
+    @staticmethod
+    def key(filename: str, index: int) -> str:
+        return f"{filename}#{index}"
+
+    def is_current(self, filename: str, index: int, digest: str) -> bool:
+        """Whether this exact chunk is already uploaded."""
+        entry = self.chunks.get(self.key(filename, index))
+        return entry is not None and entry["hash"] == digest
+
+    def record(
+        self, filename: str, index: int, digest: str, file_id: str, chunk_filename: str
+    ):
+        """
+        Record an uploaded, not yet attached chunk. The version it supersedes
+        is deleted once this one is attached.
+        """
+        key = self.key(filename, index)
+        previous = self.chunks.get(key)
+        replaces = []
+        if previous:
+            replaces = previous.get("replaces", [])
+            if previous.get("attached", True):
+                replaces = replaces + [previous["file_id"]]
+            else:
+                # Never attached, so nothing depends on it
+                self.pending_deletes.append(previous["file_id"])
+        self.chunks[key] = {
+            "file": filename,
+            "index": index,
+            "hash": digest,
+            "file_id": file_id,
+            "chunk_filename": chunk_filename,
+            "attached": False,
+            "replaces": replaces,
+        }
+
+    def mark_attached(self, file_ids):
+        """Record attached file ids and queue the versions they replace for deletion."""
+        file_ids = set(file_ids)
+        for entry in self.chunks.values():
+            if entry["file_id"] in file_ids:
+                entry["attached"] = True
+                self.pending_deletes += entry.pop("replaces", [])
+
+    def reset_attached(self):
+        """Mark every chunk unattached, e.g. when the vector store changed."""
+        for entry in self.chunks.values():
+            entry["attached"] = False
+
+    def unattached_file_ids(self) -> list[str]:
+        return [
+            entry["file_id"]
+            for entry in self.chunks.values()
+            if not entry.get("attached", True)
+        ]
+
+    def forget_file_id(self, file_id: str):
+        """
+        Drop the entry of a file id and queue it for deletion, so its chunk is
+        uploaded again next run. The attached version it was to replace stays
+        until the new upload is attached.
+        """
+        for key, entry in list(self.chunks.items()):
+            if entry["file_id"] == file_id:
+                del self.chunks[key]
+                self.pending_deletes.append(file_id)
+                if entry.get("replaces"):
+                    # Restore the newest attached version as the current entry
+                    *older, newest = entry["replaces"]
+                    self.chunks[key] = {
+                        **entry,
+                        "hash": None,
+                        "file_id": newest,
+                        "attached": True,
+                        "replaces": older,
+                    }
+                    self.pending_deletes += older
+
+    def deleted(self, file_id: str):
+        """Record that a pending file id was deleted."""
+        self.pending_deletes = [f for f in self.pending_deletes if f != file_id]
+
+    def remove_stale(self, current_keys: set[str], keep_files: set[str]) -> list[str]:
+        """
+        Drop chunks whose source file or chunk index no longer exists and queue
+        their file ids for deletion.
+
+        Args:
+            current_keys: Keys of every chunk produced in this run
+            keep_files: Source files that could not be read this run; their
+                chunks are kept untouched
+
+        Returns:
+            list[str]: File ids of the dropped chunks
+        """
+        removed = []
+        for key, entry in list(self.chunks.items()):
+            if key not in current_keys and entry["file"] not in keep_files:
+                removed += [entry["file_id"]] + entry.get("replaces", [])
+                del self.chunks[key]
+        self.pending_deletes += removed
+        return removed
+
+    def file_ids(self) -> list[str]:
+        """Every tracked file id, including versions awaiting replacement."""
+        return [
+            file_id
+            for entry in self.chunks.values()
+            for file_id in [entry["file_id"]] + entry.get("replaces", [])
+        ]
+
+    def save(self):
+        """Write the manifest atomically."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "vector_store_id": self.vector_store_id,
+                        "chunks": self.chunks,
+                        "pending_deletes": self.pending_deletes,
+                    },
+                    f,
+                    indent=2,
+                    ensure_ascii=False,
+                )
+            os.replace(temp_path, self.path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise